@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Performance benchmarks of totemp, run with ``python -m benchmarks``.
+
+``python -m benchmarks run -o results.json`` measures the latency of every
+method and the throughput and peak memory of the batch conversions, and
+``python -m benchmarks compare baseline.json results.json`` flags the
+regressions between two runs. ``python -m benchmarks loadtest`` reports the
+requests per second and the p99 latency of the conversion server.
+"""
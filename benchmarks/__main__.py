@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import sys
+from typing import Sequence
+
+from .loadtest import load_test, local_server
+from .suite import SIZES, compare, run
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the command-line arguments"""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description='Benchmarks of totemp.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument(
+        '-o', '--output', help='JSON file to write the results into'
+    )
+    run_parser.add_argument(
+        '--max-size',
+        type=int,
+        default=10**7,
+        help='biggest batch to measure (default: 10**7, up to 10**8)',
+    )
+    run_parser.add_argument(
+        '--repeat', type=int, default=3, help='repetitions of every measure'
+    )
+
+    compare_parser = commands.add_parser(
+        'compare', help='flag the regressions between two runs'
+    )
+    compare_parser.add_argument('baseline', help='JSON results of reference')
+    compare_parser.add_argument('current', help='JSON results to check')
+    compare_parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='how much slower is still fine (default: 0.1, i.e. 10%%)',
+    )
+
+    load_parser = commands.add_parser(
+        'loadtest', help='load test the conversion server (totemp.server)'
+    )
+    load_parser.add_argument(
+        '--url',
+        help='server to test, e.g. http://127.0.0.1:8000 (default: one '
+        'started on localhost)',
+    )
+    load_parser.add_argument(
+        '-n',
+        '--requests',
+        type=int,
+        default=10_000,
+        help='requests to send (default: 10000)',
+    )
+    load_parser.add_argument(
+        '-c',
+        '--connections',
+        type=int,
+        default=4,
+        help='persistent connections sending them at once (default: 4)',
+    )
+    load_parser.add_argument(
+        '--batch',
+        type=int,
+        default=0,
+        help='values per batch request, 0 for single values (default: 0)',
+    )
+    load_parser.add_argument(
+        '--binary',
+        action='store_true',
+        help='send packed float64 batches instead of JSON',
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Runs the benchmarks, compares two runs or load tests the server.
+
+    :param argv: Optional, arguments to parse, sys.argv[1:] if None
+    :return: int, 1 if compare found regressions or loadtest errors, 0
+        otherwise
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'run':
+        sizes = [size for size in SIZES if size <= args.max_size]
+        results = run(sizes, repeat=args.repeat)
+        text = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, 'w') as file:
+                file.write(text + '\n')
+        else:
+            print(text)
+        return 0
+
+    if args.command == 'loadtest':
+        options = {
+            'requests': args.requests,
+            'connections': args.connections,
+            'batch': args.batch,
+            'binary': args.binary,
+        }
+        if args.url:
+            results = load_test(args.url, **options)
+        else:
+            with local_server() as url:
+                results = load_test(url, **options)
+        print(
+            f'{results["requests"]} requests in {results["seconds"]:.2f}s: '
+            f'{results["requests_per_second"]:.0f} requests/s, '
+            f'{results["values_per_second"]:.0f} values/s, '
+            f'p50 {results["p50"] * 1e3:.3f}ms, '
+            f'p99 {results["p99"] * 1e3:.3f}ms, '
+            f'{results["errors"]} error(s)'
+        )
+        return 1 if results['errors'] else 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    comparisons = compare(baseline, current, tolerance=args.tolerance)
+    for comparison in comparisons:
+        print(
+            f'{"REGRESSION" if comparison["regression"] else "ok":<12}'
+            f'{comparison["ratio"]:>8.3f}x  {comparison["name"]}'
+        )
+    regressions = sum(comparison['regression'] for comparison in comparisons)
+    print(f'{regressions} regression(s) in {len(comparisons)} benchmarks')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import http.client
+import json
+import math
+import random
+import struct
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+
+@contextmanager
+def local_server() -> Iterator[str]:
+    """Runs the conversion server in another process, on a free port"""
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'totemp.server', '--port', '0', '--quiet'],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert process.stdout is not None
+        line = process.stdout.readline()  # Serving on http://host:port
+        if not line.startswith('Serving on '):
+            raise RuntimeError('The server did not start')
+        yield line.split()[-1]
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _request(batch: int, binary: bool) -> tuple[str, str, Any, dict]:
+    """Builds the request sent again and again by every connection"""
+    generator = random.Random(batch)
+    values = [round(generator.uniform(-50, 50), 2) for _ in range(batch)]
+    if not batch:
+        return 'GET', '/convert?value=41.985&source=C&target=F', None, {}
+    path = '/convert/batch?source=C&target=F'
+    if binary:
+        body: Any = struct.pack(f'<{batch}d', *values)
+        content_type = 'application/octet-stream'
+    else:
+        body = json.dumps(values)
+        content_type = 'application/json'
+    return 'POST', path, body, {'Content-Type': content_type}
+
+
+def _percentile(latencies: list[float], percent: float) -> float:
+    """Gets a percentile of sorted latencies, by the nearest rank"""
+    index = max(0, int(len(latencies) * percent / 100 + 0.5) - 1)
+    return latencies[min(index, len(latencies) - 1)]
+
+
+def load_test(
+    url: str, requests=10_000, connections=4, batch=0, binary=False
+) -> dict[str, Any]:
+    """
+    Sends requests to a conversion server over persistent connections, each
+    in its own thread, one request after the other.
+
+    :param url: Address of the server, e.g. 'http://127.0.0.1:8000'
+    :param requests: Optional, how many requests to send in all
+    :param connections: Optional, how many connections send them at once
+    :param batch: Optional, values of every batch, 0 to convert one value
+    :param binary: Optional, True to send packed float64 batches
+    :return: dict with the requests per second, the mean, p50 and p99
+        latencies in seconds (NaN if no request was answered), and the
+        number of errors, failed connections included
+    """
+    parts = urlsplit(url)
+    method, path, body, headers = _request(batch, binary)
+    latencies: list[list[float]] = [[] for _ in range(connections)]
+    errors = [0] * connections
+
+    def send(index: int, count: int) -> None:
+        connection = http.client.HTTPConnection(parts.netloc)
+        try:
+            for _ in range(count):
+                start = time.perf_counter()
+                try:
+                    connection.request(
+                        method, path, body=body, headers=headers
+                    )
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    # Counted as an error, the next request connects again
+                    errors[index] += 1
+                    connection.close()
+                    continue
+                latencies[index].append(time.perf_counter() - start)
+                if response.status != 200:
+                    errors[index] += 1
+        finally:
+            connection.close()
+
+    threads = [
+        threading.Thread(
+            target=send,
+            args=(
+                index,
+                requests // connections + (index < requests % connections),
+            ),
+        )
+        for index in range(connections)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    every = sorted(latency for latency in sum(latencies, []))
+    # NaN latencies when no request was answered at all
+    measured = every or [math.nan]
+    return {
+        'requests': len(every),
+        'connections': connections,
+        'batch': batch,
+        'binary': binary,
+        'seconds': duration,
+        'requests_per_second': len(every) / duration,
+        'values_per_second': len(every) * max(batch, 1) / duration,
+        'mean': sum(measured) / len(measured),
+        'p50': _percentile(measured, 50),
+        'p99': _percentile(measured, 99),
+        'errors': sum(errors),
+    }
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from timeit import Timer
+from typing import Any, Callable, Iterable
+
+import totemp
+from totemp.buffers import convert_buffer
+
+try:
+    import numpy as np
+
+    from totemp.arrays import convert_array
+    from totemp.parallel import convert_threaded
+except ImportError:  # the batch benchmarks then only cover buffers
+    np = None  # type: ignore[assignment]
+
+CLASSES = (totemp.Celsius, totemp.Fahrenheit, totemp.Delisle, totemp.Kelvin)
+
+SIZES = tuple(10**exponent for exponent in range(0, 9))
+
+
+def _best(timer: Timer, repeat: int, number: int | None = None) -> float:
+    """Runs a timer, returning the best time of a single run, in seconds"""
+    if number is None:
+        # autorange() aims at runs of 0.2s, a quarter of that is plenty
+        number = max(1, timer.autorange()[0] // 4)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def scalar_latency(repeat=5) -> dict[str, dict[str, Any]]:
+    """
+    Measures the time of one call of every method of Celsius, Fahrenheit,
+    Delisle and Kelvin, with float_ret True and False.
+
+    :param repeat: Optional, how many times every measure is repeated
+    :return: dict of results by name, e.g. 'scalar/Celsius.to_kelvin/float'
+    """
+    results = {}
+    for cls in CLASSES:
+        for name in sorted(vars(cls)):
+            if not name.startswith('to_'):
+                continue
+            method = getattr(cls, name)
+            for ret, stmt in [
+                ('float', 'method(41.985)'),
+                ('int', 'method(41.985, float_ret=False)'),
+            ]:
+                timer = Timer(stmt, globals={'method': method})
+                results[f'scalar/{cls.__name__}.{name}/{ret}'] = {
+                    'seconds': _best(timer, repeat)
+                }
+    return results
+
+
+def _batch_cases() -> dict[str, Callable[[Any, Any], Any]]:
+    """Batch conversions to measure, taking the values and an out buffer"""
+    cases: dict[str, Callable[[Any, Any], Any]] = {
+        'convert_buffer': lambda values, out: convert_buffer(
+            values, 'C', 'F', out=out
+        ),
+    }
+    if np is not None:
+        cases.update(
+            {
+                'convert_array': lambda values, out: convert_array(
+                    values, 'C', 'F', out=out
+                ),
+                'convert_array/fast': lambda values, out: convert_array(
+                    values, 'C', 'F', exact=False, out=out
+                ),
+                'convert_array/int': lambda values, out: convert_array(
+                    values, 'C', 'F', float_ret=False
+                ),
+                # Always threaded, to show from which size threads pay off
+                'convert_threaded': lambda values, out: convert_threaded(
+                    values, 'C', 'F', out=out, threshold=0
+                ),
+                'convert_threaded/fast': lambda values, out: (
+                    convert_threaded(
+                        values, 'C', 'F', exact=False, out=out, threshold=0
+                    )
+                ),
+            }
+        )
+    return cases
+
+
+def _values(size: int) -> Any:
+    """Random Celsius values, as an array of float64"""
+    if np is not None:
+        return np.random.default_rng(size).uniform(-50, 50, size)
+    generator = random.Random(size)
+    return array('d', (generator.uniform(-50, 50) for _ in range(size)))
+
+
+def batch_throughput(
+    sizes: Iterable[int] = SIZES, repeat=3
+) -> dict[str, dict[str, Any]]:
+    """
+    Measures the time, the throughput and the peak of memory allocated (by
+    tracemalloc, besides the values and the results) of the batch
+    conversions of arrays of every size.
+
+    :param sizes: Optional, numbers of values of the arrays
+    :param repeat: Optional, how many times every measure is repeated
+    :return: dict of results by name, e.g. 'batch/convert_array/1000'
+    """
+    results = {}
+    for size in sizes:
+        values = _values(size)
+        out = array('d', bytes(8 * size)) if np is None else np.empty(size)
+        for name, case in _batch_cases().items():
+            timer = Timer(lambda: case(values, out))
+            # A single run is already long enough for the big arrays
+            seconds = _best(timer, repeat, 1 if size >= 10**6 else None)
+
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            case(values, out)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[f'batch/{name}/{size}'] = {
+                'seconds': seconds,
+                'items_per_second': size / seconds,
+                'peak_bytes': peak,
+            }
+        del values, out
+    return results
+
+
+def run(sizes: Iterable[int] = SIZES, repeat=3) -> dict[str, Any]:
+    """
+    Runs every benchmark.
+
+    :param sizes: Optional, numbers of values of the batch benchmarks
+    :param repeat: Optional, how many times every measure is repeated
+    :return: dict with the environment ('meta') and the 'results'
+    """
+    started = time.time()
+    results = scalar_latency(repeat=repeat)
+    results.update(batch_throughput(sizes, repeat=repeat))
+    return {
+        'meta': {
+            'totemp': totemp.__version__,
+            'python': sys.version.split()[0],
+            'numpy': None if np is None else np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'started': started,
+            'duration': time.time() - started,
+        },
+        'results': results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance=0.1
+) -> list[dict[str, Any]]:
+    """
+    Compares the times of two runs, benchmark by benchmark.
+
+    :param baseline: Results of the reference run
+    :param current: Results of the run to check
+    :param tolerance: Optional, how much slower (0.1 = 10%) is still fine
+    :return: list of comparisons of the benchmarks in both runs, each with
+        its 'name', both times, their 'ratio' and whether it's a 'regression'
+    """
+    comparisons = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['seconds']
+        after = result['seconds']
+        ratio = after / before if before else float('inf')
+        comparisons.append(
+            {
+                'name': name,
+                'baseline': before,
+                'current': after,
+                'ratio': ratio,
+                'regression': ratio > 1 + tolerance,
+            }
+        )
+    return comparisons
@@ -1,8 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from totemp import Celsius, Delisle, Fahrenheit, Kelvin
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
 
 from .test_totemp import TestToTemp
 
-__all__ = ['TestToTemp', 'Celsius', 'Fahrenheit', 'Delisle', 'Kelvin']
+__all__ = [
+    'TestToTemp',
+    'Celsius',
+    'Fahrenheit',
+    'Delisle',
+    'Kelvin',
+    'Newton',
+    'Rankine',
+    'Reaumur',
+    'Romer',
+]
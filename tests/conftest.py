@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture
+def np():
+    """NumPy, skipping the test if it's not installed"""
+    return pytest.importorskip('numpy')
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+import totemp.accessors  # noqa: E402, F401
+from totemp import Celsius, Fahrenheit, Kelvin  # noqa: E402
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+class TestSeriesAccessor:
+    """Tests the .totemp accessor of pandas Series"""
+
+    def test_convert(self) -> None:
+        """Tests that the results are the ones of the methods"""
+        series = pd.Series(SAMPLES, index=list('abcdefghij'), name='t')
+        result = series.totemp.convert('C', 'F')
+        assert result.name == 't'
+        assert result.index.equals(series.index)
+        assert result.tolist() == [
+            Celsius.to_fahrenheit(value) for value in SAMPLES
+        ]
+        assert series.tolist() == SAMPLES
+
+    def test_trunc_ret(self) -> None:
+        """Tests that the results are truncated into ints"""
+        result = pd.Series(SAMPLES).totemp.convert('F', 'C', float_ret=False)
+        assert result.dtype == 'int64'
+        assert result.tolist() == [
+            Fahrenheit.to_celsius(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_nullable_floats(self) -> None:
+        """Tests that missing values are kept in nullable columns"""
+        series = pd.Series([0.0, None, 100.0], dtype='Float64')
+        result = series.totemp.convert('C', 'K')
+        assert result.dtype == 'Float64'
+        assert result.isna().tolist() == [False, True, False]
+        assert result[[0, 2]].tolist() == [273.15, 373.15]
+
+    def test_nullable_ints(self) -> None:
+        """Tests that nullable ints can be truncated, keeping missing values"""
+        series = pd.Series([300, None, 400], dtype='Int64')
+        result = series.totemp.convert('K', 'C', float_ret=False)
+        assert result.dtype == 'Int64'
+        assert result.isna().tolist() == [False, True, False]
+        assert result[[0, 2]].tolist() == [
+            Kelvin.to_celsius(300, float_ret=False),
+            Kelvin.to_celsius(400, float_ret=False),
+        ]
+
+    def test_not_numbers(self) -> None:
+        """Tests that columns of other types are rejected"""
+        with pytest.raises(TypeError):
+            pd.Series(['1', '2']).totemp.convert('C', 'F')
+        with pytest.raises(TypeError):
+            pd.Series([True, False]).totemp.convert('C', 'F')
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            pd.Series(SAMPLES).totemp.convert('C', 'plank')
+
+
+class TestDataFrameAccessor:
+    """Tests the .totemp accessor of pandas DataFrames"""
+
+    @pytest.fixture
+    def frame(self) -> Any:
+        """Frame with two temperature columns and a label column"""
+        return pd.DataFrame(
+            {
+                'low': SAMPLES,
+                'high': pd.array(range(10), dtype='Int64'),
+                'site': list('abcdefghij'),
+            }
+        )
+
+    def test_columns(self, frame: Any) -> None:
+        """Tests that only the given columns are converted"""
+        result = frame.totemp.convert('C', 'F', columns=['low', 'high'])
+        assert result['low'].tolist() == [
+            Celsius.to_fahrenheit(value) for value in SAMPLES
+        ]
+        assert result['high'].tolist() == [
+            Celsius.to_fahrenheit(value) for value in range(10)
+        ]
+        assert result['site'].tolist() == list('abcdefghij')
+        assert frame['low'].tolist() == SAMPLES
+
+    def test_all_columns(self, frame: Any) -> None:
+        """Tests that every column is converted by default"""
+        result = frame[['low', 'high']].totemp.convert('C', 'K')
+        assert result['high'].tolist() == [
+            Celsius.to_kelvin(value) for value in range(10)
+        ]
+        with pytest.raises(TypeError):
+            frame.totemp.convert('C', 'K')
+
+    def test_inplace(self, frame: Any) -> None:
+        """Tests that the columns can be replaced in the frame itself"""
+        result = frame.totemp.convert('C', 'K', columns=['low'], inplace=True)
+        assert result is None
+        assert frame['low'].tolist() == [
+            Celsius.to_kelvin(value) for value in SAMPLES
+        ]
+
+
+class TestRegistration:
+    """Tests when the accessors are registered"""
+
+    @pytest.mark.parametrize(
+        'imports',
+        [
+            'import pandas, totemp.accessors',
+            'import totemp.accessors, pandas',
+            'import totemp, pandas; import totemp.accessors',
+        ],
+    )
+    def test_registered_on_import(self, imports: str) -> None:
+        """
+        Tests that importing totemp.accessors registers them, whether pandas
+        is imported before or after totemp
+        """
+        code = (
+            f'{imports}\n'
+            "print(pandas.Series([0.0]).totemp.convert('C', 'K').tolist())\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], text=True
+        )
+        assert output.strip() == '[273.15]'
+
+    @pytest.mark.parametrize(
+        'imports', ['import pandas, totemp', 'import totemp, pandas']
+    )
+    def test_not_registered_by_totemp(self, imports: str) -> None:
+        """Tests that importing totemp alone never registers them"""
+        code = f"{imports}\nprint(hasattr(pandas.Series([0.0]), 'totemp'))\n"
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], text=True
+        )
+        assert output.strip() == 'False'
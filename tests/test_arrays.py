@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import totemp
+from totemp.conversion import CONVERTERS
+from totemp.scales import COEFFICIENTS, FORMULAS, VALIDATION_MODES
+
+np = pytest.importorskip('numpy')
+
+from totemp.arrays import convert_array  # noqa: E402
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+def scalar_method(source: str, target: str):
+    """Returns the method of the classes that does the same conversion"""
+    return getattr(getattr(totemp, source.capitalize()), f'to_{target}')
+
+
+class TestConvertArray:
+    """Tests the vectorized conversion of arrays in arrays.py"""
+
+    @pytest.mark.parametrize('source, target', sorted(FORMULAS))
+    def test_same_results_as_methods(self, source: str, target: str) -> None:
+        """Tests that every element matches the scalar method bit-for-bit"""
+        method = CONVERTERS[source, target]
+        result = convert_array(np.array(SAMPLES), source, target)
+        assert result.tolist() == [method(value) for value in SAMPLES]
+
+    @pytest.mark.parametrize('source, target', sorted(FORMULAS))
+    def test_same_results_as_methods_trunc_ret(
+        self, source: str, target: str
+    ) -> None:
+        """
+        Tests that every element matches the scalar method with float_ret
+        set to False
+        """
+        method = CONVERTERS[source, target]
+        result = convert_array(
+            np.array(SAMPLES), source, target, float_ret=False
+        )
+        assert result.tolist() == [
+            method(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_integer_input(self) -> None:
+        """Tests that integer arrays give the same results as int values"""
+        values = np.arange(-50, 50)
+        result = convert_array(values, 'delisle', 'romer')
+        assert result.tolist() == [
+            totemp.Delisle.to_romer(int(value)) for value in values
+        ]
+
+    def test_float32_input(self) -> None:
+        """Tests that float32 arrays are computed in float64, as in Python"""
+        values = np.array(SAMPLES, dtype=np.float32)
+        result = convert_array(values, 'fahrenheit', 'kelvin')
+        assert result.tolist() == [
+            totemp.Fahrenheit.to_kelvin(float(value)) for value in values
+        ]
+
+    def test_float32_out(self) -> None:
+        """Tests that float32 results are computed in float64, then stored"""
+        values = np.linspace(-500, 500, 1001)
+        out = np.empty(values.shape, dtype=np.float32)
+        convert_array(values, 'fahrenheit', 'romer', out=out)
+        assert out.tolist() == [
+            float(np.float32(totemp.Fahrenheit.to_romer(value)))
+            for value in values.tolist()
+        ]
+
+    def test_default_dtype(self) -> None:
+        """Tests the dtype of the array returned with default parameters"""
+        result = convert_array(np.arange(5), 'celsius', 'kelvin')
+        assert result.dtype == np.float64
+
+    def test_dtype_trunc_ret(self) -> None:
+        """Tests the dtype of the array returned with float_ret set to False"""
+        result = convert_array(
+            np.arange(5.0), 'celsius', 'kelvin', float_ret=False
+        )
+        assert result.dtype == np.int64
+
+    def test_out(self) -> None:
+        """Tests that the results are written into the given buffer"""
+        out = np.empty(len(SAMPLES))
+        result = convert_array(
+            np.array(SAMPLES), 'kelvin', 'fahrenheit', out=out
+        )
+        assert result is out
+        assert out.tolist() == [
+            totemp.Kelvin.to_fahrenheit(value) for value in SAMPLES
+        ]
+
+    def test_out_in_place(self) -> None:
+        """Tests that the input array itself can be used as the buffer"""
+        values = np.array(SAMPLES)
+        convert_array(values, 'fahrenheit', 'romer', out=values)
+        assert values.tolist() == [
+            totemp.Fahrenheit.to_romer(value) for value in SAMPLES
+        ]
+
+    def test_out_trunc_ret(self) -> None:
+        """Tests that truncated results are written into an int buffer"""
+        out = np.empty(len(SAMPLES), dtype=np.int32)
+        result = convert_array(
+            np.array(SAMPLES), 'celsius', 'newton', float_ret=False, out=out
+        )
+        assert result is out
+        assert out.tolist() == [
+            totemp.Celsius.to_newton(value, float_ret=False)
+            for value in SAMPLES
+        ]
+
+    def test_out_wrong_shape(self) -> None:
+        """Tests that a buffer of another shape is rejected"""
+        with pytest.raises(ValueError):
+            convert_array(np.arange(3), 'celsius', 'kelvin', out=np.empty(2))
+
+    def test_abbreviations(self) -> None:
+        """Tests that scales can be given by their abbreviations"""
+        values = np.array(SAMPLES)
+        assert (
+            convert_array(values, 'F', 'Ro').tolist()
+            == convert_array(values, 'fahrenheit', 'romer').tolist()
+        )
+
+    def test_identity(self) -> None:
+        """Tests that converting to the same scale copies the values"""
+        values = np.arange(5)
+        result = convert_array(values, 'kelvin', 'kelvin')
+        assert result is not values
+        assert result.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            convert_array(np.arange(3), 'celsius', 'plank')
+
+    def test_trunc_ret_nan(self) -> None:
+        """Tests that NaN can't be truncated, as with math.trunc"""
+        with pytest.raises(ValueError):
+            convert_array(
+                np.array([np.nan]), 'celsius', 'kelvin', float_ret=False
+            )
+
+    def test_fast(self) -> None:
+        """Tests that the fast mode is the fused multiply-add of the pair"""
+        scale, offset = COEFFICIENTS['celsius', 'fahrenheit']
+        values = np.array(SAMPLES)
+        result = convert_array(values, 'celsius', 'fahrenheit', exact=False)
+        assert result.tolist() == [value * scale + offset for value in SAMPLES]
+
+
+class TestValidation:
+    """Tests the validation of the values in convert_array"""
+
+    INVALID = [-300.0, 0.0, np.nan, np.inf, -np.inf, 10.0]
+
+    def test_disabled(self) -> None:
+        """Tests that the values aren't checked by default"""
+        result = convert_array(np.array([-5.0]), 'kelvin', 'celsius')
+        assert result.tolist() == [totemp.Kelvin.to_celsius(-5.0)]
+
+    def test_valid(self) -> None:
+        """Tests that valid values give the same results as without checks"""
+        values = np.array(SAMPLES)
+        for validate in VALIDATION_MODES:
+            result = convert_array(values, 'F', 'Ro', validate=validate)
+            assert result.tolist() == [
+                totemp.Fahrenheit.to_romer(value) for value in SAMPLES
+            ]
+
+    def test_raise(self) -> None:
+        """Tests that the first invalid value is reported"""
+        values = np.array([0.0, 1.0, -1.0, -2.0])
+        with pytest.raises(ValueError, match=r'-1\.0 at index 2'):
+            convert_array(values, 'kelvin', 'celsius', validate='raise')
+
+    def test_raise_index_in_later_chunk(self, monkeypatch) -> None:
+        """Tests that indexes count from the start of the array"""
+        monkeypatch.setattr('totemp.arrays.VALIDATION_CHUNK_SIZE', 2)
+        values = np.array([[0.0, 1.0, 2.0], [3.0, np.nan, 5.0]])
+        with pytest.raises(ValueError, match=r'nan at index \(1, 1\)'):
+            convert_array(values, 'K', 'C', validate='raise')
+
+    def test_raise_in_place_unchanged(self, monkeypatch) -> None:
+        """Tests that nothing is converted in place if a value is invalid"""
+        monkeypatch.setattr('totemp.arrays.VALIDATION_CHUNK_SIZE', 2)
+        values = np.array([0.0, 1.0, 2.0, -3.0])
+        with pytest.raises(ValueError, match=r'-3\.0 at index 3'):
+            convert_array(values, 'K', 'C', out=values, validate='raise')
+        assert values.tolist() == [0.0, 1.0, 2.0, -3.0]
+
+    def test_nan(self) -> None:
+        """Tests that invalid values become NaN"""
+        result = convert_array(
+            np.array(self.INVALID), 'celsius', 'kelvin', validate='nan'
+        )
+        assert np.isnan(result).tolist() == [
+            True,
+            False,
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_nan_trunc_ret(self) -> None:
+        """Tests that ints can't be NaN"""
+        with pytest.raises(ValueError):
+            convert_array(
+                np.arange(3), 'C', 'K', float_ret=False, validate='nan'
+            )
+
+    def test_clip(self) -> None:
+        """Tests that values below absolute zero are clipped"""
+        result = convert_array(
+            np.array(self.INVALID), 'celsius', 'fahrenheit', validate='clip'
+        )
+        assert result[[0, 1, 3, 4, 5]].tolist() == [
+            -459.67,
+            32.0,
+            np.inf,
+            -459.67,
+            50.0,
+        ]
+        assert np.isnan(result[2])
+
+    def test_clip_delisle(self) -> None:
+        """Tests that Delisle values above absolute zero are clipped"""
+        result = convert_array(
+            np.array([600.0, 0.0]), 'delisle', 'kelvin', validate='clip'
+        )
+        assert result.tolist() == [0.0, 373.15]
+
+    def test_clip_trunc_ret(self) -> None:
+        """Tests that clipped values are truncated too"""
+        result = convert_array(
+            np.array([-5, 1]), 'K', 'C', float_ret=False, validate='clip'
+        )
+        assert result.tolist() == [-273, -272]
+
+    def test_unknown_mode(self) -> None:
+        """Tests that unknown validation modes are rejected"""
+        with pytest.raises(ValueError):
+            convert_array(np.arange(3), 'C', 'K', validate='ignore')
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+from totemp import Celsius, Delisle, backends, convert_batch
+from totemp.backends import THRESHOLDS, available, select, set_thresholds
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+@pytest.fixture(autouse=True)
+def thresholds(monkeypatch) -> dict[str, int]:
+    """Restores the thresholds changed by a test"""
+    monkeypatch.setattr(backends, 'THRESHOLDS', dict(THRESHOLDS))
+    return backends.THRESHOLDS
+
+
+class TestSelect:
+    """Tests how backends are picked by type and size of the values"""
+
+    def test_small_sequences(self) -> None:
+        """Tests that a few values in a list are converted by Python"""
+        assert select([1.0] * 10) == 'python'
+
+    def test_small_buffers(self) -> None:
+        """Tests that a few values in a buffer use the buffer backend"""
+        assert select(array('d', [1.0] * 10)) == 'buffer'
+        assert select(memoryview(array('d', [1.0]))) == 'buffer'
+
+    def test_large_values(self, np) -> None:
+        """Tests that many values are converted by NumPy"""
+        size = THRESHOLDS['numpy']
+        assert select([1.0] * size) == 'numpy'
+        assert select(array('d', [1.0]) * size) == 'numpy'
+
+    def test_arrays(self, np) -> None:
+        """Tests that NumPy arrays of any size are converted by NumPy"""
+        assert select(np.zeros(1)) == 'numpy'
+        assert select(np.array(5.0)) == 'numpy'
+
+    def test_largest_arrays(self, np, monkeypatch) -> None:
+        """Tests that the largest arrays use Numba when it's installed"""
+        monkeypatch.setitem(backends._AVAILABLE, 'numba', True)
+        set_thresholds(numba=100)
+        assert select(np.zeros(99)) == 'numpy'
+        assert select(np.zeros(100)) == 'numba'
+
+    def test_without_numpy(self, monkeypatch) -> None:
+        """Tests that Python backends are used if NumPy is missing"""
+        monkeypatch.setitem(backends._AVAILABLE, 'numpy', False)
+        assert select([1.0] * 100_000) == 'python'
+        assert select(array('d', [1.0]) * 100_000) == 'buffer'
+
+    def test_set_thresholds(self, np) -> None:
+        """Tests that the thresholds can be changed"""
+        set_thresholds(numpy=5)
+        assert select([1.0] * 4) == 'python'
+        assert select([1.0] * 5) == 'numpy'
+        with pytest.raises(ValueError):
+            set_thresholds(python=5)
+
+    def test_available(self) -> None:
+        """Tests that the backends without dependencies are available"""
+        assert available('python') and available('buffer')
+        with pytest.raises(ValueError):
+            available('fortran')
+
+
+class TestConvertBatch:
+    """Tests the conversion of batches with every backend"""
+
+    @pytest.mark.parametrize('backend', ['python', 'buffer', 'numpy'])
+    def test_same_results_as_methods(self, backend: str) -> None:
+        """Tests that every backend matches the methods bit-for-bit"""
+        if not available(backend):
+            pytest.skip(f'The {backend} backend is not installed')
+        result = convert_batch(
+            array('d', SAMPLES), 'De', 'Ro', backend=backend
+        )
+        assert list(result) == [Delisle.to_romer(value) for value in SAMPLES]
+
+    @pytest.mark.parametrize('backend', ['python', 'buffer', 'numpy'])
+    def test_trunc_ret(self, backend: str) -> None:
+        """Tests that every backend truncates as the methods do"""
+        if not available(backend):
+            pytest.skip(f'The {backend} backend is not installed')
+        result = convert_batch(
+            array('d', SAMPLES), 'C', 'F', float_ret=False, backend=backend
+        )
+        assert list(result) == [
+            Celsius.to_fahrenheit(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_result_types(self, np) -> None:
+        """Tests that results are of the same kind as the values"""
+        assert isinstance(convert_batch(SAMPLES, 'C', 'K'), list)
+        assert isinstance(convert_batch(SAMPLES * 100, 'C', 'K'), list)
+        result = convert_batch(array('d', SAMPLES) * 100, 'C', 'K')
+        assert isinstance(result, array) and result.typecode == 'd'
+        assert isinstance(convert_batch(np.zeros(3), 'C', 'K'), np.ndarray)
+
+    def test_zero_dimensional(self, np) -> None:
+        """Tests that 0-d arrays are converted into 0-d arrays"""
+        result = convert_batch(np.array(41.985), 'C', 'F')
+        assert result.shape == ()
+        assert result == Celsius.to_fahrenheit(41.985)
+
+    def test_generators(self) -> None:
+        """Tests that iterables without a length are converted too"""
+        result = convert_batch((value for value in SAMPLES), 'C', 'K')
+        assert result == [Celsius.to_kelvin(value) for value in SAMPLES]
+
+    def test_numba(self, np) -> None:
+        """Tests that the Numba backend matches the methods bit-for-bit"""
+        if not available('numba'):
+            pytest.skip('Numba is not installed')
+        result = convert_batch(np.array(SAMPLES), 'De', 'Ro', backend='numba')
+        assert result.tolist() == [
+            Delisle.to_romer(value) for value in SAMPLES
+        ]
+
+    def test_not_installed(self, monkeypatch) -> None:
+        """Tests that asking for a missing backend raises ImportError"""
+        monkeypatch.setitem(backends._AVAILABLE, 'numba', False)
+        with pytest.raises(ImportError):
+            convert_batch(SAMPLES, 'C', 'K', backend='numba')
+
+    def test_lazy_import(self) -> None:
+        """Tests that small batches never import NumPy"""
+        code = (
+            'import sys, totemp\n'
+            "totemp.convert_batch([1.0, 2.0], 'C', 'K')\n"
+            "print('numpy' in sys.modules)\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, '-c', code], text=True
+        )
+        assert output.strip() == 'False'
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import math
+import socket
+from pathlib import Path
+
+from benchmarks.__main__ import main
+from benchmarks.loadtest import load_test
+from benchmarks.suite import batch_throughput, compare
+
+
+def results(**seconds: float) -> dict:
+    """Builds the results of a run out of the times of its benchmarks"""
+    return {
+        'meta': {},
+        'results': {
+            name: {'seconds': value} for name, value in seconds.items()
+        },
+    }
+
+
+class TestBenchmarks:
+    """Tests the benchmark suite in benchmarks/"""
+
+    def test_batch_throughput(self) -> None:
+        """Tests the measures of the batch conversions"""
+        measures = batch_throughput([10], repeat=1)
+        assert 'batch/convert_buffer/10' in measures
+        for measure in measures.values():
+            assert measure['seconds'] > 0
+            assert measure['items_per_second'] > 0
+            assert measure['peak_bytes'] >= 0
+
+    def test_compare(self) -> None:
+        """Tests that only benchmarks slower than the tolerance regress"""
+        comparisons = compare(
+            results(fast=1.0, same=1.0, slow=1.0, gone=1.0),
+            results(fast=0.5, same=1.05, slow=1.5, new=1.0),
+            tolerance=0.1,
+        )
+        assert {
+            comparison['name']: comparison['regression']
+            for comparison in comparisons
+        } == {'fast': False, 'same': False, 'slow': True}
+
+    def test_compare_command(self, tmp_path: Path, capsys) -> None:
+        """Tests the exit status of the compare command"""
+        baseline = tmp_path / 'baseline.json'
+        current = tmp_path / 'current.json'
+        baseline.write_text(json.dumps(results(a=1.0, b=1.0)))
+        current.write_text(json.dumps(results(a=1.0, b=2.0)))
+        assert main(['compare', str(baseline), str(current)]) == 1
+        assert main(['compare', str(baseline), str(baseline)]) == 0
+        assert 'REGRESSION' in capsys.readouterr().out
+
+    def test_loadtest_command(self, capsys) -> None:
+        """Tests the load test of a server started on localhost"""
+        assert main(['loadtest', '-n', '20', '-c', '2', '--batch', '10']) == 0
+        output = capsys.readouterr().out
+        assert '20 requests' in output and 'p99' in output
+        assert '0 error(s)' in output
+
+    def test_loadtest_closed_port(self) -> None:
+        """Tests that requests no server answers are counted as errors"""
+        with socket.socket() as free:
+            free.bind(('127.0.0.1', 0))
+            port = free.getsockname()[1]
+        results = load_test(
+            f'http://127.0.0.1:{port}', requests=5, connections=2
+        )
+        assert results['errors'] == 5
+        assert results['requests'] == 0
+        assert math.isnan(results['p99'])
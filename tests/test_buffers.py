@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import struct
+from array import array
+
+import pytest
+
+from totemp import Celsius, Delisle, Fahrenheit, Kelvin, buffers
+from totemp.buffers import convert_buffer
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+@pytest.fixture(params=['numpy', 'python'], autouse=True)
+def implementation(request, monkeypatch) -> str:
+    """Runs every test with and without NumPy"""
+    if request.param == 'python':
+        monkeypatch.setattr(buffers, 'np', None)
+    elif buffers.np is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+class TestConvertBuffer:
+    """Tests the conversion of buffers in buffers.py"""
+
+    def test_array_in_place(self) -> None:
+        """Tests that an array('d') is converted in place"""
+        values = array('d', SAMPLES)
+        convert_buffer(values, 'celsius', 'fahrenheit')
+        assert values.tolist() == [
+            Celsius.to_fahrenheit(value) for value in SAMPLES
+        ]
+
+    def test_array_into_out(self) -> None:
+        """Tests that the results are written into the given buffer"""
+        values = array('d', SAMPLES)
+        out = array('d', bytes(len(values) * 8))
+        result = convert_buffer(values, 'K', 'Ro', out=out)
+        assert values.tolist() == SAMPLES
+        assert out.tolist() == [Kelvin.to_romer(value) for value in SAMPLES]
+        assert result.obj is out
+
+    def test_bytearray_frame(self) -> None:
+        """Tests that raw bytes are reinterpreted with the typecode"""
+        frame = bytearray(struct.pack(f'<{len(SAMPLES)}d', *SAMPLES))
+        result = convert_buffer(frame, 'De', 'C', typecode='d')
+        assert result.tolist() == [
+            Delisle.to_celsius(value) for value in SAMPLES
+        ]
+        assert list(struct.unpack(f'<{len(SAMPLES)}d', frame)) == [
+            Delisle.to_celsius(value) for value in SAMPLES
+        ]
+
+    def test_float32(self) -> None:
+        """
+        Tests that float32 items are converted as the methods do and only
+        rounded when written
+        """
+        values = array('f', SAMPLES)
+        convert_buffer(values, 'F', 'K')
+        assert (
+            values.tolist()
+            == array(
+                'f',
+                [Fahrenheit.to_kelvin(value) for value in array('f', SAMPLES)],
+            ).tolist()
+        )
+
+    def test_memoryview(self) -> None:
+        """Tests that a memoryview slice converts only its items"""
+        values = array('d', SAMPLES)
+        convert_buffer(memoryview(values)[2:4], 'C', 'K')
+        assert values.tolist() == [
+            *SAMPLES[:2],
+            Celsius.to_kelvin(SAMPLES[2]),
+            Celsius.to_kelvin(SAMPLES[3]),
+            *SAMPLES[4:],
+        ]
+
+    def test_trunc_ret_into_ints(self) -> None:
+        """Tests that truncated values are written into an int buffer"""
+        out = array('q', [0] * len(SAMPLES))
+        convert_buffer(array('d', SAMPLES), 'C', 'N', out=out, float_ret=False)
+        assert out.tolist() == [
+            Celsius.to_newton(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_small_chunks(self) -> None:
+        """Tests that the chunk size doesn't change the results"""
+        values = array('d', SAMPLES)
+        convert_buffer(values, 'C', 'De', chunk_size=3)
+        assert values.tolist() == [
+            Celsius.to_delisle(value) for value in SAMPLES
+        ]
+
+    def test_fast(self) -> None:
+        """Tests the buffers with the fast mode"""
+        values = array('d', SAMPLES)
+        convert_buffer(values, 'C', 'F', exact=False)
+        assert values.tolist() == pytest.approx(
+            [Celsius.to_fahrenheit(value) for value in SAMPLES]
+        )
+
+    def test_floats_into_ints(self) -> None:
+        """Tests that floats can't be written into an int buffer"""
+        with pytest.raises(ValueError):
+            convert_buffer(array('i', [1, 2]), 'C', 'K')
+
+    def test_read_only(self) -> None:
+        """Tests that read-only buffers can't be converted in place"""
+        with pytest.raises(ValueError):
+            convert_buffer(bytes(16), 'C', 'K', typecode='d')
+
+    def test_wrong_length(self) -> None:
+        """Tests that out must have as many items as the buffer"""
+        with pytest.raises(ValueError):
+            convert_buffer(array('d', [1, 2]), 'C', 'K', out=array('d', [0]))
+
+
+class TestValidation:
+    """Tests the validation of the values in convert_buffer"""
+
+    def test_raise(self) -> None:
+        """Tests that the first invalid value is reported at its index"""
+        values = array('d', [1.0, 2.0, 3.0, -4.0, 5.0])
+        with pytest.raises(ValueError, match=r'-4\.0 at index 3'):
+            convert_buffer(values, 'K', 'C', chunk_size=2, validate='raise')
+
+    def test_raise_unchanged(self) -> None:
+        """
+        Tests that an invalid value far into a large chunk is reported at its
+        index, leaving the buffer unchanged
+        """
+        values = array('d', [100.0] * 200_000)
+        values[150_000] = -5.0
+        with pytest.raises(ValueError, match=r'-5\.0 at index 150000'):
+            convert_buffer(
+                values, 'K', 'C', validate='raise', chunk_size=200_000
+            )
+        assert values[0] == 100.0 and values[-1] == 100.0
+
+    def test_nan(self) -> None:
+        """Tests that invalid values become NaN"""
+        values = array('d', [-500.0, float('nan'), 0.0])
+        convert_buffer(values, 'F', 'K', validate='nan')
+        assert values[0] != values[0] and values[1] != values[1]
+        assert values[2] == Fahrenheit.to_kelvin(0.0)
+
+    def test_clip(self) -> None:
+        """Tests that values beyond absolute zero are clipped"""
+        values = array('d', [600.0, float('-inf'), 0.0])
+        convert_buffer(values, 'De', 'K', validate='clip')
+        assert values.tolist() == [
+            0.0,
+            Delisle.to_kelvin(float('-inf')),
+            373.15,
+        ]
+
+    def test_clip_into_ints(self) -> None:
+        """Tests that clipped values are truncated into int buffers"""
+        values = array('d', [-10.0, 300.0])
+        out = array('q', [0, 0])
+        convert_buffer(
+            values, 'K', 'F', out=out, float_ret=False, validate='clip'
+        )
+        assert out.tolist() == [
+            -459,
+            Kelvin.to_fahrenheit(300.0, float_ret=False),
+        ]
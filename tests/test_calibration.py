@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from totemp import Fahrenheit  # noqa: E402
+from totemp.calibration import convert_calibrated, fold  # noqa: E402
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+def reference(values, gain, offset) -> list[float]:
+    """Calibrates and then converts with Fahrenheit.to_kelvin"""
+    return [
+        Fahrenheit.to_kelvin(float(value) * float(g) + float(o))
+        for value, g, o in zip(values, gain, offset)
+    ]
+
+
+class TestConvertCalibrated:
+    """Tests the calibrated conversion of calibration.py"""
+
+    def test_fold(self) -> None:
+        """Tests that folded coefficients calibrate and convert at once"""
+        scale, offset = fold('F', 'K', 2.0, -1.0)
+        assert 50 * scale + offset == pytest.approx(Fahrenheit.to_kelvin(99))
+
+    def test_scalar(self) -> None:
+        """Tests one calibration for every reading"""
+        result = convert_calibrated(
+            SAMPLES, 'fahrenheit', 'kelvin', gain=1.01, offset=-0.5
+        )
+        expected = reference(SAMPLES, [1.01] * 10, [-0.5] * 10)
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_no_calibration(self) -> None:
+        """Tests that the defaults only convert the readings"""
+        result = convert_calibrated(np.array(SAMPLES), 'F', 'K')
+        assert result.tolist() == pytest.approx(
+            [Fahrenheit.to_kelvin(value) for value in SAMPLES], rel=1e-12
+        )
+
+    def test_per_reading(self) -> None:
+        """Tests one calibration per reading, in several chunks"""
+        gain = np.linspace(0.9, 1.1, len(SAMPLES))
+        offset = np.linspace(-2, 2, len(SAMPLES))
+        result = convert_calibrated(
+            SAMPLES, 'F', 'K', gain=gain, offset=offset, chunk_size=3
+        )
+        expected = reference(SAMPLES, gain, offset)
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_per_sensor(self) -> None:
+        """Tests calibrations looked up by sensor, in several chunks"""
+        gain = np.array([1.0, 0.98, 1.03])
+        offset = np.array([0.0, 1.5, -0.25])
+        sensors = np.arange(len(SAMPLES)) % 3
+        result = convert_calibrated(
+            SAMPLES,
+            'F',
+            'K',
+            gain=gain,
+            offset=offset,
+            sensors=sensors,
+            chunk_size=4,
+        )
+        expected = reference(SAMPLES, gain[sensors], offset[sensors])
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_per_sensor_scalar_gain(self) -> None:
+        """Tests per sensor offsets with the same gain for every sensor"""
+        offset = np.array([0.0, 1.5])
+        sensors = np.arange(len(SAMPLES)) % 2
+        result = convert_calibrated(
+            SAMPLES, 'F', 'K', gain=2.0, offset=offset, sensors=sensors
+        )
+        expected = reference(SAMPLES, [2.0] * 10, offset[sensors])
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_two_dimensional(self) -> None:
+        """Tests that readings of any shape are converted element-wise"""
+        values = np.array(SAMPLES).reshape(2, 5)
+        sensors = np.zeros((2, 5), dtype=np.intp)
+        result = convert_calibrated(
+            values, 'F', 'K', gain=[1.5], offset=[1.0], sensors=sensors
+        )
+        assert result.shape == (2, 5)
+        expected = reference(SAMPLES, [1.5] * 10, [1.0] * 10)
+        assert result.ravel().tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_out(self) -> None:
+        """Tests that the results are written into the given buffer"""
+        out = np.empty(len(SAMPLES))
+        result = convert_calibrated(SAMPLES, 'C', 'F', gain=2.0, out=out)
+        assert result is out
+
+    def test_unknown_sensor(self) -> None:
+        """Tests that sensors missing from the tables are rejected"""
+        with pytest.raises(IndexError):
+            convert_calibrated(
+                [1.0, 2.0], 'F', 'K', gain=[1.0], sensors=[0, 1]
+            )
+        for gain in ([10.0, 20.0], 2.0):
+            out = np.zeros(2)
+            with pytest.raises(IndexError):
+                convert_calibrated(
+                    [1.0, 2.0], 'C', 'C', gain=gain, sensors=[0, -1], out=out
+                )
+            assert out.tolist() == [0.0, 0.0]
+
+    def test_wrong_shapes(self) -> None:
+        """Tests that calibrations of other shapes are rejected"""
+        with pytest.raises(ValueError):
+            convert_calibrated([1.0, 2.0], 'F', 'K', gain=[1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            convert_calibrated([1.0, 2.0], 'F', 'K', sensors=[0])
+        with pytest.raises(ValueError):
+            convert_calibrated([1.0], 'F', 'K', out=np.empty(2))
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin
+from totemp.cli import convert_stream, main
+
+
+def run(data: bytes, *args, **kwargs) -> bytes:
+    """Runs convert_stream over data, returning what was written"""
+    output = BytesIO()
+    convert_stream(BytesIO(data), output, *args, **kwargs)
+    return output.getvalue()
+
+
+class TestConvertStream:
+    """Tests the streaming conversion in cli.py"""
+
+    def test_lines(self) -> None:
+        """Tests that every line is converted"""
+        assert run(b'0\n41.985\n-40\n', 'C', 'F') == (
+            f'32.0\n{Celsius.to_fahrenheit(41.985)!r}\n-40.0\n'.encode()
+        )
+
+    def test_keeps_blank_lines_and_line_endings(self) -> None:
+        """Tests that blank lines and CRLF line endings are kept"""
+        assert run(b'0\r\n\r\n100', 'C', 'K') == b'273.15\r\n\r\n373.15'
+
+    def test_column(self) -> None:
+        """Tests that only the given column of the rows is converted"""
+        assert run(b'a,32,x\nb,212,y\n', 'F', 'C', column=1) == (
+            b'a,0.0,x\nb,100.0,y\n'
+        )
+
+    def test_delimiter_and_header(self) -> None:
+        """Tests other delimiters and that the header is kept as it is"""
+        assert (
+            run(
+                b'id;kelvin\n1;300\n',
+                'K',
+                'C',
+                column=1,
+                delimiter=b';',
+                header=True,
+            )
+            == f'id;kelvin\n1;{Kelvin.to_celsius(300)!r}\n'.encode()
+        )
+
+    def test_trunc_ret(self) -> None:
+        """Tests that truncated ints are written with float_ret False"""
+        assert run(b'18.746\n', 'F', 'N', float_ret=False) == (
+            f'{Fahrenheit.to_newton(18.746, float_ret=False)}\n'.encode()
+        )
+
+    def test_small_chunks(self) -> None:
+        """Tests that the chunk size doesn't change the output"""
+        data = b''.join(f'{value}\n'.encode() for value in range(-50, 50))
+        assert run(data, 'C', 'Ro', chunk_size=16) == run(data, 'C', 'Ro')
+
+    def test_returns_line_count(self) -> None:
+        """Tests that the number of converted lines is returned"""
+        output = BytesIO()
+        assert (
+            convert_stream(
+                BytesIO(b'h\n1\n2\n'), output, 'C', 'K', header=True
+            )
+            == 2
+        )
+
+    def test_invalid_value(self) -> None:
+        """Tests that the line of an invalid value is reported"""
+        with pytest.raises(ValueError, match='line 3'):
+            run(b'1\n2\nthree\n', 'C', 'K')
+
+    def test_truncated_infinity(self) -> None:
+        """Tests that the line of an infinity truncated to int is reported"""
+        with pytest.raises(ValueError, match='line 2'):
+            run(b'1\ninf\n', 'C', 'K', float_ret=False)
+
+    def test_missing_column(self) -> None:
+        """Tests that rows without the column are reported"""
+        with pytest.raises(ValueError, match='line 2'):
+            run(b'a,1\nb\n', 'C', 'K', column=1)
+
+
+class TestMain:
+    """Tests the command-line interface"""
+
+    def test_module(self) -> None:
+        """Tests running python -m totemp"""
+        result = subprocess.run(
+            [sys.executable, '-m', 'totemp', '-f', 'C', '-t', 'F', '--trunc'],
+            input=b'35\n41.985\n',
+            capture_output=True,
+            check=True,
+        )
+        assert result.stdout == b'95\n107\n'
+
+    def test_column_starts_at_one(self) -> None:
+        """Tests that --column 0 is rejected"""
+        with pytest.raises(SystemExit):
+            main(['-f', 'C', '-t', 'F', '--column', '0'])
+
+    def test_output_is_input(self, tmp_path: Path) -> None:
+        """Tests that the input file is not truncated to write into it"""
+        path = tmp_path / 'values.txt'
+        path.write_bytes(b'0\n100\n')
+        with pytest.raises(SystemExit):
+            main(['-f', 'C', '-t', 'K', str(path), '-o', str(path)])
+        assert path.read_bytes() == b'0\n100\n'
+
+    def test_broken_pipe(self, tmp_path: Path) -> None:
+        """Tests that a closed stdout, as with head, ends quietly"""
+        path = tmp_path / 'values.txt'
+        path.write_bytes(b''.join(b'%d\n' % value for value in range(200000)))
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'totemp', '-f', 'C', '-t', 'F', str(path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        assert process.stdout.readline() == b'32.0\n'
+        process.stdout.close()
+        assert process.stderr.read() == b''
+        assert process.wait() == 1
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales exit with an error"""
+        result = subprocess.run(
+            [sys.executable, '-m', 'totemp', '-f', 'C', '-t', 'plank'],
+            input=b'35\n',
+            capture_output=True,
+        )
+        assert result.returncode == 1
+        assert b'plank' in result.stderr
+
+    def test_truncated_infinity(self) -> None:
+        """Tests that infinities can't be truncated, exiting with an error"""
+        result = subprocess.run(
+            [sys.executable, '-m', 'totemp', '-f', 'C', '-t', 'K', '--trunc'],
+            input=b'1\ninf\n',
+            capture_output=True,
+        )
+        assert result.returncode == 1
+        assert b'line 2' in result.stderr
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from fractions import Fraction
+
+import pytest
+
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Rankine,
+    convert,
+    converter,
+)
+from totemp.conversion import CONVERTERS
+from totemp.scales import (
+    ABSOLUTE_ZERO,
+    COEFFICIENTS,
+    KELVIN_AFFINE,
+    SCALES,
+    affine,
+    resolve_scale,
+)
+
+
+class TestImport:
+    """Tests what importing totemp costs"""
+
+    def test_lazy_imports(self) -> None:
+        """
+        Tests that importing totemp loads neither the slow modules of the
+        standard library nor the conversion modules, until they're used
+        """
+        code = (
+            'import sys, totemp\n'
+            'slow = ["typing", "fractions", "decimal", "numpy"]\n'
+            'slow += ["totemp.conversion", "totemp.backends"]\n'
+            'print(*[name for name in slow if name in sys.modules])\n'
+            'print(totemp.convert(100, "C", "F"))'
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert output.splitlines() == ['', '212.0']
+
+
+class TestScales:
+    """Tests the registry of scales in scales.py"""
+
+    def test_coefficients_cover_all_pairs(self) -> None:
+        """Tests that there are coefficients for all 64 pairs of scales"""
+        assert len(COEFFICIENTS) == len(SCALES) ** 2 == 64
+
+    def test_kelvin_affine_fixed_points(self) -> None:
+        """Tests the registry against the freezing point of water"""
+        freezing_points: list[tuple[str, int | Fraction]] = [
+            ('celsius', 0),
+            ('delisle', 150),
+            ('fahrenheit', 32),
+            ('kelvin', Fraction('273.15')),
+            ('newton', 0),
+            ('rankine', Fraction('491.67')),
+            ('reaumur', 0),
+            ('romer', Fraction('7.5')),
+        ]
+        for scale, freezing in freezing_points:
+            scale_factor, offset = (
+                Fraction(*ratio) for ratio in KELVIN_AFFINE[scale]
+            )
+            assert freezing * scale_factor + offset == Fraction('273.15')
+
+    def test_coefficients_rounded_once(self) -> None:
+        """Tests that the written-out coefficients are the exact ones"""
+        for (source, target), coefficients in COEFFICIENTS.items():
+            scale, offset = affine(source, target)
+            assert coefficients == (float(scale), float(offset))
+
+    def test_absolute_zero(self) -> None:
+        """Tests that absolute zero is 0 K in every scale"""
+        for scale, zero in ABSOLUTE_ZERO.items():
+            factor, offset = affine(scale, 'kelvin')
+            assert zero == float(-offset / factor)
+
+    def test_affine_inverse(self) -> None:
+        """Tests that composing a pair with its inverse is the identity"""
+        for source in SCALES:
+            for target in SCALES:
+                scale, offset = affine(source, target)
+                back_scale, back_offset = affine(target, source)
+                assert scale * back_scale == 1
+                assert offset * back_scale + back_offset == 0
+
+    @pytest.mark.parametrize(
+        'name, scale',
+        [
+            ('C', 'celsius'),
+            ('celsius', 'celsius'),
+            ('Celsius', 'celsius'),
+            ('De', 'delisle'),
+            ('F', 'fahrenheit'),
+            ('k', 'kelvin'),
+            ('N', 'newton'),
+            ('Ra', 'rankine'),
+            ('Ré', 'reaumur'),
+            ('Réaumur', 'reaumur'),
+            ('Rø', 'romer'),
+            ('rømer', 'romer'),
+        ],
+    )
+    def test_resolve_scale(self, name: str, scale: str) -> None:
+        """Tests that names and abbreviations resolve to the scale"""
+        assert resolve_scale(name) == scale
+
+    def test_resolve_unknown_scale(self) -> None:
+        """Tests that unknown scale names are rejected"""
+        with pytest.raises(ValueError):
+            resolve_scale('plank')
+
+
+class TestConvert:
+    """Tests the generic convert function in conversion.py"""
+
+    def test_convert(self) -> None:
+        """Tests the result of a conversion by abbreviations"""
+        assert convert(41.985, 'C', 'F') == Celsius.to_fahrenheit(41.985)
+
+    def test_convert_by_name(self) -> None:
+        """Tests the result of a conversion by scale names"""
+        assert convert(12.5887, 'delisle', 'kelvin') == Delisle.to_kelvin(
+            12.5887
+        )
+
+    def test_convert_new_source(self) -> None:
+        """Tests a conversion from one of the scales added on the registry"""
+        assert convert(500, 'Ra', 'F') == Rankine.to_fahrenheit(500)
+
+    def test_convert_identity(self) -> None:
+        """Tests that converting to the same scale keeps the value"""
+        assert convert(44, 'K', 'K') == 44.0
+
+    def test_convert_default_type(self) -> None:
+        """
+        Tests the type of the value returned by convert with default
+        parameter values
+        """
+        assert isinstance(convert(18, 'F', 'N'), float)
+
+    def test_convert_type_trunc_ret(self) -> None:
+        """
+        Tests the type and value returned by convert with default parameter
+        set to False
+        """
+        result = convert(18.746, 'F', 'N', float_ret=False)
+        assert result == Fahrenheit.to_newton(18.746, float_ret=False)
+        assert isinstance(result, int)
+
+    def test_convert_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            convert(10, 'K', 'plank')
+
+    @pytest.mark.parametrize('source, target', sorted(CONVERTERS))
+    def test_all_pairs_match_coefficients(
+        self, source: str, target: str
+    ) -> None:
+        """Tests every one of the 64 pairs against the exact affine map"""
+        value = 123.456
+        scale, offset = affine(source, target)
+        assert convert(value, source, target) == pytest.approx(
+            float(Fraction(value) * scale + offset), rel=1e-12, abs=1e-12
+        )
+
+    def test_round_trip(self) -> None:
+        """Tests that converting there and back returns the value"""
+        for scale in SCALES:
+            there = convert(-40.0, 'C', scale)
+            assert convert(there, scale, 'C') == pytest.approx(-40.0)
+
+    def test_methods_are_used(self) -> None:
+        """Tests that the legacy pairs dispatch to the existing methods"""
+        assert CONVERTERS['kelvin', 'romer'] is Kelvin.to_romer
+
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+class TestConverter:
+    """Tests the specialized converters in conversion.py"""
+
+    @pytest.mark.parametrize('source, target', sorted(CONVERTERS))
+    @pytest.mark.parametrize('exact', [True, False])
+    @pytest.mark.parametrize('float_ret', [True, False])
+    def test_same_results_as_convert(
+        self, source: str, target: str, exact: bool, float_ret: bool
+    ) -> None:
+        """Tests every pair and mode against convert"""
+        function = converter(source, target, float_ret=float_ret, exact=exact)
+        for value in SAMPLES:
+            result = function(value)
+            expected = convert(
+                value, source, target, float_ret=float_ret, exact=exact
+            )
+            assert result == expected
+            assert type(result) is type(expected)
+
+    def test_attributes(self) -> None:
+        """Tests the attributes describing a converter"""
+        function = converter('F', 'C', float_ret=False)
+        assert function.source == 'fahrenheit'
+        assert function.target == 'celsius'
+        assert function.float_ret is False
+        assert function.exact is True
+        assert function.coefficients == COEFFICIENTS['fahrenheit', 'celsius']
+        assert function.formula == (('sub', 32), ('mul', 5), ('div', 9))
+
+    def test_fast_formula(self) -> None:
+        """Tests that the fast converters are a single multiply-add"""
+        function = converter('F', 'C', exact=False)
+        scale, offset = function.coefficients
+        assert function.formula == (('mul', scale), ('add', offset))
+        assert function(41.985) == 41.985 * scale + offset
+
+    def test_inverse(self) -> None:
+        """Tests that the inverse converts back"""
+        function = converter('K', 'Ro')
+        assert function.inverse is converter('Ro', 'K')
+        assert function.inverse.inverse is function
+        assert function.inverse(function(44.28137746)) == pytest.approx(
+            44.28137746
+        )
+
+    def test_cached(self) -> None:
+        """Tests that the same converter is returned for the same pair"""
+        assert converter('C', 'F') is converter('celsius', 'fahrenheit')
+        assert converter('C', 'F') is not converter('C', 'F', exact=False)
+
+    def test_positional_only(self) -> None:
+        """Tests that converters take only the value"""
+        with pytest.raises(TypeError):
+            converter('C', 'F')(35, float_ret=False)  # type: ignore
+
+    def test_batch(self) -> None:
+        """Tests that the batch of a converter converts arrays"""
+        np = pytest.importorskip('numpy')
+        function = converter('C', 'N', float_ret=False)
+        assert function.batch(np.array(SAMPLES)).tolist() == [
+            function(value) for value in SAMPLES
+        ]
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            converter('C', 'plank')
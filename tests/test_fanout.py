@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+
+import pytest
+
+from totemp.conversion import CONVERTERS
+from totemp.fanout import convert_all
+from totemp.scales import SCALES
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+class TestScalars:
+    """Tests the conversion of one value into every scale"""
+
+    @pytest.mark.parametrize('source', SCALES)
+    def test_same_results_as_methods(self, source: str) -> None:
+        """Tests that every target matches its method"""
+        assert convert_all(41.985, source) == {
+            target: CONVERTERS[source, target](41.985) for target in SCALES
+        }
+
+    def test_targets_and_tuple(self) -> None:
+        """Tests that only the targets are converted, in their order"""
+        assert convert_all(100, 'C', ['F', 'K'], output='tuple') == (
+            212.0,
+            373.15,
+        )
+
+    def test_trunc_ret(self) -> None:
+        """Tests that results are truncated into ints"""
+        assert convert_all(100, 'C', ['Ra', 'Ro'], float_ret=False) == {
+            'rankine': 671,
+            'romer': 60,
+        }
+
+    def test_fast(self) -> None:
+        """Tests that the fast conversions go through Kelvin"""
+        results = convert_all(100, 'C', ['F', 'De'], exact=False)
+        assert math.isclose(results['fahrenheit'], 212.0)
+        assert math.isclose(results['delisle'], 0.0, abs_tol=1e-12)
+
+    def test_record(self, np) -> None:
+        """Tests that a single value gives a single record"""
+        record = convert_all(100, 'C', ['F', 'K'], output='record')
+        assert record.shape == ()
+        assert record['fahrenheit'] == 212.0
+
+    def test_wrong_arguments(self) -> None:
+        """Tests that unknown outputs and wrong targets are rejected"""
+        with pytest.raises(ValueError):
+            convert_all(1, 'C', output='list')
+        with pytest.raises(ValueError):
+            convert_all(1, 'C', ['F', 'fahrenheit'])
+        with pytest.raises(ValueError):
+            convert_all([1.0, 2.0], 'C', [], output='record')
+
+
+class TestArrays:
+    """Tests the conversion of arrays into every scale in one pass"""
+
+    @pytest.mark.parametrize('output', ['dict', 'tuple', 'record'])
+    @pytest.mark.parametrize('float_ret', [True, False])
+    def test_same_results_as_methods(
+        self, np, output: str, float_ret: bool
+    ) -> None:
+        """Tests that every target matches its method, in chunks"""
+        values = np.array(SAMPLES * 3).reshape(3, -1)
+        results = convert_all(
+            values, 'De', output=output, float_ret=float_ret, chunk_size=7
+        )
+        for index, target in enumerate(SCALES):
+            result = results[index if output == 'tuple' else target]
+            assert result.shape == values.shape
+            assert result.ravel().tolist() == [
+                CONVERTERS['delisle', target](value, float_ret=float_ret)
+                for value in SAMPLES * 3
+            ]
+
+    def test_record_dtype(self, np) -> None:
+        """Tests that records have a field per target"""
+        records = convert_all(SAMPLES, 'K', ['C', 'F'], output='record')
+        assert records.dtype.names == ('celsius', 'fahrenheit')
+        assert records.shape == (len(SAMPLES),)
+
+    @pytest.mark.parametrize('output', ['dict', 'record'])
+    def test_fast(self, np, output: str) -> None:
+        """Tests that the fast conversions are close to the methods"""
+        results = convert_all(SAMPLES, 'C', exact=False, output=output)
+        for target in SCALES:
+            np.testing.assert_allclose(
+                results[target],
+                [CONVERTERS['celsius', target](value) for value in SAMPLES],
+                atol=1e-9,
+            )
+
+    def test_trunc_nan(self, np) -> None:
+        """Tests that NaN can't be truncated into records"""
+        with pytest.raises(ValueError):
+            convert_all([1.0, math.nan], 'C', float_ret=False, output='record')
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+
+from totemp import Celsius, Kelvin
+from totemp.files import convert_file
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+def write(path: Path, typecode: str, values: list) -> Path:
+    """Writes the values as a raw binary file"""
+    path.write_bytes(array(typecode, values).tobytes())
+    return path
+
+
+def read(path: Path, typecode: str) -> list:
+    """Reads the values of a raw binary file"""
+    values = array(typecode)
+    values.frombytes(path.read_bytes())
+    return values.tolist()
+
+
+class TestConvertFile:
+    """Tests the memory-mapped conversion of files in files.py"""
+
+    def test_in_place(self, tmp_path: Path) -> None:
+        """Tests that a float64 file is converted in place"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        assert convert_file(path, 'C', 'F') == len(SAMPLES)
+        assert read(path, 'd') == [
+            Celsius.to_fahrenheit(value) for value in SAMPLES
+        ]
+
+    def test_out_path(self, tmp_path: Path) -> None:
+        """Tests that the input is kept when there is an output file"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        out_path = tmp_path / 'out.bin'
+        convert_file(path, 'K', 'C', out_path=out_path)
+        assert read(path, 'd') == SAMPLES
+        assert read(out_path, 'd') == [
+            Kelvin.to_celsius(value) for value in SAMPLES
+        ]
+
+    def test_out_path_is_path(self, tmp_path: Path) -> None:
+        """Tests that an out_path naming the input converts it in place"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        convert_file(path, 'C', 'K', out_path=tmp_path / '.' / 'values.bin')
+        assert read(path, 'd') == [
+            Celsius.to_kelvin(value) for value in SAMPLES
+        ]
+
+    def test_float32(self, tmp_path: Path) -> None:
+        """Tests float32 files"""
+        path = write(tmp_path / 'values.bin', 'f', SAMPLES)
+        convert_file(path, 'C', 'K', typecode='f')
+        assert (
+            read(path, 'f')
+            == array(
+                'f',
+                [Celsius.to_kelvin(value) for value in array('f', SAMPLES)],
+            ).tolist()
+        )
+
+    def test_into_other_typecode(self, tmp_path: Path) -> None:
+        """Tests that float64 values can be written as float32 results"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        out_path = tmp_path / 'out.bin'
+        convert_file(path, 'C', 'K', out_path=out_path, out_typecode='f')
+        assert (
+            read(out_path, 'f')
+            == array(
+                'f', [Celsius.to_kelvin(value) for value in SAMPLES]
+            ).tolist()
+        )
+
+    def test_trunc_ret(self, tmp_path: Path) -> None:
+        """Tests that truncated values are written as ints"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        convert_file(path, 'C', 'N', out_typecode='q', float_ret=False)
+        assert read(path, 'q') == [
+            Celsius.to_newton(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_many_windows(self, tmp_path: Path) -> None:
+        """Tests files bigger than a window, with a partial last one"""
+        values = [value / 7 for value in range(20_000)]
+        path = write(tmp_path / 'values.bin', 'd', values)
+        out_path = tmp_path / 'out.bin'
+        convert_file(path, 'C', 'F', out_path=out_path, window_size=1)
+        assert read(out_path, 'd') == [
+            Celsius.to_fahrenheit(value) for value in values
+        ]
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Tests that empty files have nothing to convert"""
+        path = write(tmp_path / 'values.bin', 'd', [])
+        assert convert_file(path, 'C', 'F', out_path=tmp_path / 'out.bin') == 0
+        assert (tmp_path / 'out.bin').read_bytes() == b''
+
+    def test_partial_value(self, tmp_path: Path) -> None:
+        """Tests that files must hold whole values"""
+        path = tmp_path / 'values.bin'
+        path.write_bytes(bytes(12))
+        with pytest.raises(ValueError):
+            convert_file(path, 'C', 'F')
+
+    def test_in_place_other_size(self, tmp_path: Path) -> None:
+        """Tests that files converted in place must keep the item size"""
+        path = write(tmp_path / 'values.bin', 'd', SAMPLES)
+        with pytest.raises(ValueError):
+            convert_file(path, 'C', 'F', out_typecode='f')
+
+    def test_cli(self, tmp_path: Path) -> None:
+        """Tests the --binary switch of the command-line interface"""
+        path = write(tmp_path / 'values.bin', 'f', SAMPLES)
+        subprocess.run(
+            [
+                sys.executable,
+                '-m',
+                'totemp',
+                '-f',
+                'C',
+                '-t',
+                'F',
+                '--binary',
+                'f',
+                '--trunc',
+                str(path),
+            ],
+            check=True,
+        )
+        assert read(path, 'i') == [
+            Celsius.to_fahrenheit(value, float_ret=False)
+            for value in array('f', SAMPLES)
+        ]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+from collections.abc import Callable
+from fractions import Fraction
+
+import pytest
+
+from totemp.fixed import ROUNDING_MODES, convert_fixed, convert_fixed_array
+from totemp.scales import SCALES, affine
+
+SAMPLES = [-459_670, -40_000, -12_500, -1, 0, 1, 100, 41_985, 373_150]
+
+ROUNDINGS: dict[str, Callable[[Fraction], float | int]] = {
+    'floor': math.floor,
+    'ceil': math.ceil,
+    'trunc': math.trunc,
+    'half_up': lambda value: math.copysign(
+        math.floor(abs(value) + Fraction(1, 2)), value
+    ),
+    'half_even': round,
+}
+
+
+def exact(value: int, source: str, target: str, unit=1000) -> Fraction:
+    """Converts a fixed-point value with fractions, without rounding"""
+    scale, offset = affine(source, target)
+    return (Fraction(value, unit) * scale + offset) * unit
+
+
+class TestConvertFixed:
+    """Tests the integer conversion of fixed-point values in fixed.py"""
+
+    @pytest.mark.parametrize('rounding', ROUNDING_MODES)
+    @pytest.mark.parametrize('source', SCALES)
+    @pytest.mark.parametrize('target', SCALES)
+    def test_exact_rounded_once(
+        self, source: str, target: str, rounding: str
+    ) -> None:
+        """Tests that results are the exact conversions, rounded once"""
+        for value in SAMPLES:
+            assert convert_fixed(
+                value, source, target, rounding=rounding
+            ) == ROUNDINGS[rounding](exact(value, source, target))
+
+    def test_milli_degrees(self) -> None:
+        """Tests conversions of milli-degrees"""
+        assert convert_fixed(212_000, 'F', 'C') == 100_000
+        assert convert_fixed(-40_000, 'C', 'F') == -40_000
+        assert convert_fixed(25_000, 'C', 'Ro') == 20_625
+
+    def test_units(self) -> None:
+        """Tests results in other units than the values"""
+        assert convert_fixed(2_515, 'C', 'K', unit=100, out_unit=1) == 298
+        assert convert_fixed(986, 'F', 'C', unit=10, out_unit=1000) == 37_000
+
+    @pytest.mark.parametrize(
+        'rounding, expected',
+        [
+            ('floor', [-2, -1, 0, 1]),
+            ('ceil', [-1, 0, 1, 2]),
+            ('trunc', [-1, 0, 0, 1]),
+            ('half_up', [-2, -1, 1, 2]),
+            ('half_even', [-2, 0, 0, 2]),
+        ],
+    )
+    def test_ties(self, rounding: str, expected: list[int]) -> None:
+        """Tests the rounding modes on halves, e.g. -1.5 and 0.5"""
+        assert [
+            convert_fixed(
+                value, 'C', 'C', unit=2, out_unit=1, rounding=rounding
+            )
+            for value in (-3, -1, 1, 3)
+        ] == expected
+
+    def test_not_ints(self) -> None:
+        """Tests that floats are rejected"""
+        with pytest.raises(TypeError):
+            convert_fixed(1.5, 'C', 'F')  # type: ignore[arg-type]
+
+    def test_wrong_arguments(self) -> None:
+        """Tests that unknown rounding modes and units are rejected"""
+        with pytest.raises(ValueError):
+            convert_fixed(1, 'C', 'F', rounding='nearest')
+        with pytest.raises(ValueError):
+            convert_fixed(1, 'C', 'F', unit=0)
+
+
+class TestConvertFixedArray:
+    """Tests the batch integer conversion of fixed-point values"""
+
+    @pytest.mark.parametrize('rounding', ROUNDING_MODES)
+    @pytest.mark.parametrize('dtype', ['int32', 'int64'])
+    def test_same_results_as_scalars(
+        self, np, dtype: str, rounding: str
+    ) -> None:
+        """Tests that every element matches convert_fixed, in chunks"""
+        values = np.array(SAMPLES, dtype=dtype)
+        for source in SCALES:
+            for target in SCALES:
+                result = convert_fixed_array(
+                    values, source, target, rounding=rounding, chunk_size=4
+                )
+                assert result.dtype == np.int64
+                assert result.tolist() == [
+                    convert_fixed(value, source, target, rounding=rounding)
+                    for value in SAMPLES
+                ]
+
+    def test_out(self, np) -> None:
+        """Tests that the results are written into the given buffer"""
+        out = np.empty(len(SAMPLES), dtype=np.int32)
+        result = convert_fixed_array(SAMPLES, 'K', 'F', out=out)
+        assert result is out
+        assert out.tolist() == [
+            convert_fixed(value, 'K', 'F') for value in SAMPLES
+        ]
+
+    def test_out_not_contiguous(self, np) -> None:
+        """Tests that the results are written into strided buffers too"""
+        values = np.arange(-8000, 8000, 1000).reshape(4, 4)
+        out = np.zeros((4, 5), dtype=np.int64)[:, :4]
+        result = convert_fixed_array(values, 'C', 'F', out=out)
+        assert result is out
+        assert out.ravel().tolist() == [
+            convert_fixed(int(value), 'C', 'F') for value in values.ravel()
+        ]
+
+    def test_out_overflow(self, np) -> None:
+        """Tests that results not fitting into out are rejected"""
+        out = np.empty(1, dtype=np.int16)
+        with pytest.raises(OverflowError):
+            convert_fixed_array([100_000], 'C', 'K', out=out)
+
+    def test_int64_overflow(self, np) -> None:
+        """Tests that values overflowing int64 intermediates are rejected"""
+        with pytest.raises(OverflowError):
+            convert_fixed_array([2**62], 'F', 'C')
+
+    def test_not_ints(self, np) -> None:
+        """Tests that float arrays are rejected"""
+        with pytest.raises(TypeError):
+            convert_fixed_array(np.zeros(3), 'C', 'F')
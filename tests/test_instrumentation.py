@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from array import array
+
+import pytest
+
+import totemp
+from totemp import buffers, instrumentation
+from totemp.conversion import CONVERTERS
+from totemp.instrumentation import (
+    disable,
+    enable,
+    instrumented,
+    is_enabled,
+    reset,
+    snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    """Starts every test disabled and without any recording"""
+    disable()
+    reset()
+    yield
+    disable()
+    reset()
+
+
+class TestInstrumentation:
+    """Tests the recording of the conversions in instrumentation.py"""
+
+    def test_disabled_by_default(self) -> None:
+        """Tests that the original methods are used until it's enabled"""
+        method = CONVERTERS['celsius', 'kelvin']
+        totemp.Celsius.to_kelvin(1)
+        assert not is_enabled()
+        assert totemp.Celsius.to_kelvin is method
+        assert snapshot() == {}
+
+    def test_methods(self) -> None:
+        """Tests that calls of the methods are counted by key"""
+        with instrumented():
+            assert totemp.Celsius.to_fahrenheit(100) == 212.0
+            totemp.Celsius.to_fahrenheit(0)
+            totemp.Celsius.to_fahrenheit(0, float_ret=False)
+        stats = snapshot()
+        assert stats['celsius', 'fahrenheit', True]['calls'] == 2
+        assert stats['celsius', 'fahrenheit', True]['elements'] == 2
+        assert stats['celsius', 'fahrenheit', False]['calls'] == 1
+
+    def test_convert_and_temperature(self) -> None:
+        """Tests that convert and Temperature are counted too"""
+        with instrumented():
+            totemp.convert(1, 'K', 'Ro')
+            totemp.convert(1, 'K', 'Ro', exact=False)
+            totemp.convert(1, 'K', 'K')
+            totemp.Temperature(1, 'K').romer
+        stats = snapshot()
+        assert stats['kelvin', 'romer', True]['calls'] == 3
+        assert stats['kelvin', 'kelvin', True]['calls'] == 1
+
+    def test_histogram(self) -> None:
+        """Tests that every call is in one bucket of the histogram"""
+        with instrumented():
+            for value in range(10):
+                totemp.Delisle.to_newton(value)
+        stats = snapshot()['delisle', 'newton', True]
+        assert sum(stats['histogram'].values()) == 10
+        assert stats['seconds'] > 0
+        for bound in stats['histogram']:
+            assert bound & (bound - 1) == 0  # Powers of two
+
+    def test_batches(self) -> None:
+        """Tests that values converted in batches are counted"""
+        pytest.importorskip('numpy')
+        with instrumented():
+            buffers.convert_buffer(array('d', range(10)), 'F', 'K')
+        stats = snapshot()['fahrenheit', 'kelvin', True]
+        assert stats['calls'] == 1
+        assert stats['elements'] == 10
+
+    def test_disable_restores(self) -> None:
+        """Tests that disabling puts the original functions back"""
+        method = totemp.Romer.to_rankine
+        convert_array = getattr(buffers, 'convert_array', None)
+        enable()
+        enable()
+        assert totemp.Romer.to_rankine is not method
+        disable()
+        assert totemp.Romer.to_rankine is method
+        assert CONVERTERS['romer', 'rankine'] is method
+        assert getattr(buffers, 'convert_array', None) is convert_array
+
+    def test_reset(self) -> None:
+        """Tests that reset forgets what was recorded"""
+        with instrumented():
+            totemp.Kelvin.to_celsius(1)
+        reset()
+        assert snapshot() == {}
+
+    def test_nothing_recorded_when_disabled(self) -> None:
+        """Tests that calls after disabling aren't counted"""
+        with instrumented():
+            totemp.Kelvin.to_celsius(1)
+        totemp.Kelvin.to_celsius(1)
+        assert snapshot()['kelvin', 'celsius', True]['calls'] == 1
+        assert not instrumentation.is_enabled()
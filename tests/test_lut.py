@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+import struct
+from array import array
+from pathlib import Path
+
+import pytest
+
+from totemp import Celsius, Kelvin
+from totemp.lut import LookupTable, lookup_table
+
+FLOAT16_VALUES = struct.unpack('<65536e', bytes(array('H', range(65536))))
+
+
+class TestLookupTable:
+    """Tests the lookup tables in lut.py"""
+
+    def test_int_domain(self) -> None:
+        """Tests that every int of the domain is looked up as converted"""
+        table = LookupTable('C', 'F', -40, 150)
+        assert len(table) == 191
+        for value in range(-40, 151):
+            assert table(value) == Celsius.to_fahrenheit(value)
+
+    def test_int_domain_trunc_ret(self) -> None:
+        """Tests a table of truncated values"""
+        table = LookupTable('C', 'Ro', -40, 150, float_ret=False)
+        for value in range(-40, 151):
+            result = table(value)
+            assert result == Celsius.to_romer(value, float_ret=False)
+            assert isinstance(result, int)
+
+    def test_outside_domain(self) -> None:
+        """Tests that values outside the domain use the formula"""
+        table = LookupTable('C', 'F', -40, 150)
+        for value in [-41, 151, 20.5, 1e6]:
+            assert table(value) == Celsius.to_fahrenheit(value)
+
+    def test_float16_domain(self) -> None:
+        """Tests that every float16 value is looked up as converted"""
+        table = LookupTable('K', 'C', 'float16')
+        assert len(table) == 65536
+        for value in FLOAT16_VALUES[::97]:
+            if not math.isnan(value):
+                assert table(value) == Kelvin.to_celsius(value)
+
+    def test_float16_not_representable(self) -> None:
+        """Tests that values which aren't float16 use the formula"""
+        table = LookupTable('K', 'C', 'float16')
+        assert table(0.1) == Kelvin.to_celsius(0.1)
+        assert table(1e10) == Kelvin.to_celsius(1e10)
+
+    def test_float16_trunc_ret_nan(self) -> None:
+        """Tests that NaN can't be truncated, as with the formula"""
+        table = LookupTable('K', 'C', 'float16', float_ret=False)
+        with pytest.raises(ValueError):
+            table(math.nan)
+
+    def test_max_size(self) -> None:
+        """Tests that tables can't be bigger than max_size"""
+        with pytest.raises(ValueError):
+            LookupTable('C', 'F', 0, 1000, max_size=1000)
+
+    def test_empty_domain(self) -> None:
+        """Tests that empty domains are rejected"""
+        with pytest.raises(ValueError):
+            LookupTable('C', 'F', 10, 0)
+
+    def test_nbytes(self) -> None:
+        """Tests the memory used by a table"""
+        assert LookupTable('C', 'F', 0, 99).nbytes == 800
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Tests that a saved table is read back the same"""
+        table = LookupTable('C', 'N', -40, 150, float_ret=False)
+        table.save(tmp_path / 'table.lut')
+        loaded = LookupTable.load(tmp_path / 'table.lut')
+        assert repr(loaded) == repr(table)
+        assert [loaded(value) for value in range(-40, 151)] == [
+            table(value) for value in range(-40, 151)
+        ]
+
+    def test_load_other_file(self, tmp_path: Path) -> None:
+        """Tests that files which aren't tables are rejected"""
+        (tmp_path / 'table.lut').write_bytes(b'nothing')
+        with pytest.raises(ValueError):
+            LookupTable.load(tmp_path / 'table.lut')
+
+    def test_lookup_table_cache_dir(self, tmp_path: Path) -> None:
+        """Tests that tables are written into and read from cache_dir"""
+        first = lookup_table('C', 'F', 0, 10, cache_dir=tmp_path)
+        assert len(list(tmp_path.glob('*.lut'))) == 1
+        lookup_table.cache_clear()
+        second = lookup_table('C', 'F', 0, 10, cache_dir=tmp_path)
+        assert second is not first
+        assert repr(second) == repr(first)
+
+    def test_lookup_table_memory_cache(self) -> None:
+        """Tests that the same table is returned while in memory"""
+        assert lookup_table('C', 'F', 0, 10) is lookup_table('C', 'F', 0, 10)
+
+
+class TestLookupTableBatch:
+    """Tests the batch lookups of the tables in lut.py"""
+
+    def test_int_batch(self, np) -> None:
+        """Tests that a batch is looked up as converted"""
+        from totemp.arrays import convert_array
+
+        table = LookupTable('C', 'F', -40, 150, float_ret=False)
+        values = np.arange(-40, 151, dtype=np.int16)
+        assert (
+            table.batch(values).tolist()
+            == convert_array(values, 'C', 'F', float_ret=False).tolist()
+        )
+
+    def test_int_batch_outside_domain(self, np) -> None:
+        """Tests that values outside the domain use the formula"""
+        table = LookupTable('C', 'F', -40, 150)
+        values = np.array([-100, -40, 0, 150, 151, 1000])
+        assert table.batch(values).tolist() == [
+            Celsius.to_fahrenheit(int(value)) for value in values
+        ]
+
+    def test_float16_batch(self, np) -> None:
+        """Tests that every float16 value is looked up as converted"""
+        table = LookupTable('K', 'C', 'float16')
+        values = np.array(FLOAT16_VALUES, dtype=np.float16)
+        finite = np.isfinite(values)
+        assert table.batch(values[finite]).tolist() == [
+            Kelvin.to_celsius(float(value)) for value in values[finite]
+        ]
+
+    def test_out(self, np) -> None:
+        """Tests that the results are written into the given buffer"""
+        table = LookupTable('C', 'K', 0, 9)
+        out = np.empty(10)
+        assert table.batch(np.arange(10), out=out) is out
+
+    def test_float_batch(self, np) -> None:
+        """Tests that int tables only look up ints"""
+        with pytest.raises(TypeError):
+            LookupTable('C', 'K', 0, 9).batch(np.arange(10.0))
+
+    def test_float16_batch_trunc_ret_nan(self, np) -> None:
+        """Tests that NaN can't be truncated, as with the formula"""
+        table = LookupTable('K', 'C', 'float16', float_ret=False)
+        with pytest.raises(ValueError):
+            table.batch(np.array([1, np.nan], dtype=np.float16))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from totemp import Celsius, converter
+from totemp.memo import MemoizedConverter
+
+SAMPLES = [-459.67, -40, -12.5, -0.0, 0, 0.1, 20.25, 41.985, 100, 373.15]
+
+
+class TestMemoizedConverter:
+    """Tests the cached conversions of memo.py"""
+
+    def test_same_results_as_converter(self) -> None:
+        """Tests that results match the converter, cached or not"""
+        memoized = MemoizedConverter('C', 'Re')
+        function = converter('C', 'Re')
+        for _ in range(2):
+            for value in SAMPLES:
+                assert repr(memoized(value)) == repr(function(value))
+
+    def test_stats(self) -> None:
+        """Tests the counting of hits, misses and evictions"""
+        memoized = MemoizedConverter('C', 'F', max_size=2)
+        for value in (1.5, 2.5, 1.5, 3.5, 2.5):
+            memoized(value)
+        assert memoized.stats() == {
+            'hits': 1,
+            'misses': 4,
+            'evictions': 2,
+            'size': 2,
+            'max_size': 2,
+        }
+        memoized.clear()
+        assert memoized.stats()['misses'] == len(memoized) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Tests that the least recently used result is evicted"""
+        memoized = MemoizedConverter('C', 'F', max_size=2)
+        memoized(1.5)
+        memoized(2.5)
+        memoized(1.5)
+        memoized(3.5)  # Evicts 2.5, used before 1.5
+        memoized(1.5)
+        assert memoized.hits == 2
+
+    def test_typed_keys(self) -> None:
+        """Tests that ints and floats of equal values are kept apart"""
+        memoized = MemoizedConverter('C', 'K', float_ret=False)
+        assert memoized(1) == 274
+        assert memoized(1.0) == 274
+        assert memoized.misses == 2
+
+    def test_zeros_and_nan(self) -> None:
+        """Tests that -0.0 keeps its sign and NaN isn't cached"""
+        memoized = MemoizedConverter('K', 'K')
+        memoized(0.0)
+        assert math.copysign(1, memoized(-0.0)) == -1
+        assert math.isnan(memoized(math.nan))
+        assert len(memoized) == 0
+
+    def test_thread_safe(self) -> None:
+        """Tests that threads can share a locked converter"""
+        memoized = MemoizedConverter('C', 'Ro', thread_safe=True)
+        values = [value / 10 for value in range(1, 500)] * 4
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(memoized, values))
+        assert results == [Celsius.to_romer(value) for value in values]
+        stats = memoized.stats()
+        assert stats['hits'] + stats['misses'] == len(values)
+
+    def test_max_size(self) -> None:
+        """Tests that caches must keep at least one result"""
+        with pytest.raises(ValueError):
+            MemoizedConverter('C', 'F', max_size=0)
+
+
+class TestBatch:
+    """Tests the deduped batch conversions of memo.py"""
+
+    def test_lists(self) -> None:
+        """Tests that each distinct value of a list is converted once"""
+        memoized = MemoizedConverter('C', 'Ro')
+        values = SAMPLES * 3
+        results = memoized.batch(values)
+        assert [repr(result) for result in results] == [
+            repr(Celsius.to_romer(value)) for value in values
+        ]
+        assert memoized.misses == len(SAMPLES) - 2  # but zeros
+
+    def test_arrays(self, np) -> None:
+        """Tests that arrays are converted by their unique values"""
+        memoized = MemoizedConverter('C', 'Re')
+        values = np.array(SAMPLES * 3).reshape(3, -1)
+        results = memoized.batch(values)
+        assert results.shape == values.shape
+        assert [repr(result) for result in results.ravel().tolist()] == [
+            repr(converter('C', 'Re')(value)) for value in SAMPLES * 3
+        ]
+
+    def test_int_arrays(self, np) -> None:
+        """Tests that int arrays are deduped too"""
+        memoized = MemoizedConverter('C', 'F', float_ret=False)
+        values = np.array([20, 21, 20, -40], dtype=np.int16)
+        assert memoized.batch(values).tolist() == [68, 69, 68, -40]
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from array import array
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from totemp import Celsius, Delisle, Fahrenheit, Kelvin
+from totemp.parallel import convert_parallel, convert_threaded
+
+VALUES = [value / 8 for value in range(-1000, 1000)]
+
+
+@pytest.fixture(scope='module')
+def executor():
+    """Pool of processes shared by the tests"""
+    with ProcessPoolExecutor(2) as pool:
+        yield pool
+
+
+class UnusedExecutor(Executor):
+    """Executor failing if anything is submitted to it"""
+
+    def submit(self, *args, **kwargs):
+        raise AssertionError('The executor should not be used')
+
+
+class TestConvertParallel:
+    """Tests the conversion with a pool of processes in parallel.py"""
+
+    def test_in_place(self, executor: Executor) -> None:
+        """Tests that the buffer is converted in place by the workers"""
+        values = array('d', VALUES)
+        convert_parallel(
+            values, 'C', 'F', chunk_size=300, threshold=0, executor=executor
+        )
+        assert values.tolist() == [
+            Celsius.to_fahrenheit(value) for value in VALUES
+        ]
+
+    def test_out_trunc_ret(self, executor: Executor) -> None:
+        """Tests that truncated values are written into an int buffer"""
+        out = array('q', bytes(8 * len(VALUES)))
+        convert_parallel(
+            array('d', VALUES),
+            'K',
+            'C',
+            out=out,
+            float_ret=False,
+            chunk_size=300,
+            threshold=0,
+            executor=executor,
+        )
+        assert out.tolist() == [
+            Kelvin.to_celsius(value, float_ret=False) for value in VALUES
+        ]
+
+    def test_shared_memory(self, executor: Executor) -> None:
+        """Tests that values already in shared memory aren't copied"""
+        shared = SharedMemory(create=True, size=8 * len(VALUES))
+        try:
+            with shared.buf.cast('d') as items:
+                items[:] = array('d', VALUES)
+            with convert_parallel(
+                shared,
+                'F',
+                'K',
+                typecode='d',
+                chunk_size=300,
+                threshold=0,
+                executor=executor,
+            ) as results:
+                assert results.tolist() == [
+                    Fahrenheit.to_kelvin(value) for value in VALUES
+                ]
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_own_pool(self) -> None:
+        """Tests that a pool is started when no executor is given"""
+        values = array('d', VALUES)
+        convert_parallel(values, 'C', 'K', workers=2, threshold=0)
+        assert values.tolist() == [
+            Celsius.to_kelvin(value) for value in VALUES
+        ]
+
+    def test_below_threshold(self) -> None:
+        """Tests that small buffers are converted in this process"""
+        values = array('d', VALUES)
+        convert_parallel(
+            values,
+            'C',
+            'De',
+            threshold=len(VALUES) + 1,
+            executor=UnusedExecutor(),
+        )
+        assert values.tolist() == [
+            Celsius.to_delisle(value) for value in VALUES
+        ]
+
+    def test_wrong_length(self, executor: Executor) -> None:
+        """Tests that out must have as many items as the buffer"""
+        with pytest.raises(ValueError):
+            convert_parallel(
+                array('d', VALUES),
+                'C',
+                'K',
+                out=array('d', [0.0]),
+                threshold=0,
+                executor=executor,
+            )
+
+
+class TestConvertThreaded:
+    """Tests the conversion with a pool of threads in parallel.py"""
+
+    def test_same_results_as_methods(self, np) -> None:
+        """Tests that chunks converted by threads match the methods"""
+        result = convert_threaded(
+            VALUES, 'De', 'Ro', threads=3, chunk_size=300, threshold=0
+        )
+        assert result.tolist() == [Delisle.to_romer(value) for value in VALUES]
+
+    def test_trunc_ret(self, np) -> None:
+        """Tests that results are truncated into int64"""
+        result = convert_threaded(
+            VALUES,
+            'K',
+            'C',
+            float_ret=False,
+            threads=2,
+            chunk_size=300,
+            threshold=0,
+        )
+        assert result.dtype == np.int64
+        assert result.tolist() == [
+            Kelvin.to_celsius(value, float_ret=False) for value in VALUES
+        ]
+
+    def test_out(self, np) -> None:
+        """Tests that results are written into out, even if not contiguous"""
+        values = np.array(VALUES).reshape(40, 50)
+        out = np.empty((40, 50), order='F')
+        with ThreadPoolExecutor(2) as executor:
+            result = convert_threaded(
+                values,
+                'C',
+                'F',
+                out=out,
+                chunk_size=64,
+                threshold=0,
+                executor=executor,
+            )
+        assert result is out
+        assert out.ravel().tolist() == [
+            Celsius.to_fahrenheit(value) for value in VALUES
+        ]
+
+    def test_validation_index(self, np) -> None:
+        """Tests that invalid values are reported at their global index"""
+        values = np.array(VALUES).reshape(40, 50)
+        values[30, 7] = -300
+        with pytest.raises(ValueError, match=r'index \(30, 7\)'):
+            convert_threaded(
+                values,
+                'C',
+                'K',
+                validate='raise',
+                threads=2,
+                chunk_size=100,
+                threshold=0,
+            )
+
+    def test_validation_in_place(self, np) -> None:
+        """
+        Tests that an invalid value deep into a chunk is reported at its
+        index, leaving the array converted in place unchanged
+        """
+        values = np.full(400_000, 100.0)
+        values[300_000] = -5.0
+        with pytest.raises(ValueError, match=r'-5\.0 at index 300000'):
+            convert_threaded(
+                values,
+                'K',
+                'C',
+                out=values,
+                validate='raise',
+                threads=2,
+                chunk_size=200_000,
+                threshold=1,
+            )
+        assert values[0] == 100.0 and values[-1] == 100.0
+
+    def test_below_threshold(self, np) -> None:
+        """Tests that small arrays are converted in this thread"""
+        result = convert_threaded(
+            VALUES, 'C', 'K', threads=4, executor=UnusedExecutor()
+        )
+        assert result.tolist() == [
+            Celsius.to_kelvin(value) for value in VALUES
+        ]
+
+    def test_wrong_arguments(self, np) -> None:
+        """Tests that a wrong chunk size or out is rejected"""
+        with pytest.raises(ValueError):
+            convert_threaded(VALUES, 'C', 'K', chunk_size=0)
+        with pytest.raises(ValueError):
+            convert_threaded(
+                VALUES, 'C', 'K', out=np.empty(1), threads=2, threshold=0
+            )
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+
+import pytest
+
+from totemp import Celsius, Rankine, convert
+from totemp.precision import default_samples, ulp_distance, ulp_report
+from totemp.scales import COEFFICIENTS, SCALES
+
+
+class TestFastMode:
+    """Tests the fast (exact=False) conversions"""
+
+    def test_convert_fast(self) -> None:
+        """Tests that the fast mode is a single multiply-add"""
+        scale, offset = COEFFICIENTS['fahrenheit', 'romer']
+        assert convert(18.746, 'F', 'Ro', exact=False) == (
+            18.746 * scale + offset
+        )
+
+    def test_convert_fast_close_to_exact(self) -> None:
+        """Tests that the fast mode is close to the exact one"""
+        assert convert(41.985, 'C', 'F', exact=False) == pytest.approx(
+            Celsius.to_fahrenheit(41.985), rel=1e-15
+        )
+
+    def test_convert_fast_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned by the fast mode with default
+        parameter set to False
+        """
+        assert isinstance(
+            convert(41.985, 'C', 'F', float_ret=False, exact=False), int
+        )
+
+    def test_convert_fast_close_to_methods(self) -> None:
+        """Tests that the fast mode is close to the Rankine methods too"""
+        assert convert(500, 'Ra', 'C', exact=False) == pytest.approx(
+            Rankine.to_celsius(500), rel=1e-14
+        )
+
+
+class TestUlpReport:
+    """Tests the differential harness in precision.py"""
+
+    def test_ulp_distance_equal(self) -> None:
+        """Tests that equal floats are 0 ULPs apart"""
+        assert ulp_distance(1.5, 1.5) == 0
+        assert ulp_distance(0.0, -0.0) == 0
+
+    def test_ulp_distance_neighbours(self) -> None:
+        """Tests that neighbouring floats are 1 ULP apart"""
+        assert ulp_distance(1.0, math.nextafter(1.0, 2.0)) == 1
+        assert ulp_distance(-1.0, math.nextafter(-1.0, 0.0)) == 1
+        assert ulp_distance(0.0, math.nextafter(0.0, -1.0)) == 1
+
+    def test_ulp_distance_symmetric(self) -> None:
+        """Tests that the distance doesn't depend on the argument order"""
+        assert ulp_distance(2.5, 2.500001) == ulp_distance(2.500001, 2.5)
+
+    def test_default_samples_reproducible(self) -> None:
+        """Tests that the default samples are the same on every call"""
+        assert default_samples(count=10) == default_samples(count=10)
+
+    def test_report_covers_all_pairs(self) -> None:
+        """Tests that there is one report per pair of scales"""
+        reports = ulp_report([0.0, 1.0])
+        assert len(reports) == len(SCALES) ** 2
+        assert {(report.source, report.target) for report in reports} == {
+            (source, target) for source in SCALES for target in SCALES
+        }
+
+    def test_report_identity_pairs(self) -> None:
+        """Tests that the identity pairs don't lose any precision"""
+        for report in ulp_report(default_samples(count=100)):
+            if report.source == report.target:
+                assert report.max_ulps == 0
+
+    def test_report_worst_value(self) -> None:
+        """Tests that the worst value reproduces the reported difference"""
+        for report in ulp_report([-17.8, 20.25, 99.9]):
+            exact = convert(report.value, report.source, report.target)
+            fast = convert(
+                report.value, report.source, report.target, exact=False
+            )
+            assert ulp_distance(exact, fast) == report.max_ulps
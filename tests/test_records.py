@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin
+from totemp.records import Spec, convert_records
+
+SPEC: Spec = {'inlet_f': ('F', 'C'), 'outlet_k': ('kelvin', 'celsius', False)}
+
+Reading = namedtuple('Reading', ['inlet_f', 'outlet_k'])
+
+
+@dataclass
+class Record:
+    inlet_f: float
+    outlet_k: float | None = None
+
+
+def rows() -> list[dict]:
+    """Readings as decoded from JSON"""
+    return [
+        {'id': 1, 'inlet_f': 212.0, 'outlet_k': 300.5},
+        {'id': 2, 'inlet_f': -40, 'outlet_k': None},
+    ]
+
+
+class TestConvertRecords:
+    """Tests the conversion of columns of records in records.py"""
+
+    def test_dicts(self) -> None:
+        """Tests that new dicts are returned, with every column converted"""
+        records = rows()
+        results = convert_records(records, SPEC)
+        assert results == [
+            {'id': 1, 'inlet_f': 100.0, 'outlet_k': 27},
+            {'id': 2, 'inlet_f': -40.0, 'outlet_k': None},
+        ]
+        assert records == rows()
+
+    def test_in_place(self) -> None:
+        """Tests that the records themselves are converted in place"""
+        records = rows()
+        results = convert_records(records, SPEC, inplace=True)
+        assert results[0] is records[0]
+        assert records[0]['inlet_f'] == Fahrenheit.to_celsius(212.0)
+        assert records[0]['outlet_k'] == Kelvin.to_celsius(
+            300.5, float_ret=False
+        )
+
+    def test_float_ret(self) -> None:
+        """Tests that columns without their own float_ret use the default"""
+        results = convert_records(rows(), SPEC, float_ret=False)
+        assert results[0]['inlet_f'] == 100
+        assert isinstance(results[0]['inlet_f'], int)
+
+    def test_tuples(self) -> None:
+        """Tests tuples, lists and named tuples, by index or name"""
+        results = convert_records(
+            [(212.0, 300.5), [212.0, 300.5], Reading(212.0, 300.5)],
+            {0: ('F', 'C')},
+        )
+        assert results == [(100.0, 300.5), [100.0, 300.5], (100.0, 300.5)]
+        assert isinstance(results[2], Reading)
+        reading = convert_records([Reading(212.0, 300.5)], SPEC)[0]
+        assert reading == Reading(100.0, 27)
+
+    def test_dataclasses(self) -> None:
+        """Tests that dataclasses are replaced, or changed in place"""
+        record = Record(212.0, 300.5)
+        assert convert_records([record], SPEC) == [Record(100.0, 27)]
+        assert record == Record(212.0, 300.5)
+        convert_records([record], SPEC, inplace=True)
+        assert record == Record(100.0, 27)
+
+    def test_mixed_types(self) -> None:
+        """Tests that records of several types are converted in order"""
+        records = [Record(0), {'inlet_f': 0}, Record(32), {'inlet_f': 32}]
+        results = convert_records(records, {'inlet_f': ('C', 'F')})
+        assert [
+            getattr(result, 'inlet_f', None) or result['inlet_f']
+            for result in results
+        ] == [Celsius.to_fahrenheit(value) for value in (0, 0, 32, 32)]
+
+    def test_generators(self) -> None:
+        """Tests that any iterable of records is converted"""
+        results = convert_records((row for row in rows()), SPEC)
+        assert len(results) == 2
+        assert convert_records([], SPEC) == []
+
+    def test_read_only(self) -> None:
+        """Tests that records that can't be changed are rejected"""
+        with pytest.raises(TypeError):
+            convert_records([(212.0, 300.5)], {0: ('F', 'C')}, inplace=True)
+        with pytest.raises(TypeError):
+            convert_records([MappingProxyType(rows()[0])], SPEC)
+
+    def test_wrong_spec(self) -> None:
+        """Tests that conversions must be 2- or 3-tuples of known scales"""
+        with pytest.raises(ValueError):
+            convert_records(rows(), {'inlet_f': ('F',)})  # type: ignore
+        with pytest.raises(ValueError):
+            convert_records(rows(), {'inlet_f': ('F', 'X')})
+        with pytest.raises(KeyError):
+            convert_records(rows(), {'missing': ('F', 'C')})
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from array import array
+
+import pytest
+
+from totemp import Celsius, Delisle, Fahrenheit, buffers
+from totemp.scales import COEFFICIENTS
+from totemp.series import TemperatureSeries
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+@pytest.fixture(params=['numpy', 'python'], autouse=True)
+def implementation(request, monkeypatch) -> str:
+    """Runs every test with and without NumPy"""
+    if request.param == 'python':
+        monkeypatch.setattr(buffers, 'np', None)
+    elif buffers.np is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+class TestTemperatureSeries:
+    """Tests the lazy series of series.py"""
+
+    def test_same_scale(self) -> None:
+        """Tests that a series reads back its own values"""
+        series = TemperatureSeries(SAMPLES, 'F')
+        assert series.scale == series.source == 'fahrenheit'
+        assert series.tolist() == SAMPLES
+
+    def test_view(self) -> None:
+        """Tests that a view matches the methods bit-for-bit"""
+        view = TemperatureSeries(array('d', SAMPLES), 'C').fahrenheit
+        assert view.scale == 'fahrenheit'
+        assert view.tolist() == [
+            Celsius.to_fahrenheit(value) for value in SAMPLES
+        ]
+
+    def test_chained_views(self) -> None:
+        """Tests that chained views convert straight from the stored scale"""
+        view = TemperatureSeries(SAMPLES, 'De').to('C').to('Ra')
+        assert view.source == 'delisle'
+        assert view.tolist() == [
+            Delisle.to_rankine(value) for value in SAMPLES
+        ]
+
+    def test_views_share_values(self) -> None:
+        """Tests that views read the values lazily, without copies"""
+        values = array('d', [0.0, 100.0])
+        view = TemperatureSeries(values, 'C').kelvin
+        values[0] = 1.0
+        assert view.tolist() == [274.15, 373.15]
+
+    def test_iter(self, monkeypatch) -> None:
+        """Tests that iterating converts the values chunk by chunk"""
+        monkeypatch.setattr('totemp.series.CHUNK_SIZE', 3)
+        view = TemperatureSeries(SAMPLES, 'F').celsius
+        assert list(view) == [
+            Fahrenheit.to_celsius(value) for value in SAMPLES
+        ]
+
+    def test_index(self) -> None:
+        """Tests that indexing converts a single value"""
+        view = TemperatureSeries(SAMPLES).newton
+        assert view[6] == Celsius.to_newton(41.985)
+        assert view[-1] == Celsius.to_newton(1324.799)
+
+    def test_slice(self) -> None:
+        """Tests that slices are views too, with or without a step"""
+        view = TemperatureSeries(SAMPLES, 'F').reaumur
+        assert len(view) == len(SAMPLES)
+        assert view[2:5].tolist() == view.tolist()[2:5]
+        assert view[::3].tolist() == view.tolist()[::3]
+
+    def test_empty(self) -> None:
+        """Tests that an empty series converts to nothing"""
+        view = TemperatureSeries([]).kelvin
+        assert len(view) == 0
+        assert list(view) == view.tolist() == []
+
+    def test_materialize(self) -> None:
+        """Tests that materializing stores the values in the view's scale"""
+        values = array('d', SAMPLES)
+        series = TemperatureSeries(values, 'C').romer.materialize()
+        values[0] = 0.0
+        assert series.source == series.scale == 'romer'
+        assert series.tolist() == [
+            Celsius.to_romer(value) for value in SAMPLES
+        ]
+
+    def test_fast(self) -> None:
+        """Tests that the fast mode is the fused multiply-add of the pair"""
+        scale, offset = COEFFICIENTS['delisle', 'rankine']
+        view = TemperatureSeries(SAMPLES, 'De', exact=False).celsius.rankine
+        assert view.tolist() == [value * scale + offset for value in SAMPLES]
+        assert view[4] == SAMPLES[4] * scale + offset
+
+    def test_numpy_export(self) -> None:
+        """Tests that NumPy arrays are shared and that views export to NumPy"""
+        np = pytest.importorskip('numpy')
+        values = np.array(SAMPLES, dtype=np.float32)
+        view = TemperatureSeries(values, 'C').fahrenheit
+        result = np.asarray(view)
+        assert result.dtype == np.float64
+        assert result.tolist() == [
+            Celsius.to_fahrenheit(float(value)) for value in values
+        ]
+
+    def test_numpy_not_contiguous(self) -> None:
+        """Tests that sliced and transposed arrays are copied in order"""
+        np = pytest.importorskip('numpy')
+        values = np.array(SAMPLES * 2).reshape(2, -1)
+        for readings in (values[0, ::2], values.T):
+            view = TemperatureSeries(readings, 'C').fahrenheit
+            assert view.tolist() == [
+                Celsius.to_fahrenheit(value) for value in readings.ravel()
+            ]
+
+    def test_repr(self) -> None:
+        """Tests the representation of series and views"""
+        series = TemperatureSeries([1, 2], 'K')
+        assert repr(series) == '<TemperatureSeries of 2 readings in kelvin>'
+        assert repr(series.celsius) == (
+            '<TemperatureSeries of 2 readings in celsius, stored in kelvin>'
+        )
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            TemperatureSeries(SAMPLES).to('plank')
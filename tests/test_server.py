@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import http.client
+import json
+import struct
+import threading
+from typing import Any, Iterator
+
+import pytest
+
+from totemp import Celsius, Kelvin
+from totemp.server import make_server
+
+SAMPLES = [-459.67, -40, -12.5, 0, 0.1, 20.25, 41.985, 100, 373.15, 1324.799]
+
+
+@pytest.fixture(scope='module')
+def address() -> Iterator[tuple[str, int]]:
+    """Runs a server on a free port during the tests"""
+    server = make_server('127.0.0.1', 0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield '127.0.0.1', server.server_port
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connection(address) -> Iterator[http.client.HTTPConnection]:
+    """Persistent connection to the server"""
+    host, port = address
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    yield connection
+    connection.close()
+
+
+def request(
+    connection: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    body: Any = None,
+    content_type: str = 'application/json',
+) -> tuple[int, bytes]:
+    """Sends a request, returning the status and body of the response"""
+    connection.request(
+        method, path, body=body, headers={'Content-Type': content_type}
+    )
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+class TestServer:
+    """Tests the conversion server of server.py"""
+
+    def test_single(self, connection) -> None:
+        """Tests the conversion of one value"""
+        status, body = request(
+            connection, 'GET', '/convert?value=41.985&source=C&target=F'
+        )
+        assert status == 200
+        assert json.loads(body) == {'result': Celsius.to_fahrenheit(41.985)}
+
+    def test_single_trunc_ret(self, connection) -> None:
+        """Tests that float_ret=false returns an int"""
+        status, body = request(
+            connection,
+            'GET',
+            '/convert?value=300.5&source=K&target=C&float_ret=false',
+        )
+        assert json.loads(body) == {'result': 27}
+
+    def test_batch_json(self, connection) -> None:
+        """Tests the conversion of a JSON array"""
+        status, body = request(
+            connection,
+            'POST',
+            '/convert/batch?source=C&target=F',
+            json.dumps(SAMPLES),
+        )
+        assert status == 200
+        assert json.loads(body) == {
+            'results': [Celsius.to_fahrenheit(value) for value in SAMPLES]
+        }
+
+    def test_batch_binary(self, connection) -> None:
+        """Tests the conversion of packed float64 values"""
+        status, body = request(
+            connection,
+            'POST',
+            '/convert/batch?source=K&target=C&float_ret=false',
+            struct.pack(f'<{len(SAMPLES)}d', *SAMPLES),
+            'application/octet-stream',
+        )
+        assert status == 200
+        assert list(struct.unpack(f'<{len(SAMPLES)}q', body)) == [
+            Kelvin.to_celsius(value, float_ret=False) for value in SAMPLES
+        ]
+
+    def test_keep_alive(self, connection) -> None:
+        """Tests that many requests, even failing, share a connection"""
+        request(connection, 'GET', '/convert?value=1&source=C&target=K')
+        socket = connection.sock
+        for path in ('/convert/batch?source=C', '/unknown', '/convert/batch'):
+            status, _ = request(connection, 'POST', path, b'[1]')
+            assert status >= 400
+        status, _ = request(
+            connection, 'GET', '/convert?value=1&source=C&target=K'
+        )
+        assert status == 200
+        assert connection.sock is socket
+
+    @pytest.mark.parametrize(
+        'method, path, body, content_type, expected',
+        [
+            ('GET', '/convert?value=1&source=C&target=X', None, '', 400),
+            ('GET', '/convert?value=a&source=C&target=F', None, '', 400),
+            ('GET', '/convert?source=C&target=F', None, '', 400),
+            (
+                'GET',
+                '/convert?value=1&source=C&target=F&exact=no',
+                None,
+                '',
+                400,
+            ),
+            ('GET', '/convert?value=NaN&source=C&target=F', None, '', 400),
+            ('GET', '/convert?value=1e308&source=C&target=F', None, '', 400),
+            ('GET', '/convert/batch', None, '', 405),
+            ('GET', '/', None, '', 404),
+            ('POST', '/convert/batch?source=C&target=F', b'{}', '', 400),
+            (
+                'POST',
+                '/convert/batch?source=C&target=F',
+                b'[1, -Infinity]',
+                '',
+                400,
+            ),
+            ('POST', '/convert/batch?source=C&target=F', b'[1e308]', '', 400),
+            (
+                'POST',
+                '/convert/batch?source=C&target=F',
+                b'[1, true]',
+                '',
+                400,
+            ),
+            ('POST', '/convert/batch?source=C&target=C', b'["12"]', '', 400),
+            ('POST', '/convert/batch?source=C&target=C', b'[null]', '', 400),
+            (
+                'POST',
+                '/convert/batch?source=C&target=F',
+                b'123',
+                'application/octet-stream',
+                400,
+            ),
+            (
+                'POST',
+                '/convert/batch?source=C&target=F',
+                b'1',
+                'text/csv',
+                415,
+            ),
+        ],
+    )
+    def test_errors(
+        self,
+        connection,
+        method: str,
+        path: str,
+        body: Any,
+        content_type: str,
+        expected: int,
+    ) -> None:
+        """Tests that wrong requests are answered with a JSON error"""
+        status, answer = request(
+            connection, method, path, body, content_type or 'application/json'
+        )
+        assert status == expected
+        assert 'error' in json.loads(answer, parse_constant=pytest.fail)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from decimal import Decimal
+from itertools import count, islice
+
+import pytest
+
+from totemp import Celsius, Delisle, Fahrenheit, streams
+from totemp.streams import convert_async, convert_batches, convert_iter
+
+VALUES = [value / 8 for value in range(-1000, 1000)]
+
+
+@pytest.fixture(params=['numpy', 'python'], autouse=True)
+def implementation(request, monkeypatch) -> str:
+    """Runs every test with and without NumPy"""
+    if request.param == 'python':
+        monkeypatch.setattr(streams, 'np', None)
+    elif streams.np is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+async def feed(values, pause_after=None, delay=0.05):
+    """Async stream of the values, pausing after the given index"""
+    for index, value in enumerate(values):
+        yield value
+        if index == pause_after:
+            await asyncio.sleep(delay)
+
+
+async def collect(stream) -> list:
+    """Gathers everything an async iterator yields"""
+    return [item async for item in stream]
+
+
+class RecordingExecutor(Executor):
+    """Thread pool counting the calls submitted to it"""
+
+    def __init__(self) -> None:
+        self.pool = ThreadPoolExecutor(1)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return self.pool.submit(*args, **kwargs)
+
+
+class TestConvertAsync:
+    """Tests the async micro-batching conversion in streams.py"""
+
+    def test_results(self) -> None:
+        """Tests that the results are the ones of the methods, in order"""
+        results = asyncio.run(collect(convert_async(feed(VALUES), 'C', 'F')))
+        assert results == [Celsius.to_fahrenheit(value) for value in VALUES]
+
+    def test_trunc_ret(self) -> None:
+        """Tests that the results are truncated with float_ret=False"""
+        results = asyncio.run(
+            collect(convert_async(feed(VALUES), 'F', 'C', float_ret=False))
+        )
+        assert results == [
+            Fahrenheit.to_celsius(value, float_ret=False) for value in VALUES
+        ]
+
+    def test_batch_size(self) -> None:
+        """Tests that batches are bounded by batch_size"""
+        batches = asyncio.run(
+            collect(convert_batches(feed(range(10)), 'C', 'K', batch_size=4))
+        )
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+
+    def test_max_delay(self) -> None:
+        """Tests that a batch is converted when the stream stalls"""
+        stream = convert_batches(
+            feed(range(10), pause_after=4), 'C', 'K', batch_size=8
+        )
+        batches = asyncio.run(collect(stream))
+        assert [len(batch) for batch in batches] == [5, 5]
+
+    def test_backpressure(self) -> None:
+        """Tests that readings aren't awaited while the queue is full"""
+        read = []
+
+        async def readings():
+            for value in range(100):
+                read.append(value)
+                yield value
+
+        async def consume() -> int:
+            stream = convert_batches(
+                readings(), 'C', 'K', batch_size=5, max_pending=2
+            )
+            await anext(stream)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await stream.aclose()
+            return len(read)
+
+        # One batch taken, two waiting in the queue and one being gathered
+        assert asyncio.run(consume()) <= 5 * 4
+
+    def test_offload(self) -> None:
+        """Tests that large batches are converted in the executor"""
+        executor = RecordingExecutor()
+        stream = convert_async(
+            feed(VALUES),
+            'K',
+            'C',
+            batch_size=500,
+            offload_size=500,
+            executor=executor,
+        )
+        results = asyncio.run(collect(stream))
+        executor.pool.shutdown()
+        assert executor.calls == 4
+        assert results == [value - 273.15 for value in VALUES]
+
+    def test_error(self) -> None:
+        """Tests that errors of the stream are raised to the consumer"""
+
+        async def readings():
+            yield 1.0
+            raise OSError('feed lost')
+
+        with pytest.raises(OSError, match='feed lost'):
+            asyncio.run(collect(convert_async(readings(), 'C', 'K')))
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            asyncio.run(collect(convert_async(feed(VALUES), 'C', 'plank')))
+
+
+class TestConvertIter:
+    """Tests the chunked conversion of iterables in streams.py"""
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1024, 5000])
+    def test_results(self, chunk_size: int) -> None:
+        """Tests that the results are the ones of the methods, in order"""
+        results = convert_iter(iter(VALUES), 'De', 'Ro', chunk_size=chunk_size)
+        assert list(results) == [Delisle.to_romer(value) for value in VALUES]
+
+    def test_trunc_ret(self) -> None:
+        """Tests that the results are truncated with float_ret=False"""
+        results = convert_iter(VALUES, 'C', 'F', float_ret=False)
+        assert list(results) == [
+            Celsius.to_fahrenheit(value, float_ret=False) for value in VALUES
+        ]
+
+    def test_ints(self) -> None:
+        """Tests that ints give the same results as with the methods"""
+        results = convert_iter(range(-50, 50), 'F', 'C')
+        assert list(results) == [
+            Fahrenheit.to_celsius(value) for value in range(-50, 50)
+        ]
+
+    def test_lazy(self) -> None:
+        """Tests that endless iterables are converted a chunk at a time"""
+        results = convert_iter(count(), 'C', 'K', chunk_size=10)
+        assert list(islice(results, 3)) == [273.15, 274.15, 275.15]
+
+    def test_not_floats(self) -> None:
+        """Tests that other numbers are converted by the methods"""
+        with pytest.raises(TypeError):
+            list(convert_iter([Decimal('1.5')], 'C', 'K'))  # type: ignore
+
+    def test_chunk_size(self) -> None:
+        """Tests that chunks must have at least one value"""
+        with pytest.raises(ValueError):
+            list(convert_iter(VALUES, 'C', 'K', chunk_size=0))
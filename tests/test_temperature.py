@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import heapq
+import pickle
+import sys
+
+import pytest
+
+from totemp import Celsius, Fahrenheit, Kelvin, Temperature
+
+
+class TestTemperature:
+    """Tests the Temperature value type in temperature.py"""
+
+    def test_value_and_scale(self) -> None:
+        """Tests that the value is kept as given, in its scale"""
+        temperature = Temperature(41.985, 'C')
+        assert temperature.value == 41.985
+        assert temperature.scale == 'celsius'
+
+    def test_default_scale(self) -> None:
+        """Tests that temperatures are in Celsius by default"""
+        assert Temperature(20).scale == 'celsius'
+
+    def test_views(self) -> None:
+        """Tests that the views match the methods of the classes"""
+        temperature = Temperature(41.985, 'C')
+        assert temperature.fahrenheit == Celsius.to_fahrenheit(41.985)
+        assert temperature.kelvin == Celsius.to_kelvin(41.985)
+        assert temperature.delisle == Celsius.to_delisle(41.985)
+        assert temperature.newton == Celsius.to_newton(41.985)
+        assert temperature.rankine == Celsius.to_rankine(41.985)
+        assert temperature.reaumur == Celsius.to_reaumur(41.985)
+        assert temperature.romer == Celsius.to_romer(41.985)
+        assert temperature.celsius == 41.985
+
+    def test_views_cached(self) -> None:
+        """Tests that a view is computed only once"""
+        temperature = Temperature(18.746, 'F')
+        assert temperature.newton is temperature.newton
+        assert temperature.newton == Fahrenheit.to_newton(18.746)
+
+    def test_views_in_slots(self) -> None:
+        """Tests that reading views doesn't make temperatures bigger"""
+        temperature = Temperature(18.746, 'F')
+        size = sys.getsizeof(temperature)
+        temperature.newton
+        temperature.kelvin
+        assert sys.getsizeof(temperature) == size
+
+    def test_numpy_values(self) -> None:
+        """Tests temperatures of NumPy ints and floats"""
+        np = pytest.importorskip('numpy')
+        assert Temperature(np.int64(100), 'C') == Temperature(100, 'C')
+        assert Temperature(np.uint8(32), 'F') == Temperature(0, 'C')
+        assert Temperature(np.float32(0.5), 'C') == Temperature(0.5, 'C')
+
+    def test_slots(self) -> None:
+        """Tests that temperatures have no __dict__"""
+        with pytest.raises(AttributeError):
+            Temperature(1).__dict__
+
+    def test_equality_across_scales(self) -> None:
+        """Tests that the same temperature in other scales is equal"""
+        assert Temperature(0, 'C') == Temperature(273.15, 'K')
+        assert Temperature(100, 'C') == Temperature(212, 'F')
+        assert Temperature(0, 'C') != Temperature(0, 'F')
+
+    def test_hash_across_scales(self) -> None:
+        """Tests that equal temperatures are the same dict key"""
+        readings = {Temperature(0, 'C'): 'freezing'}
+        assert readings[Temperature(273.15, 'K')] == 'freezing'
+        assert len({Temperature(0, 'C'), Temperature(32, 'F')}) == 1
+
+    def test_ordering(self) -> None:
+        """Tests that temperatures are ordered by their Kelvin value"""
+        temperatures = [
+            Temperature(300, 'K'),
+            Temperature(100, 'F'),
+            Temperature(0, 'C'),
+        ]
+        assert sorted(temperatures) == [
+            Temperature(0, 'C'),
+            Temperature(300, 'K'),
+            Temperature(100, 'F'),
+        ]
+        assert Temperature(0, 'C') < Temperature(1, 'C') <= Temperature(1, 'C')
+
+    def test_heap(self) -> None:
+        """Tests that temperatures can be kept in heaps"""
+        heap: list = []
+        for value in [30, -10, 20]:
+            heapq.heappush(heap, Temperature(value, 'C'))
+        assert heapq.heappop(heap) == Temperature(-10, 'C')
+
+    def test_compare_with_numbers(self) -> None:
+        """Tests that temperatures are not equal to bare numbers"""
+        assert Temperature(0, 'C') != 0
+        with pytest.raises(TypeError):
+            Temperature(0, 'C') < 1
+
+    def test_to(self) -> None:
+        """Tests the conversion into a temperature in another scale"""
+        converted = Temperature(44.28137746, 'K').to('Re')
+        assert converted.scale == 'reaumur'
+        assert converted.value == Kelvin.to_reaumur(44.28137746)
+
+    def test_to_equal(self) -> None:
+        """Tests that converted temperatures are equal to the original"""
+        for index in range(-2000, 2000):
+            temperature = Temperature(index / 7, 'F')
+            for scale in ('C', 'De', 'K', 'N', 'Ra', 'Re', 'Ro'):
+                converted = temperature.to(scale)
+                assert converted == temperature
+                assert hash(converted) == hash(temperature)
+
+    def test_repr(self) -> None:
+        """Tests the representation of a temperature"""
+        assert repr(Temperature(35, 'F')) == "Temperature(35, 'fahrenheit')"
+
+    def test_pickle(self) -> None:
+        """Tests that temperatures can be pickled"""
+        temperature = Temperature(12.5, 'De')
+        assert pickle.loads(pickle.dumps(temperature)) == temperature
+
+    @pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_converted(self, protocol: int) -> None:
+        """Tests that pickling keeps the exact Kelvin value of .to()"""
+        for index in range(1000):
+            temperature = Temperature(index / 7, 'C').to('F')
+            loaded = pickle.loads(pickle.dumps(temperature, protocol))
+            assert loaded == temperature
+            assert hash(loaded) == hash(temperature)
+            assert loaded.value == temperature.value
+
+    def test_unknown_scale(self) -> None:
+        """Tests that unknown scales are rejected"""
+        with pytest.raises(ValueError):
+            Temperature(1, 'plank')
@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from totemp import Celsius, Delisle, Fahrenheit, Kelvin
+from totemp import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
 
 
 class TestToTemp:
@@ -528,3 +537,544 @@ class TestToTemp:
         with default parameter set to False
         """
         assert isinstance(Delisle.to_romer(1324.799, float_ret=False), int)
+
+    # Newton to <other temp scale> tests
+    def test_newton_to_celsius(self) -> None:
+        """Tests the result of the conversion Newton to Celsius"""
+        assert Newton.to_celsius(88.6) == 268.4848484848485
+
+    def test_newton_to_celsius_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Celsius
+        with default parameter values
+        """
+        assert isinstance(Newton.to_celsius(88), float)
+
+    def test_newton_to_celsius_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Celsius
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_celsius(88.6, float_ret=False), int)
+
+    def test_newton_to_delisle(self) -> None:
+        """Tests the result of the conversion Newton to Delisle"""
+        assert Newton.to_delisle(173.8) == -640.0000000000001
+
+    def test_newton_to_delisle_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Delisle
+        with default parameter values
+        """
+        assert isinstance(Newton.to_delisle(173), float)
+
+    def test_newton_to_delisle_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Delisle
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_delisle(173.8, float_ret=False), int)
+
+    def test_newton_to_fahrenheit(self) -> None:
+        """Tests the result of the conversion Newton to Fahrenheit"""
+        assert Newton.to_fahrenheit(-213.1) == -1130.3636363636363
+
+    def test_newton_to_fahrenheit_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Fahrenheit
+        with default parameter values
+        """
+        assert isinstance(Newton.to_fahrenheit(-213), float)
+
+    def test_newton_to_fahrenheit_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Fahrenheit
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_fahrenheit(-213.1, float_ret=False), int)
+
+    def test_newton_to_kelvin(self) -> None:
+        """Tests the result of the conversion Newton to Kelvin"""
+        assert Newton.to_kelvin(138.8) == 693.7560606060606
+
+    def test_newton_to_kelvin_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Kelvin
+        with default parameter values
+        """
+        assert isinstance(Newton.to_kelvin(138), float)
+
+    def test_newton_to_kelvin_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Kelvin
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_kelvin(138.8, float_ret=False), int)
+
+    def test_newton_to_rankine(self) -> None:
+        """Tests the result of the conversion Newton to Rankine"""
+        assert Newton.to_rankine(791.64) == 4809.706363636364
+
+    def test_newton_to_rankine_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Rankine
+        with default parameter values
+        """
+        assert isinstance(Newton.to_rankine(791), float)
+
+    def test_newton_to_rankine_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Rankine
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_rankine(791.64, float_ret=False), int)
+
+    def test_newton_to_reaumur(self) -> None:
+        """Tests the result of the conversion Newton to Réaumur"""
+        assert Newton.to_reaumur(-255.0052) == -618.1944242424242
+
+    def test_newton_to_reaumur_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Réaumur
+        with default parameter values
+        """
+        assert isinstance(Newton.to_reaumur(-255), float)
+
+    def test_newton_to_reaumur_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Réaumur
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_reaumur(-255.0052, float_ret=False), int)
+
+    def test_newton_to_romer(self) -> None:
+        """Tests the result of the conversion Newton to Rømer"""
+        assert Newton.to_romer(201.81) == 328.56136363636364
+
+    def test_newton_to_romer_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Rømer
+        with default parameter values
+        """
+        assert isinstance(Newton.to_romer(201), float)
+
+    def test_newton_to_romer_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Newton to Rømer
+        with default parameter set to False
+        """
+        assert isinstance(Newton.to_romer(201.81, float_ret=False), int)
+
+    # Rankine to <other temp scale> tests
+    def test_rankine_to_celsius(self) -> None:
+        """Tests the result of the conversion Rankine to Celsius"""
+        assert Rankine.to_celsius(-191.1444) == -379.34133333333335
+
+    def test_rankine_to_celsius_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Celsius
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_celsius(-191), float)
+
+    def test_rankine_to_celsius_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Celsius
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_celsius(-191.1444, float_ret=False), int)
+
+    def test_rankine_to_delisle(self) -> None:
+        """Tests the result of the conversion Rankine to Delisle"""
+        assert Rankine.to_delisle(-229.1) == 750.6416666666668
+
+    def test_rankine_to_delisle_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Delisle
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_delisle(-229), float)
+
+    def test_rankine_to_delisle_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Delisle
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_delisle(-229.1, float_ret=False), int)
+
+    def test_rankine_to_fahrenheit(self) -> None:
+        """Tests the result of the conversion Rankine to Fahrenheit"""
+        assert Rankine.to_fahrenheit(836.9) == 377.22999999999996
+
+    def test_rankine_to_fahrenheit_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Fahrenheit
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_fahrenheit(836), float)
+
+    def test_rankine_to_fahrenheit_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Fahrenheit
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_fahrenheit(836.9, float_ret=False), int)
+
+    def test_rankine_to_kelvin(self) -> None:
+        """Tests the result of the conversion Rankine to Kelvin"""
+        assert Rankine.to_kelvin(392.5235) == 218.06861111111112
+
+    def test_rankine_to_kelvin_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Kelvin
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_kelvin(392), float)
+
+    def test_rankine_to_kelvin_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Kelvin
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_kelvin(392.5235, float_ret=False), int)
+
+    def test_rankine_to_newton(self) -> None:
+        """Tests the result of the conversion Rankine to Newton"""
+        assert Rankine.to_newton(-240.49) == -134.22933333333336
+
+    def test_rankine_to_newton_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Newton
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_newton(-240), float)
+
+    def test_rankine_to_newton_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Newton
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_newton(-240.49, float_ret=False), int)
+
+    def test_rankine_to_reaumur(self) -> None:
+        """Tests the result of the conversion Rankine to Réaumur"""
+        assert Rankine.to_reaumur(-244.1) == -327.00888888888886
+
+    def test_rankine_to_reaumur_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Réaumur
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_reaumur(-244), float)
+
+    def test_rankine_to_reaumur_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Réaumur
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_reaumur(-244.1, float_ret=False), int)
+
+    def test_rankine_to_romer(self) -> None:
+        """Tests the result of the conversion Rankine to Rømer"""
+        assert Rankine.to_romer(47.53) == -122.04083333333332
+
+    def test_rankine_to_romer_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Rømer
+        with default parameter values
+        """
+        assert isinstance(Rankine.to_romer(47), float)
+
+    def test_rankine_to_romer_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rankine to Rømer
+        with default parameter set to False
+        """
+        assert isinstance(Rankine.to_romer(47.53, float_ret=False), int)
+
+    # Réaumur to <other temp scale> tests
+    def test_reaumur_to_celsius(self) -> None:
+        """Tests the result of the conversion Réaumur to Celsius"""
+        assert Reaumur.to_celsius(348.823) == 436.02874999999995
+
+    def test_reaumur_to_celsius_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Celsius
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_celsius(348), float)
+
+    def test_reaumur_to_celsius_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Celsius
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_celsius(348.823, float_ret=False), int)
+
+    def test_reaumur_to_delisle(self) -> None:
+        """Tests the result of the conversion Réaumur to Delisle"""
+        assert Reaumur.to_delisle(372.31) == -548.08125
+
+    def test_reaumur_to_delisle_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Delisle
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_delisle(372), float)
+
+    def test_reaumur_to_delisle_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Delisle
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_delisle(372.31, float_ret=False), int)
+
+    def test_reaumur_to_fahrenheit(self) -> None:
+        """Tests the result of the conversion Réaumur to Fahrenheit"""
+        assert Reaumur.to_fahrenheit(-176.33) == -364.7425
+
+    def test_reaumur_to_fahrenheit_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Fahrenheit
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_fahrenheit(-176), float)
+
+    def test_reaumur_to_fahrenheit_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Fahrenheit
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_fahrenheit(-176.33, float_ret=False), int)
+
+    def test_reaumur_to_kelvin(self) -> None:
+        """Tests the result of the conversion Réaumur to Kelvin"""
+        assert Reaumur.to_kelvin(146.9) == 456.775
+
+    def test_reaumur_to_kelvin_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Kelvin
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_kelvin(146), float)
+
+    def test_reaumur_to_kelvin_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Kelvin
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_kelvin(146.9, float_ret=False), int)
+
+    def test_reaumur_to_newton(self) -> None:
+        """Tests the result of the conversion Réaumur to Newton"""
+        assert Reaumur.to_newton(377.24) == 155.6115
+
+    def test_reaumur_to_newton_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Newton
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_newton(377), float)
+
+    def test_reaumur_to_newton_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Newton
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_newton(377.24, float_ret=False), int)
+
+    def test_reaumur_to_rankine(self) -> None:
+        """Tests the result of the conversion Réaumur to Rankine"""
+        assert Reaumur.to_rankine(295.6974) == 1156.98915
+
+    def test_reaumur_to_rankine_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Rankine
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_rankine(295), float)
+
+    def test_reaumur_to_rankine_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Rankine
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_rankine(295.6974, float_ret=False), int)
+
+    def test_reaumur_to_romer(self) -> None:
+        """Tests the result of the conversion Réaumur to Rømer"""
+        assert Reaumur.to_romer(632.6745) == 422.69264062499997
+
+    def test_reaumur_to_romer_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Rømer
+        with default parameter values
+        """
+        assert isinstance(Reaumur.to_romer(632), float)
+
+    def test_reaumur_to_romer_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Réaumur to Rømer
+        with default parameter set to False
+        """
+        assert isinstance(Reaumur.to_romer(632.6745, float_ret=False), int)
+
+    # Rømer to <other temp scale> tests
+    def test_romer_to_celsius(self) -> None:
+        """Tests the result of the conversion Rømer to Celsius"""
+        assert Romer.to_celsius(402.6742) == 752.7127619047618
+
+    def test_romer_to_celsius_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Celsius
+        with default parameter values
+        """
+        assert isinstance(Romer.to_celsius(402), float)
+
+    def test_romer_to_celsius_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Celsius
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_celsius(402.6742, float_ret=False), int)
+
+    def test_romer_to_delisle(self) -> None:
+        """Tests the result of the conversion Rømer to Delisle"""
+        assert Romer.to_delisle(133.9) == -211.14285714285714
+
+    def test_romer_to_delisle_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Delisle
+        with default parameter values
+        """
+        assert isinstance(Romer.to_delisle(133), float)
+
+    def test_romer_to_delisle_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Delisle
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_delisle(133.9, float_ret=False), int)
+
+    def test_romer_to_fahrenheit(self) -> None:
+        """Tests the result of the conversion Rømer to Fahrenheit"""
+        assert Romer.to_fahrenheit(653.26) == 2246.0342857142855
+
+    def test_romer_to_fahrenheit_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Fahrenheit
+        with default parameter values
+        """
+        assert isinstance(Romer.to_fahrenheit(653), float)
+
+    def test_romer_to_fahrenheit_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Fahrenheit
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_fahrenheit(653.26, float_ret=False), int)
+
+    def test_romer_to_kelvin(self) -> None:
+        """Tests the result of the conversion Rømer to Kelvin"""
+        assert Romer.to_kelvin(-201.774) == -125.46714285714285
+
+    def test_romer_to_kelvin_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Kelvin
+        with default parameter values
+        """
+        assert isinstance(Romer.to_kelvin(-201), float)
+
+    def test_romer_to_kelvin_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Kelvin
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_kelvin(-201.774, float_ret=False), int)
+
+    def test_romer_to_newton(self) -> None:
+        """Tests the result of the conversion Rømer to Newton"""
+        assert Romer.to_newton(330.236) == 202.86262857142856
+
+    def test_romer_to_newton_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Newton
+        with default parameter values
+        """
+        assert isinstance(Romer.to_newton(330), float)
+
+    def test_romer_to_newton_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Newton
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_newton(330.236, float_ret=False), int)
+
+    def test_romer_to_rankine(self) -> None:
+        """Tests the result of the conversion Rømer to Rankine"""
+        assert Romer.to_rankine(575.334) == 2438.5294285714285
+
+    def test_romer_to_rankine_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Rankine
+        with default parameter values
+        """
+        assert isinstance(Romer.to_rankine(575), float)
+
+    def test_romer_to_rankine_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Rankine
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_rankine(575.334, float_ret=False), int)
+
+    def test_romer_to_reaumur(self) -> None:
+        """Tests the result of the conversion Rømer to Réaumur"""
+        assert Romer.to_reaumur(430.8) == 645.0285714285715
+
+    def test_romer_to_reaumur_default_type(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Réaumur
+        with default parameter values
+        """
+        assert isinstance(Romer.to_reaumur(430), float)
+
+    def test_romer_to_reaumur_type_trunc_ret(self) -> None:
+        """
+        Tests the type of the value returned on the conversion Rømer to Réaumur
+        with default parameter set to False
+        """
+        assert isinstance(Romer.to_reaumur(430.8, float_ret=False), int)
+
+    # Reference points
+    def test_freezing_point(self) -> None:
+        """
+        Tests that the freezing point of water converts exactly to and from
+        Newton, Rankine, Réaumur and Rømer
+        """
+        assert Newton.to_celsius(0) == 0.0
+        assert Rankine.to_celsius(491.67) == 0.0
+        assert Reaumur.to_celsius(0) == 0.0
+        assert Romer.to_celsius(7.5) == 0.0
+        assert Romer.to_fahrenheit(7.5) == 32.0
+        assert Rankine.to_kelvin(491.67) == 273.15
+        assert Rankine.to_fahrenheit(491.67) == 32.0
+        assert Newton.to_delisle(0) == 150.0
+        assert Romer.to_delisle(7.5) == 150.0
+
+    def test_boiling_point(self) -> None:
+        """
+        Tests that the boiling point of water converts exactly to and from
+        Newton, Réaumur and Rømer, even truncated to ints
+        """
+        assert Romer.to_celsius(60) == 100.0
+        assert Romer.to_celsius(60, float_ret=False) == 100
+        assert Newton.to_celsius(33) == 100.0
+        assert Newton.to_celsius(33, float_ret=False) == 100
+        assert Reaumur.to_celsius(80) == 100.0
+        assert Romer.to_fahrenheit(60) == 212.0
+        assert Newton.to_reaumur(33) == 80.0
+        assert Reaumur.to_romer(80) == 60.0
+        assert Romer.to_newton(60) == 33.0
+        assert Romer.to_delisle(60) == 0.0
+        assert Romer.to_rankine(60) == Celsius.to_rankine(100)
@@ -1,7 +1,45 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from .temperature_types import Celsius, Delisle, Fahrenheit, Kelvin
+from .temperature_types import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .backends import convert_batch
+    from .conversion import convert, converter
+    from .temperature import Temperature
+
+# Imported on first use, so that importing totemp only loads the classes
+_LAZY = {
+    'Temperature': 'temperature',
+    'convert': 'conversion',
+    'convert_batch': 'backends',
+    'converter': 'conversion',
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    # Not importlib.import_module, whose own import would cost more
+    module = __import__(f'{__name__}.{_LAZY[name]}', fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
+
 
 __author__ = 'Edson Pimenta and Dávilos Tavares'
 __credits__ = ['Edson Pimenta', 'Dávilos Tavares']
@@ -12,4 +50,17 @@ __maintainer__ = [
     'Dávilos Tavares <daviloscostagg@hotmail.com>',
 ]
 __status__ = 'Development'
-__all__ = ['Celsius', 'Fahrenheit', 'Delisle', 'Kelvin']
+__all__ = [
+    'Celsius',
+    'Fahrenheit',
+    'Delisle',
+    'Kelvin',
+    'Newton',
+    'Rankine',
+    'Reaumur',
+    'Romer',
+    'Temperature',
+    'convert',
+    'convert_batch',
+    'converter',
+]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The .totemp accessors are registered when this module is imported, and
+# only then: `import totemp` never imports it, whatever the order pandas and
+# totemp are imported in, so `import totemp.accessors` is always needed
+from collections.abc import Hashable, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .arrays import convert_array
+from .scales import resolve_scale
+
+_MASKED = (pd.arrays.FloatingArray, pd.arrays.IntegerArray)
+
+
+def _convert_series(
+    series: pd.Series, source: str, target: str, float_ret: bool, exact: bool
+) -> pd.Series:
+    """
+    Converts a numeric Series, keeping its index and name. Nullable (e.g.
+    Float64 or Int64) columns keep their missing values, which are never
+    converted, and return nullable columns.
+    """
+    dtype = series.dtype
+    numeric = pd.api.types.is_numeric_dtype(dtype)
+    if not numeric or pd.api.types.is_bool_dtype(dtype):
+        raise TypeError(f'Cannot convert a column of {dtype} values')
+
+    values = series.array
+    if isinstance(values, _MASKED):
+        mask = values.isna()
+        data = values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=0)
+        result = convert_array(
+            data, source, target, float_ret=float_ret, exact=exact
+        )
+        if float_ret:
+            result = pd.arrays.FloatingArray(result, mask)
+        else:
+            result = pd.arrays.IntegerArray(result, mask)
+    else:
+        if isinstance(dtype, np.dtype):
+            data = series.to_numpy()
+        else:  # Other extension types, e.g. backed by pyarrow
+            data = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        result = convert_array(
+            data, source, target, float_ret=float_ret, exact=exact
+        )
+    return pd.Series(result, index=series.index, name=series.name, copy=False)
+
+
+@pd.api.extensions.register_series_accessor('totemp')
+class SeriesAccessor:
+    """
+    Converts a Series of temperatures, e.g. series.totemp.convert('C', 'F')
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        self._series = series
+
+    def convert(
+        self, source: str, target: str, /, *, float_ret=True, exact=True
+    ) -> pd.Series:
+        """
+        Converts every value of the Series from the source scale to the
+        target scale at once, with the same results as the methods.
+
+        :param source: Name or abbreviation of the scale of the values
+        :param target: Name or abbreviation of the scale to convert to
+        :param float_ret: Optional, True by default to return floats
+        :param exact: Optional, True by default to match the methods
+            bit-for-bit
+        :return: pandas.Series with the same index and name
+        """
+        return _convert_series(
+            self._series,
+            resolve_scale(source),
+            resolve_scale(target),
+            float_ret,
+            exact,
+        )
+
+
+@pd.api.extensions.register_dataframe_accessor('totemp')
+class DataFrameAccessor:
+    """
+    Converts columns of temperatures, e.g.
+    frame.totemp.convert('C', 'F', columns=['min', 'max'])
+    """
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+
+    def convert(
+        self,
+        source: str,
+        target: str,
+        /,
+        *,
+        columns: Iterable[Hashable] | None = None,
+        float_ret=True,
+        exact=True,
+        inplace=False,
+    ) -> pd.DataFrame | None:
+        """
+        Converts the given columns (all of them by default) from the source
+        scale to the target scale, each one at once, with the same results
+        as the methods. The other columns are kept as they are.
+
+        :param source: Name or abbreviation of the scale of the columns
+        :param target: Name or abbreviation of the scale to convert to
+        :param columns: Optional, labels of the columns to convert
+        :param float_ret: Optional, True by default to return floats
+        :param exact: Optional, True by default to match the methods
+            bit-for-bit
+        :param inplace: Optional, True to replace the columns of this
+            DataFrame instead of returning a new one
+        :return: pandas.DataFrame, or None if inplace is True
+        """
+        pair = resolve_scale(source), resolve_scale(target)
+        frame = self._frame
+        labels = frame.columns if columns is None else list(columns)
+        converted = {
+            label: _convert_series(frame[label], *pair, float_ret, exact)
+            for label in labels
+        }
+        result = frame if inplace else frame.copy(deep=False)
+        for label, series in converted.items():
+            result[label] = series
+        return None if inplace else result
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .scales import (
+    ABSOLUTE_ZERO,
+    COEFFICIENTS,
+    FORMULAS,
+    KELVIN_AFFINE,
+    check_validation,
+    invalid_temperature,
+    resolve_scale,
+)
+
+_UFUNCS = {
+    'add': np.add,
+    'sub': np.subtract,
+    'mul': np.multiply,
+    'div': np.true_divide,
+}
+
+# Values are validated and converted this many at a time, so the masks are
+# small and every chunk is checked while it's still in the cache
+VALIDATION_CHUNK_SIZE = 65_536
+
+
+def _evaluate(
+    formula: tuple[tuple[str, float | int], ...],
+    values: np.ndarray,
+    out: np.ndarray | None,
+) -> np.ndarray:
+    """
+    Runs every step of a formula as one ufunc call over the whole array,
+    writing each intermediate result into the same float64 buffer, so
+    narrower inputs (e.g. float32) are widened as in Python. Buffers of
+    other dtypes get the results through a float64 array, so they're only
+    rounded once, when stored.
+
+    :param formula: Steps of the conversion, as listed in scales.FORMULAS
+    :param values: Values to be converted
+    :param out: Buffer for the results, a new float64 array if None
+    :return: The buffer holding the converted values
+    """
+    if out is None:
+        out = np.empty(values.shape, dtype=np.float64)
+    elif out.dtype != np.float64:
+        np.copyto(out, _evaluate(formula, values, None), casting='unsafe')
+        return out
+    if not formula:
+        np.copyto(out, values)
+    operand = values
+    for operation, constant in formula:
+        if operation == 'rsub':
+            np.subtract(constant, operand, out=out, dtype=np.float64)
+        else:
+            _UFUNCS[operation](operand, constant, out=out, dtype=np.float64)
+        operand = out
+    return out
+
+
+def _valid(values: np.ndarray, scale: str) -> np.ndarray:
+    """
+    Gets the mask of the values that are finite and not below absolute zero
+    (which is also False for NaN, as every comparison with it is).
+    """
+    zero = ABSOLUTE_ZERO[scale]
+    if KELVIN_AFFINE[scale][0][0] > 0:
+        valid = values >= zero
+        valid &= values < np.inf
+    else:  # Delisle values rise as temperatures fall
+        valid = values <= zero
+        valid &= values > -np.inf
+    return valid
+
+
+def _check_valid(
+    values: np.ndarray,
+    scale: str,
+    start=0,
+    shape: tuple[int, ...] | None = None,
+) -> None:
+    """
+    Raises the error of the first value that's NaN, infinite or beyond
+    absolute zero, checking the values one chunk at a time.
+
+    :param values: Values to be checked
+    :param scale: Canonical name of their scale
+    :param start: Optional, index of the first value among all the values
+        being converted, when they're only a part of them
+    :param shape: Optional, shape of all the values, values.shape if None
+    :return: None
+    """
+    if shape is None:
+        shape = values.shape
+    flat_values = values.reshape(-1)
+    for chunk_start in range(0, flat_values.size, VALIDATION_CHUNK_SIZE):
+        chunk = flat_values[chunk_start : chunk_start + VALIDATION_CHUNK_SIZE]
+        valid = _valid(chunk, scale)
+        if valid.all():
+            continue
+        index = int(np.argmin(valid))
+        position: Any = start + chunk_start + index
+        if len(shape) > 1:
+            position = tuple(map(int, np.unravel_index(position, shape)))
+        raise invalid_temperature(chunk[index].item(), position, scale)
+
+
+def _evaluate_validated(
+    formula: tuple[tuple[str, float | int], ...],
+    values: np.ndarray,
+    out: np.ndarray | None,
+    pair: tuple[str, str],
+    validate: str,
+) -> np.ndarray:
+    """
+    Runs a formula as _evaluate does, and then raises an error for the
+    invalid values, clips them or replaces them by NaN.
+
+    With 'raise', every value is checked before any is converted, so out is
+    left as it was (even when it's values itself) if one is invalid. The
+    other modes convert one chunk at a time, right after checking it.
+
+    :param formula: Steps of the conversion, as listed in scales.FORMULAS
+    :param values: Values to be converted
+    :param out: Buffer for the results, a new float64 array if None
+    :param pair: Canonical names of the source and target scales
+    :param validate: One of scales.VALIDATION_MODES
+    :return: The buffer holding the converted values
+    """
+    source, target = pair
+    if validate == 'raise':
+        _check_valid(values, source)
+        return _evaluate(formula, values, out)
+    if out is None:
+        out = np.empty(values.shape, dtype=np.float64)
+    results = out if out.flags.c_contiguous else np.empty_like(out)
+    flat_values = values.reshape(-1)
+    flat_results = results.reshape(-1)
+    for start in range(0, flat_values.size, VALIDATION_CHUNK_SIZE):
+        chunk = flat_values[start : start + VALIDATION_CHUNK_SIZE]
+        part = flat_results[start : start + VALIDATION_CHUNK_SIZE]
+        valid = _valid(chunk, source)
+        if valid.all():
+            _evaluate(formula, chunk, part)
+            continue
+        # Found before converting, as the values may be converted in place
+        if validate == 'clip':  # Not NaN or infinitely hot values
+            if KELVIN_AFFINE[source][0][0] > 0:
+                invalid = chunk < ABSOLUTE_ZERO[source]
+            else:
+                invalid = chunk > ABSOLUTE_ZERO[source]
+        else:
+            invalid = np.logical_not(valid, out=valid)
+        _evaluate(formula, chunk, part)
+        if validate == 'nan':
+            np.copyto(part, np.nan, where=invalid)
+        else:
+            np.copyto(part, ABSOLUTE_ZERO[target], where=invalid)
+    if results is not out:
+        np.copyto(out, results)
+    return out
+
+
+def convert_array(
+    values: ArrayLike,
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    out: np.ndarray | None = None,
+    validate: str | None = None,
+) -> np.ndarray:
+    """
+    Converts a whole array from the source scale to the target scale at once,
+    returning a float64 array by default.
+
+    The results are the same, element by element, as the ones returned by the
+    matching method (e.g. Celsius.to_fahrenheit for 'celsius' and
+    'fahrenheit'), because the operations are done in the same order.
+
+    If the exact parameter is False, the conversion is done as one multiply
+    and one add with precomputed coefficients, which takes fewer passes over
+    the array, but may differ from the methods in the last bits.
+
+    If the float_ret parameter is False, the values are truncated into an
+    int64 array, as the methods do with the math's module trunc function.
+
+    The values aren't checked by default. With validate, values beyond
+    absolute zero (e.g. -5 in Kelvin, or above 559.725 in Delisle), NaN and
+    infinities are found while converting, and then either raise ValueError
+    ('raise', before any result is written, so out is left unchanged), are
+    clipped to absolute zero ('clip', which leaves NaN and infinitely hot
+    values as they are) or become NaN ('nan', only with float_ret=True).
+
+    :param values: Array (or array-like) of values to be converted
+    :param source: Name of the scale of the values, e.g. 'celsius' or 'C'
+    :param target: Name of the scale to convert to, e.g. 'fahrenheit' or 'F'
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param out: Optional, preallocated array to write the results into
+    :param validate: Optional, None (the default), 'raise', 'clip' or 'nan'
+    :return: numpy.ndarray (out itself if it was given)
+    """
+    pair = resolve_scale(source), resolve_scale(target)
+    check_validation(validate, float_ret)
+    if exact:
+        formula = FORMULAS[pair]
+    else:
+        scale, offset = COEFFICIENTS[pair]
+        formula = (('mul', scale), ('add', offset))
+
+    values = np.asarray(values)
+    if out is not None and out.shape != values.shape:
+        raise ValueError(
+            f'out has shape {out.shape}, but values have shape {values.shape}'
+        )
+
+    if validate is not None:
+        if float_ret:
+            return _evaluate_validated(formula, values, out, pair, validate)
+        result = _evaluate_validated(formula, values, None, pair, validate)
+    elif float_ret:
+        return _evaluate(formula, values, out)
+    else:
+        result = _evaluate(formula, values, None)
+    np.trunc(result, out=result)
+    if not np.isfinite(result).all():
+        raise ValueError('Cannot truncate NaN or infinite values to int')
+    if out is None:
+        return result.astype(np.int64)
+    np.copyto(out, result, casting='unsafe')
+    return out
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from importlib import import_module
+from typing import Any, Callable
+
+from .conversion import _expression, converter
+from .scales import COEFFICIENTS, FORMULAS, resolve_scale
+
+BACKENDS = ('python', 'buffer', 'numpy', 'numba')
+
+# Types of the buffers converted by the buffer backend, by module, checked
+# by name so that nothing is imported to check them
+_BUFFERS = {('array', 'array'), ('builtins', 'memoryview')}
+
+# Fewest values converted by the heavier backends when they are picked
+# automatically: below them, importing or calling into them costs more than
+# it saves. Change them with set_thresholds.
+THRESHOLDS = {'numpy': 256, 'numba': 1 << 16}
+
+_AVAILABLE: dict[str, bool] = {}
+
+_KERNELS: dict[tuple[str, str, bool], Callable[..., None]] = {}
+
+
+def set_thresholds(**thresholds: int) -> None:
+    """
+    Sets the fewest values for which the NumPy or Numba backends are picked
+    automatically, e.g. set_thresholds(numpy=1000).
+
+    :param thresholds: Counts of values, by name of backend
+    :return: None
+    """
+    for name, size in thresholds.items():
+        if name not in THRESHOLDS:
+            raise ValueError(
+                f'Unknown backend {name!r} to set the threshold of, '
+                f'expected one of {", ".join(THRESHOLDS)}'
+            )
+        THRESHOLDS[name] = size
+
+
+def available(backend: str) -> bool:
+    """
+    Tells whether a backend can be used, without importing its module.
+
+    :param backend: Name of the backend, one of BACKENDS
+    :return: bool
+    """
+    if backend not in _AVAILABLE:
+        if backend not in BACKENDS:
+            raise ValueError(
+                f'Unknown backend {backend!r}, '
+                f'expected one of {", ".join(BACKENDS)}'
+            )
+        from importlib.util import find_spec
+
+        module = {'numpy': 'numpy', 'numba': 'numba'}.get(backend)
+        _AVAILABLE[backend] = module is None or find_spec(module) is not None
+    return _AVAILABLE[backend]
+
+
+def select(values: Any) -> str:
+    """
+    Picks the backend converting the values: NumPy arrays use NumPy (or
+    Numba, for the largest ones, if it's installed), buffers such as
+    array.array use the buffer backend, or NumPy once large enough, and
+    anything else uses Python, or NumPy once large enough.
+
+    :param values: Values to be converted
+    :return: str, the name of the backend
+    """
+    kind = type(values)
+    # NumPy arrays may have no length, being 0-d, but always have a size
+    size = values.size if kind.__module__ == 'numpy' else len(values)
+    numpy = available('numpy') and size >= THRESHOLDS['numpy']
+    if kind.__module__ == 'numpy':
+        if size >= THRESHOLDS['numba'] and available('numba'):
+            return 'numba'
+        return 'numpy'
+    if (kind.__module__, kind.__name__) in _BUFFERS:
+        return 'numpy' if numpy else 'buffer'
+    return 'numpy' if numpy else 'python'
+
+
+def _convert_python(
+    values: Any, pair: tuple[str, str], float_ret: bool, exact: bool
+) -> list:
+    """Calls the specialized converter of the pair on every value"""
+    return list(
+        map(converter(*pair, float_ret=float_ret, exact=exact), values)
+    )
+
+
+def _convert_buffer(
+    values: Any, pair: tuple[str, str], float_ret: bool, exact: bool
+) -> Any:
+    """
+    Converts the items of a buffer into a new array('d'), or array('q') if
+    float_ret is False, without NumPy.
+    """
+    from array import array
+
+    function = converter(*pair, float_ret=float_ret, exact=exact)
+    return array('d' if float_ret else 'q', map(function, memoryview(values)))
+
+
+def _convert_numpy(
+    values: Any, pair: tuple[str, str], float_ret: bool, exact: bool
+) -> Any:
+    """
+    Converts with convert_array, returning an array for NumPy arrays and
+    buffers, and a list for anything else.
+    """
+    from array import array
+
+    np = import_module('numpy')
+    convert_array = import_module('.arrays', __package__).convert_array
+
+    if isinstance(values, np.ndarray):
+        return convert_array(values, *pair, float_ret=float_ret, exact=exact)
+    if isinstance(values, (array, memoryview)):
+        view = memoryview(values)
+        result = convert_array(
+            np.frombuffer(view, dtype=view.format),
+            *pair,
+            float_ret=float_ret,
+            exact=exact,
+        )
+        return array('d' if float_ret else 'q', result.tobytes())
+    array_ = np.asarray(values)
+    if array_.dtype.kind not in 'fiu':  # e.g. Decimals, left to the methods
+        return _convert_python(values, pair, float_ret, exact)
+    return convert_array(
+        array_, *pair, float_ret=float_ret, exact=exact
+    ).tolist()
+
+
+def _kernel(pair: tuple[str, str], exact: bool) -> Callable[..., None]:
+    """
+    Compiles with Numba the loop converting a float64 array into another,
+    doing the very operations of the formula of the pair, in its order.
+    """
+    key = *pair, exact
+    if key not in _KERNELS:
+        numba = import_module('numba')
+        if exact:
+            formula = FORMULAS[pair]
+        else:
+            formula = (('mul', COEFFICIENTS[pair][0]),)
+            formula += (('add', COEFFICIENTS[pair][1]),)
+        code = (
+            'def kernel(values, out):\n'
+            '    for index in range(values.shape[0]):\n'
+            '        value = float(values[index])\n'
+            f'        out[index] = {_expression(formula)}\n'
+        )
+        namespace: dict[str, Any] = {}
+        exec(code, namespace)
+        _KERNELS[key] = numba.njit(nogil=True)(namespace['kernel'])
+    return _KERNELS[key]
+
+
+def _convert_numba(
+    values: Any, pair: tuple[str, str], float_ret: bool, exact: bool
+) -> Any:
+    """
+    Converts a NumPy array with a compiled loop, in one pass, falling back to
+    NumPy for ints, which need its checks for NaN and infinities.
+    """
+    np = import_module('numpy')
+    if not float_ret:
+        return _convert_numpy(values, pair, float_ret, exact)
+    values = np.ascontiguousarray(values)
+    out = np.empty(values.shape, dtype=np.float64)
+    _kernel(pair, exact)(values.reshape(-1), out.reshape(-1))
+    return out
+
+
+_CONVERTERS = {
+    'python': _convert_python,
+    'buffer': _convert_buffer,
+    'numpy': _convert_numpy,
+    'numba': _convert_numba,
+}
+
+
+def convert_batch(
+    values: Any,
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    backend: str | None = None,
+) -> Any:
+    """
+    Converts many values from the source scale to the target scale at once,
+    with the backend that suits them best (see select), or the one given.
+
+    The results are the same as the ones of the methods, and are a NumPy
+    array for NumPy arrays, an array.array ('d', or 'q' if float_ret is
+    False) for other buffers and a list for anything else.
+
+    NumPy and Numba are only imported the first time they are used, so they
+    cost nothing to processes that only convert a few values.
+
+    :param values: Iterable, buffer or NumPy array of values to be converted
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param backend: Optional, one of BACKENDS, picked by size if None
+    :return: numpy.ndarray, array.array or list
+    """
+    pair = resolve_scale(source), resolve_scale(target)
+    if not hasattr(values, '__len__'):  # e.g. generators
+        values = list(values)
+    if backend is None:
+        backend = select(values)
+    elif not available(backend):
+        raise ImportError(f'The {backend} backend is not installed')
+    return _CONVERTERS[backend](values, pair, float_ret, exact)
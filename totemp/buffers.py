@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from math import inf, nan, trunc
+from typing import Any
+
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .scales import (
+    ABSOLUTE_ZERO,
+    KELVIN_AFFINE,
+    check_validation,
+    invalid_temperature,
+    resolve_scale,
+)
+
+try:
+    import numpy as np
+
+    from .arrays import _check_valid, convert_array
+except ImportError:  # NumPy is optional, the buffers are then looped over
+    np = None  # type: ignore[assignment]
+
+FLOAT_TYPECODES = frozenset('efd')
+
+CHUNK_SIZE = 65_536
+
+
+def _flat_view(buffer: Any, typecode: str | None) -> memoryview:
+    """
+    Gets a one-dimensional memoryview of a buffer, reinterpreting its bytes
+    as typecode items if one is given.
+
+    :param buffer: Any object supporting the buffer protocol
+    :param typecode: Optional, struct format of the items, e.g. 'd' or 'f'
+    :return: memoryview
+    """
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        raise ValueError('Buffers must be C-contiguous to be converted')
+    if typecode is None:
+        typecode = view.format
+    if view.ndim != 1 or view.format != typecode:
+        view = view.cast('B').cast(typecode)
+    return view
+
+
+def _convert_numpy(
+    values: memoryview,
+    results: memoryview,
+    pair: tuple[str, str],
+    float_ret: bool,
+    exact: bool,
+    chunk_size: int,
+    validate: str | None,
+) -> None:
+    """Converts through zero-copy NumPy views, one chunk at a time"""
+    source_array = np.frombuffer(values, dtype=values.format)
+    result_array = np.frombuffer(results, dtype=results.format)
+    if validate == 'raise':
+        # Every value is checked first, so nothing is written if one is
+        # invalid, and the error has its index in the whole buffer
+        _check_valid(source_array, pair[0])
+        validate = None
+    # Intermediate results are float64, as with the methods, even when the
+    # items are narrower, so the scratch chunk is the only extra memory
+    widen = float_ret and result_array.dtype != np.float64
+    scratch = np.empty(min(chunk_size, len(values))) if widen else None
+    for start in range(0, len(values), chunk_size):
+        chunk = source_array[start : start + chunk_size]
+        result_chunk = result_array[start : start + chunk_size]
+        if scratch is None:
+            convert_array(
+                chunk,
+                *pair,
+                float_ret=float_ret,
+                exact=exact,
+                out=result_chunk,
+                validate=validate,
+            )
+        else:
+            part = scratch[: len(chunk)]
+            convert_array(
+                chunk, *pair, exact=exact, out=part, validate=validate
+            )
+            np.copyto(result_chunk, part, casting='unsafe')
+
+
+def _convert_python(
+    values: memoryview,
+    results: Any,  # A memoryview, but of float items when converting floats
+    pair: tuple[str, str],
+    float_ret: bool,
+    exact: bool,
+    validate: str | None,
+) -> None:
+    """Converts item by item, without ever building a list of the values"""
+    method = (CONVERTERS if exact else FAST_CONVERTERS)[pair]
+    source, target = pair
+    zero = ABSOLUTE_ZERO[source]
+    rising = KELVIN_AFFINE[source][0][0] > 0
+    if validate == 'raise':  # Before writing anything, as with NumPy
+        for index, value in enumerate(values):
+            if not (zero <= value < inf if rising else -inf < value <= zero):
+                raise invalid_temperature(value, index, source)
+        validate = None
+    if validate is None:
+        for index, value in enumerate(values):
+            results[index] = method(value, float_ret=float_ret)
+        return
+
+    clipped = (
+        ABSOLUTE_ZERO[target] if float_ret else trunc(ABSOLUTE_ZERO[target])
+    )
+    for index, value in enumerate(values):
+        if (zero <= value < inf) if rising else (-inf < value <= zero):
+            results[index] = method(value, float_ret=float_ret)
+        elif validate == 'nan':
+            results[index] = nan
+        elif value < zero if rising else value > zero:
+            results[index] = clipped
+        else:  # NaN and infinities can't be clipped
+            results[index] = method(value, float_ret=float_ret)
+
+
+def convert_buffer(
+    buffer: Any,
+    source: str,
+    target: str,
+    /,
+    *,
+    out: Any = None,
+    typecode: str | None = None,
+    out_typecode: str | None = None,
+    float_ret=True,
+    exact=True,
+    chunk_size=CHUNK_SIZE,
+    validate: str | None = None,
+) -> memoryview:
+    """
+    Converts every item of a buffer (array.array, bytearray, memoryview,
+    mmap...) from the source scale to the target scale, in place by default.
+
+    The items are read and written through memoryview casts, so no copy of
+    the buffer is made. Raw bytes (e.g. a bytearray frame) are reinterpreted
+    as typecode items, e.g. 'd' for float64 or 'f' for float32.
+
+    The results are the same as the ones of the matching methods. If NumPy
+    is installed, the buffer is converted in vectorized chunks of chunk_size
+    items, otherwise it's looped over item by item.
+
+    If the float_ret parameter is False, the values are truncated as the
+    methods do, and can be written into an integer buffer.
+
+    Values beyond absolute zero, NaN and infinities are handled as asked by
+    validate, as with convert_array: with 'raise', every item is checked
+    before any is converted, so the buffer is left unchanged on errors.
+
+    :param buffer: Object supporting the buffer protocol holding the values
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param out: Optional, writable buffer for the results, buffer if None
+    :param typecode: Optional, struct format of the items of buffer
+    :param out_typecode: Optional, struct format of the items of out
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param chunk_size: Optional, how many items are converted at once
+    :param validate: Optional, None (the default), 'raise', 'clip' or 'nan'
+    :return: memoryview of the results
+    """
+    pair = resolve_scale(source), resolve_scale(target)
+    check_validation(validate, float_ret)
+    values = _flat_view(buffer, typecode)
+    if out is None:
+        results = values
+    else:
+        results = _flat_view(out, out_typecode or typecode)
+
+    if results.readonly:
+        raise ValueError('The buffer for the results is read-only')
+    if len(results) != len(values):
+        raise ValueError(
+            f'out has {len(results)} items, but buffer has {len(values)}'
+        )
+    if float_ret and results.format not in FLOAT_TYPECODES:
+        raise ValueError(
+            f"Floats can't be written into {results.format!r} items, "
+            'use float_ret=False to write ints'
+        )
+
+    if np is not None:
+        _convert_numpy(
+            values, results, pair, float_ret, exact, chunk_size, validate
+        )
+    else:
+        _convert_python(values, results, pair, float_ret, exact, validate)
+    return results
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .buffers import CHUNK_SIZE
+from .scales import COEFFICIENTS, resolve_scale
+
+
+def fold(
+    source: str, target: str, /, gain: ArrayLike, offset: ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Folds linear calibrations (calibrated = raw * gain + offset, in the source
+    scale) and the conversion to the target scale into the coefficients of
+    a single multiply-add: converted = raw * scale + offset.
+
+    :param source: Name or abbreviation of the scale of the readings
+    :param target: Name or abbreviation of the scale to convert to
+    :param gain: Gain, or array of gains, of the calibrations
+    :param offset: Offset, or array of offsets, of the calibrations
+    :return: tuple of (scale, offset) float64 arrays
+    """
+    scale, shift = COEFFICIENTS[resolve_scale(source), resolve_scale(target)]
+    gain = np.asarray(gain, dtype=np.float64)
+    offset = np.asarray(offset, dtype=np.float64)
+    return gain * scale, offset * scale + shift
+
+
+def convert_calibrated(
+    values: ArrayLike,
+    source: str,
+    target: str,
+    /,
+    *,
+    gain: ArrayLike = 1.0,
+    offset: ArrayLike = 0.0,
+    sensors: ArrayLike | None = None,
+    out: np.ndarray | None = None,
+    chunk_size=CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Calibrates raw readings and converts them from the source scale to the
+    target scale at once, as one multiply-add per reading, returning a
+    float64 array by default.
+
+    The gain and offset are either scalars, arrays with one calibration per
+    reading or, if sensors is given, tables with one calibration per sensor,
+    sensors being the index of the sensor of each reading in the tables.
+
+    Scalar and per sensor calibrations are folded with the conversion before
+    touching the readings, into one multiply-add per reading. The readings
+    are converted in chunks of chunk_size items, so no full-size intermediate
+    array is made. As with exact=False elsewhere, the results may differ in
+    the last bits from calibrating and then calling the methods.
+
+    :param values: Array (or array-like) of raw readings
+    :param source: Name of the scale of the readings, e.g. 'fahrenheit'
+    :param target: Name of the scale to convert to, e.g. 'kelvin'
+    :param gain: Optional, gain of the calibrations, 1.0 by default
+    :param offset: Optional, offset of the calibrations, 0.0 by default
+    :param sensors: Optional, array of the sensor index of every reading,
+        from 0, IndexError being raised for sensors not in the tables
+    :param out: Optional, preallocated C-contiguous array for the results
+    :param chunk_size: Optional, how many readings are converted at once
+    :return: numpy.ndarray (out itself if it was given)
+    """
+    pair = resolve_scale(source), resolve_scale(target)
+    values = np.asarray(values)
+    gain = np.asarray(gain, dtype=np.float64)
+    offset = np.asarray(offset, dtype=np.float64)
+    if out is None:
+        out = np.empty(values.shape, dtype=np.float64)
+    elif out.shape != values.shape:
+        raise ValueError(
+            f'out has shape {out.shape}, but values have shape {values.shape}'
+        )
+    elif not out.flags.c_contiguous:
+        raise ValueError('out must be C-contiguous')
+
+    if sensors is None and gain.ndim == offset.ndim == 0:
+        scale, shift = fold(*pair, gain, offset)
+        np.multiply(values, scale, out=out, dtype=np.float64)
+        np.add(out, shift, out=out)
+        return out
+
+    if sensors is None:
+        for name, array in (('gain', gain), ('offset', offset)):
+            if array.ndim and array.shape != values.shape:
+                raise ValueError(
+                    f'{name} has shape {array.shape}, '
+                    f'but values have shape {values.shape}'
+                )
+        convert = _per_reading(*pair, gain, offset)
+    else:
+        sensors = np.asarray(sensors)
+        if sensors.shape != values.shape:
+            raise ValueError(
+                f'sensors have shape {sensors.shape}, '
+                f'but values have shape {values.shape}'
+            )
+        if gain.ndim > 1 or offset.ndim > 1:
+            raise ValueError('gain and offset must have one value per sensor')
+        _check_sensors(sensors, gain, offset)
+        convert = _per_sensor(*pair, gain, offset, sensors.reshape(-1))
+
+    flat_values = values.reshape(-1)
+    flat_out = out.reshape(-1)
+    scratch = np.empty(min(chunk_size, flat_values.size))
+    for start in range(0, flat_values.size, chunk_size):
+        part = slice(start, start + chunk_size)
+        result = flat_out[part]
+        convert(part, flat_values[part], result, scratch[: len(result)])
+    return out
+
+
+def _check_sensors(
+    sensors: np.ndarray, gain: np.ndarray, offset: np.ndarray
+) -> None:
+    """
+    Checks that every sensor is in the tables before converting anything,
+    as np.take would read negative sensors from the end of the tables.
+    """
+    if not sensors.size:
+        return
+    count = min(
+        (table.size for table in (gain, offset) if table.ndim), default=None
+    )
+    lowest, highest = sensors.min(), sensors.max()
+    if lowest < 0:
+        raise IndexError(f'Sensors start at 0, not {lowest}')
+    if count is not None and highest >= count:
+        raise IndexError(
+            f'Unknown sensor {highest}, the tables have {count} sensors'
+        )
+
+
+def _per_sensor(
+    source: str,
+    target: str,
+    gain: np.ndarray,
+    offset: np.ndarray,
+    sensors: np.ndarray,
+) -> Callable:
+    """
+    Builds the chunk converter for calibrations looked up by sensor, which
+    are folded once, so every reading is a single multiply-add.
+    """
+    scales, offsets = fold(source, target, gain, offset)
+
+    def convert(
+        part: slice, values: np.ndarray, out: np.ndarray, scratch: np.ndarray
+    ) -> None:
+        ids = sensors[part]
+        if scales.ndim:
+            np.take(scales, ids, out=scratch)
+            np.multiply(values, scratch, out=out)
+        else:
+            np.multiply(values, scales, out=out)
+        if offsets.ndim:
+            np.take(offsets, ids, out=scratch)
+            np.add(out, scratch, out=out)
+        else:
+            np.add(out, offsets, out=out)
+
+    return convert
+
+
+def _per_reading(
+    source: str, target: str, gain: np.ndarray, offset: np.ndarray
+) -> Callable:
+    """
+    Builds the chunk converter for calibrations given for every reading.
+    Folding them would cost as much as applying them, so they are applied
+    to each chunk while it's in the cache, before converting it.
+    """
+    scale, shift = COEFFICIENTS[source, target]
+    flat_gain = gain.reshape(-1)
+    flat_offset = offset.reshape(-1)
+
+    def convert(
+        part: slice, values: np.ndarray, out: np.ndarray, scratch: np.ndarray
+    ) -> None:
+        np.multiply(values, flat_gain[part] if gain.ndim else gain, out=out)
+        np.add(out, flat_offset[part] if offset.ndim else offset, out=out)
+        np.multiply(out, scale, out=out)
+        np.add(out, shift, out=out)
+
+    return convert
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Command-line converter, run with ``python -m totemp`` (or ``totemp``).
+
+Reads newline-delimited values (or delimited rows, with --column) and writes
+them converted, e.g. ``python -m totemp -f C -t K < celsius.txt``, or, with
+--binary, converts a raw file of floats through memory maps.
+"""
+
+import argparse
+import os
+import sys
+from contextlib import ExitStack
+from typing import BinaryIO, Sequence
+
+from . import __version__
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .files import _same_file, convert_file
+from .scales import resolve_scale
+
+CHUNK_SIZE = 1 << 20
+
+# Binary files of truncated values hold ints of the size of the floats
+INT_TYPECODES = {'d': 'q', 'f': 'i'}
+
+
+def convert_stream(
+    input: BinaryIO,
+    output: BinaryIO,
+    source: str,
+    target: str,
+    /,
+    *,
+    column: int | None = None,
+    delimiter=b',',
+    header=False,
+    float_ret=True,
+    exact=True,
+    chunk_size=CHUNK_SIZE,
+) -> int:
+    """
+    Converts the values read from a binary stream, writing them into another
+    one, about chunk_size bytes at a time, so the memory used doesn't depend
+    on the size of the input.
+
+    Every line holds one value, or, if a column is given, is a row of fields
+    separated by the delimiter of which only that column is converted (quoted
+    fields holding the delimiter are not supported). Blank lines are kept.
+
+    :param input: Binary stream to read the values from
+    :param output: Binary stream to write the converted values into
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param column: Optional, index (starting at 0) of the field to convert
+    :param delimiter: Optional, bytes separating the fields of a row
+    :param header: Optional, True to copy the first line as it is
+    :param float_ret: Optional, True by default to write floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param chunk_size: Optional, about how many bytes to read at once
+    :return: int, how many lines were converted
+    """
+    method = (CONVERTERS if exact else FAST_CONVERTERS)[
+        resolve_scale(source), resolve_scale(target)
+    ]
+
+    def convert_field(field: bytes) -> bytes:
+        return repr(method(float(field), float_ret=float_ret)).encode()
+
+    def convert_row(line: bytes) -> bytes:
+        row = line.rstrip(b'\r\n')
+        fields = row.split(delimiter)
+        if len(fields) <= column:  # type: ignore
+            raise ValueError(f'the row has only {len(fields)} fields')
+        fields[column] = convert_field(fields[column])  # type: ignore
+        return delimiter.join(fields) + line[len(row) :]
+
+    def convert_line(line: bytes) -> bytes:
+        row = line.rstrip(b'\r\n')
+        return convert_field(row) + line[len(row) :]
+
+    convert = convert_line if column is None else convert_row
+    line_number = 1
+    if header:
+        output.write(input.readline())
+        line_number += 1
+    converted = 0
+    while lines := input.readlines(chunk_size):
+        try:
+            output.write(
+                b''.join(
+                    convert(line) if line.strip() else line for line in lines
+                )
+            )
+        except (ValueError, OverflowError):  # e.g. truncating infinities
+            # Looks for the offending line only once there is one
+            for number, line in enumerate(lines, line_number):
+                try:
+                    if line.strip():
+                        convert(line)
+                except (ValueError, OverflowError) as error:
+                    raise ValueError(f'line {number}: {error}') from None
+            raise
+        line_number += len(lines)
+        converted += len(lines)
+    return converted
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the command-line arguments"""
+    parser = argparse.ArgumentParser(
+        prog='totemp',
+        description=(
+            'Converts temperatures read from a file (or stdin), one per line, '
+            'or the values of raw binary files with --binary.'
+        ),
+    )
+    parser.add_argument(
+        'file',
+        nargs='?',
+        help='file to read from (default: stdin), required with --binary',
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        help='file to write into (default: stdout, or in place with --binary)',
+    )
+    parser.add_argument(
+        '-f', '--from', dest='source', required=True, help='scale of the input'
+    )
+    parser.add_argument(
+        '-t', '--to', dest='target', required=True, help='scale to convert to'
+    )
+    parser.add_argument(
+        '-c',
+        '--column',
+        type=int,
+        help='convert only this field (starting at 1) of delimited rows',
+    )
+    parser.add_argument(
+        '-d',
+        '--delimiter',
+        default=',',
+        help='field delimiter used with --column (default: ",")',
+    )
+    parser.add_argument(
+        '--header',
+        action='store_true',
+        help='copy the first line as it is',
+    )
+    parser.add_argument(
+        '--trunc',
+        action='store_true',
+        help='write truncated ints, as float_ret=False does',
+    )
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='use the single multiply-add conversions (exact=False)',
+    )
+    parser.add_argument(
+        '--binary',
+        metavar='TYPECODE',
+        choices=['d', 'f'],
+        help='convert a raw little-endian file of float64 (d) or float32 (f)',
+    )
+    parser.add_argument(
+        '--version', action='version', version=f'%(prog)s {__version__}'
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Runs the command-line converter.
+
+    :param argv: Optional, arguments to parse, sys.argv[1:] if None
+    :return: int, the exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.column is not None and args.column < 1:
+        parser.error('--column starts at 1')
+
+    if args.binary is not None:
+        if args.file is None:
+            parser.error('--binary needs a file')
+        try:
+            convert_file(
+                args.file,
+                args.source,
+                args.target,
+                out_path=args.output,
+                typecode=args.binary,
+                out_typecode=INT_TYPECODES[args.binary]
+                if args.trunc
+                else None,
+                float_ret=not args.trunc,
+                exact=not args.fast,
+            )
+        except (OSError, ValueError, OverflowError) as error:
+            parser.exit(1, f'{parser.prog}: error: {error}\n')
+        return 0
+
+    try:
+        with ExitStack() as files:
+            input = sys.stdin.buffer
+            if args.file is not None:
+                input = files.enter_context(open(args.file, 'rb'))
+            output = sys.stdout.buffer
+            if args.output is not None:
+                if args.file is not None and _same_file(
+                    args.file, args.output
+                ):
+                    parser.error('--output must not be the input file')
+                output = files.enter_context(open(args.output, 'wb'))
+            convert_stream(
+                input,
+                output,
+                args.source,
+                args.target,
+                column=None if args.column is None else args.column - 1,
+                delimiter=args.delimiter.encode(),
+                header=args.header,
+                float_ret=not args.trunc,
+                exact=not args.fast,
+            )
+            output.flush()  # Here, to end quietly if the pipe is closed
+    except BrokenPipeError:
+        # The reader went away (e.g. head), which ends a pipeline quietly:
+        # stdout goes to devnull, so flushing it at exit can't fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, OverflowError) as error:
+        parser.exit(1, f'{parser.prog}: error: {error}\n')
+    finally:
+        sys.stdout.flush()
+    return 0
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from math import trunc
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # Slow to import, and only needed by type checkers
+    from collections.abc import Callable
+    from typing import Any, Protocol
+
+    class Converter(Protocol):
+        """A function returned by converter, with its attributes"""
+
+        source: str
+        target: str
+        float_ret: bool
+        exact: bool
+        coefficients: tuple[float, float]
+        formula: tuple[tuple[str, float | int], ...]
+        inverse: Converter
+
+        def __call__(self, value: float | int, /) -> float | int:
+            ...
+
+        def batch(self, values: Any, /, *, out: Any = None) -> Any:
+            ...
+
+
+from .scales import ALIASES, COEFFICIENTS, FORMULAS, SCALES, resolve_scale
+from .temperature_types import (
+    Celsius,
+    Delisle,
+    Fahrenheit,
+    Kelvin,
+    Newton,
+    Rankine,
+    Reaumur,
+    Romer,
+)
+
+CLASSES = {
+    'celsius': Celsius,
+    'delisle': Delisle,
+    'fahrenheit': Fahrenheit,
+    'kelvin': Kelvin,
+    'newton': Newton,
+    'rankine': Rankine,
+    'reaumur': Reaumur,
+    'romer': Romer,
+}
+
+
+def _identity(value: float | int, /, *, float_ret=True) -> float | int:
+    """Keeps the value in its own scale, only applying the return type"""
+    if float_ret:
+        return float(value)
+    return trunc(value)
+
+
+# The method of every one of the 64 source/target pairs, looked up only once
+CONVERTERS: dict[tuple[str, str], Callable[..., float | int]] = {
+    (source, target): (
+        _identity
+        if source == target
+        else getattr(CLASSES[source], f'to_{target}')
+    )
+    for source in SCALES
+    for target in SCALES
+}
+
+
+def _fused(scale: float, offset: float) -> Callable[..., float | int]:
+    """Builds a converter doing the single multiply-add of a pair"""
+
+    def converter(value: float | int, /, *, float_ret=True) -> float | int:
+        if float_ret:
+            return float(value * scale + offset)
+        return trunc(value * scale + offset)
+
+    return converter
+
+
+# The single multiply-add of every pair, used when exactness can be traded
+FAST_CONVERTERS: dict[tuple[str, str], Callable[..., float | int]] = {
+    pair: _fused(scale, offset)
+    for pair, (scale, offset) in COEFFICIENTS.items()
+}
+
+
+def convert(
+    value: float | int,
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+) -> float | int:
+    """
+    Converts a value from the source scale to the target scale, returning a
+    float by default.
+
+    The scales can be given by name or abbreviation (e.g. 'celsius' or 'C')
+    and the result is the same as the one of the matching method
+    (e.g. Celsius.to_fahrenheit for 'C' and 'F').
+
+    If the exact parameter is False, the conversion is done as one multiply-add
+    with precomputed coefficients, which is faster, but may differ from the
+    methods in the last bits (see totemp.precision for how much).
+
+    If the float_ret parameter is False, it returns an approximate int value
+    (using the math's module trunc function).
+
+    :param value: Value to be converted
+    :param source: Name or abbreviation of the scale of the value
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :return: float or int
+    """
+    converters = CONVERTERS if exact else FAST_CONVERTERS
+    try:
+        method = converters[ALIASES[source], ALIASES[target]]
+    except KeyError:
+        method = converters[resolve_scale(source), resolve_scale(target)]
+    return method(value, float_ret=float_ret)
+
+
+_SYMBOLS = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/'}
+
+_SPECIALIZED: dict[tuple[str, str, bool, bool], Converter] = {}
+
+
+def _literal(constant: float | int) -> str:
+    """Writes a constant as Python code that evaluates to the same number"""
+    return f'({constant!r})' if constant < 0 else repr(constant)
+
+
+def _expression(formula: tuple[tuple[str, float | int], ...]) -> str:
+    """
+    Writes the steps of a formula as one Python expression of 'value',
+    keeping the order of the operations.
+
+    :param formula: Steps of the conversion, as listed in scales.FORMULAS
+    :return: str
+    """
+    expression = 'value'
+    for operation, constant in formula:
+        if operation == 'rsub':
+            expression = f'{_literal(constant)} - {expression}'
+        else:
+            symbol = _SYMBOLS[operation]
+            expression = f'{expression} {symbol} {_literal(constant)}'
+        expression = f'({expression})'
+    return expression
+
+
+def _specialize(
+    source: str, target: str, float_ret: bool, exact: bool
+) -> Converter:
+    """Compiles the function doing only the conversion of a pair"""
+    scale, offset = COEFFICIENTS[source, target]
+    if exact:
+        formula = FORMULAS[source, target]
+    else:
+        formula = (('mul', scale), ('add', offset))
+    name = f'{source}_to_{target}'
+    code = (
+        f'def {name}(value, /):\n'
+        f'    return {"float" if float_ret else "trunc"}'
+        f'({_expression(formula)})\n'
+    )
+    namespace: dict[str, Any] = {'trunc': trunc}
+    exec(code, namespace)
+
+    def batch(values: Any, /, *, out: Any = None) -> Any:
+        """Converts a NumPy array at once, as convert_array does"""
+        from .arrays import convert_array
+
+        return convert_array(
+            values, source, target, float_ret=float_ret, exact=exact, out=out
+        )
+
+    function = namespace[name]
+    function.__module__ = __name__
+    function.__doc__ = (
+        f'Converts {source.capitalize()} to {target.capitalize()}, '
+        f'returning {"a float" if float_ret else "an int"}.'
+    )
+    function.source = source
+    function.target = target
+    function.float_ret = float_ret
+    function.exact = exact
+    function.coefficients = (scale, offset)
+    function.formula = formula
+    function.batch = batch
+    return function
+
+
+def converter(
+    source: str, target: str, /, *, float_ret=True, exact=True
+) -> Converter:
+    """
+    Gets a function converting from the source scale to the target scale,
+    compiled for that pair and return type: it takes only the value and does
+    nothing but the conversion, with the constants written in its code.
+
+    Its results are the same as the ones of convert with these parameters,
+    and it also has these attributes:
+
+    - source and target, the names of the scales
+    - float_ret and exact, as given
+    - coefficients, the (scale, offset) of target = value * scale + offset
+    - formula, the steps it does, as listed in scales.FORMULAS
+    - inverse, the converter of the opposite conversion
+    - batch(values, /, *, out=None), converting a NumPy array at once
+
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :return: function, typed as the Converter protocol for type checkers
+    """
+    key = resolve_scale(source), resolve_scale(target), float_ret, exact
+    if key not in _SPECIALIZED:
+        inverse_key = key[1], key[0], float_ret, exact
+        forward = _specialize(*key)
+        backward = _specialize(*inverse_key)
+        forward.inverse = backward
+        backward.inverse = forward
+        _SPECIALIZED[key] = forward
+        _SPECIALIZED[inverse_key] = backward
+    return _SPECIALIZED[key]
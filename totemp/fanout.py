@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Any, Iterable
+
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .scales import SCALES, resolve_scale
+
+try:
+    import numpy as np
+
+    from .arrays import convert_array
+except ImportError:  # NumPy is optional, only arrays need it
+    np = None  # type: ignore[assignment]
+
+OUTPUTS = ('dict', 'tuple', 'record')
+
+# 512 KiB of float64 per chunk, read once from memory for every target
+CHUNK_SIZE = 1 << 16
+
+
+def _targets(targets: Iterable[str] | None) -> tuple[str, ...]:
+    """Resolves the names of the targets, every scale if None"""
+    if targets is None:
+        return SCALES
+    resolved = tuple(map(resolve_scale, targets))
+    if not resolved:
+        raise ValueError('At least one target must be given')
+    if len(set(resolved)) != len(resolved):
+        raise ValueError('Every target must be given only once')
+    return resolved
+
+
+def _convert_scalar(
+    value: Any,
+    source: str,
+    targets: tuple[str, ...],
+    float_ret: bool,
+    exact: bool,
+) -> list[float | int]:
+    """Converts one value with the methods, or through Kelvin if not exact"""
+    if exact:
+        return [
+            CONVERTERS[source, target](value, float_ret=float_ret)
+            for target in targets
+        ]
+    kelvin = FAST_CONVERTERS[source, 'kelvin'](value)
+    return [
+        FAST_CONVERTERS['kelvin', target](kelvin, float_ret=float_ret)
+        for target in targets
+    ]
+
+
+def _convert_chunks(
+    values: Any,
+    source: str,
+    targets: tuple[str, ...],
+    results: list[Any],
+    float_ret: bool,
+    exact: bool,
+    chunk_size: int,
+) -> None:
+    """
+    Converts flat values into every flat array of results, chunk by chunk,
+    so every chunk is read from memory once and then from the cache.
+    """
+    kelvin = None if exact else np.empty(min(chunk_size, len(values)))
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size]
+        if kelvin is not None:
+            chunk = convert_array(
+                chunk, source, 'kelvin', exact=False, out=kelvin[: len(chunk)]
+            )
+        for target, result in zip(targets, results):
+            convert_array(
+                chunk,
+                source if exact else 'kelvin',
+                target,
+                float_ret=float_ret,
+                exact=exact,
+                out=result[start : start + len(chunk)],
+            )
+
+
+def _convert_records(
+    values: Any,
+    source: str,
+    targets: tuple[str, ...],
+    record: Any,
+    float_ret: bool,
+    exact: bool,
+    chunk_size: int,
+) -> None:
+    """
+    Converts flat values into a flat record array, chunk by chunk: every
+    target of a chunk is converted into a row of a scratch array, which is
+    then copied into the records at once, as converting into the fields
+    directly would write all over the records once per target.
+    """
+    rows = max(1, chunk_size // len(targets))
+    scratch = np.empty((len(targets), min(rows, len(values))))
+    fields = record.view(scratch.dtype if float_ret else np.int64)
+    fields = fields.reshape(len(values), len(targets))
+    for start in range(0, len(values), rows):
+        chunk = values[start : start + rows]
+        _convert_chunks(
+            chunk,
+            source,
+            targets,
+            [row[: len(chunk)] for row in scratch],
+            True,
+            exact,
+            rows,
+        )
+        if float_ret:
+            fields[start : start + len(chunk)] = scratch[:, : len(chunk)].T
+            continue
+        part = scratch[:, : len(chunk)]
+        np.trunc(part, out=part)
+        if not np.isfinite(part).all():
+            raise ValueError('Cannot truncate NaN or infinite values to int')
+        np.copyto(fields[start : start + len(chunk)], part.T, casting='unsafe')
+
+
+def convert_all(
+    values: Any,
+    source: str,
+    /,
+    targets: Iterable[str] | None = None,
+    *,
+    float_ret=True,
+    exact=True,
+    output='dict',
+    chunk_size=CHUNK_SIZE,
+) -> Any:
+    """
+    Converts a value, or an array of values, from the source scale to every
+    target scale (every one of the eight scales by default) in one pass.
+
+    Arrays are converted chunk by chunk, each chunk into every target before
+    moving on to the next one, so the values are read from memory only once
+    instead of once per target.
+
+    With exact=True, every target is computed with its own formula, giving
+    the same results as the methods. With exact=False, the values are
+    converted into Kelvin once, and every target is then a multiply-add of
+    that intermediate, which may differ from the methods in the last bits.
+
+    :param values: Value, or array (or array-like) of values, to convert
+    :param source: Name or abbreviation of the scale of the values
+    :param targets: Optional, names or abbreviations of the scales to
+        convert to (at least one), every scale (in scales.SCALES order) if
+        None
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param output: Optional, 'dict' (the default) of results by target name,
+        'tuple' of results in the order of targets, or 'record' for a NumPy
+        structured array with a field per target
+    :param chunk_size: Optional, how many values are converted at once
+    :return: dict, tuple or numpy.ndarray, of arrays for arrays of values
+    """
+    source = resolve_scale(source)
+    targets = _targets(targets)
+    if output not in OUTPUTS:
+        raise ValueError(
+            f'Unknown output {output!r}, expected one of {", ".join(OUTPUTS)}'
+        )
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be at least 1, not {chunk_size}')
+    if np is not None:
+        dtype = np.dtype(np.float64 if float_ret else np.int64)
+        record_dtype = np.dtype([(target, dtype) for target in targets])
+    try:
+        iter(values)
+    except TypeError:  # A single value
+        scalars = _convert_scalar(values, source, targets, float_ret, exact)
+        if output == 'dict':
+            return dict(zip(targets, scalars))
+        if output == 'tuple':
+            return tuple(scalars)
+        if np is None:
+            raise ImportError('Record outputs of convert_all need NumPy')
+        return np.array(tuple(scalars), dtype=record_dtype)
+    if np is None:
+        raise ImportError('Converting arrays with convert_all needs NumPy')
+
+    values = np.asarray(values)
+    if output == 'record':
+        record = np.empty(values.shape, dtype=record_dtype)
+        _convert_records(
+            values.reshape(-1),
+            source,
+            targets,
+            record.reshape(-1),
+            float_ret,
+            exact,
+            chunk_size,
+        )
+        return record
+    arrays = [np.empty(values.shape, dtype=dtype) for _ in targets]
+    _convert_chunks(
+        values.reshape(-1),
+        source,
+        targets,
+        [array.reshape(-1) for array in arrays],
+        float_ret,
+        exact,
+        chunk_size,
+    )
+    if output == 'dict':
+        return dict(zip(targets, arrays))
+    return tuple(arrays)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import mmap
+import os
+import sys
+from contextlib import ExitStack
+
+from .buffers import convert_buffer
+from .scales import resolve_scale
+
+WINDOW_SIZE = 4096 * mmap.PAGESIZE
+
+
+def _same_file(path: str | os.PathLike, other: str | os.PathLike) -> bool:
+    """Whether other names the file of path, e.g. through a link"""
+    try:
+        return os.path.samefile(path, other)
+    except FileNotFoundError:
+        return False
+
+
+def convert_file(
+    path: str | os.PathLike,
+    source: str,
+    target: str,
+    /,
+    *,
+    out_path: str | os.PathLike | None = None,
+    typecode='d',
+    out_typecode: str | None = None,
+    float_ret=True,
+    exact=True,
+    window_size=WINDOW_SIZE,
+) -> int:
+    """
+    Converts a raw binary file of little-endian floats (typecode 'd' for
+    float64 or 'f' for float32), in place by default or into out_path.
+
+    The file is memory-mapped one window of window_size bytes at a time and
+    every window is unmapped once converted, so the memory used doesn't
+    depend on the size of the file. The input is mapped read-only when
+    there is an out_path, so its pages are never copied nor written.
+
+    The results are the same as the ones of the matching methods, and with
+    float_ret False they can be written as ints (e.g. out_typecode='q').
+
+    An out_path naming the file itself converts it in place, instead of
+    truncating the values before reading them.
+
+    :param path: Path of the file holding the values
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param out_path: Optional, path of the file to write the results into
+    :param typecode: Optional, struct format of the values, 'd' by default
+    :param out_typecode: Optional, struct format of the results
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param window_size: Optional, about how many bytes to map at once
+    :return: int, how many values were converted
+    """
+    if sys.byteorder != 'little':
+        raise ValueError('Raw little-endian files need a little-endian host')
+    pair = resolve_scale(source), resolve_scale(target)
+    out_typecode = out_typecode or typecode
+    itemsize = memoryview(bytes(8)).cast(typecode).itemsize
+    out_itemsize = memoryview(bytes(8)).cast(out_typecode).itemsize
+
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(
+            f'{os.fspath(path)!r} has {size} bytes, which is not a multiple '
+            f'of the {itemsize} bytes of {typecode!r} values'
+        )
+    count = size // itemsize
+    if out_path is not None and _same_file(path, out_path):
+        out_path = None  # Rather than truncating the values before reading
+    in_place = out_path is None
+    if in_place and out_itemsize != itemsize:
+        raise ValueError('Files converted in place must keep the item size')
+    if (
+        in_place
+        and pair[0] == pair[1]
+        and float_ret
+        and out_typecode == typecode
+    ):
+        return count
+
+    # Windows start at multiples of the allocation granularity, as mmap
+    # offsets must, whatever the size of the items
+    granularity = mmap.ALLOCATIONGRANULARITY
+    values_per_window = window_size // max(itemsize, out_itemsize)
+    values_per_window = max(
+        granularity, values_per_window - values_per_window % granularity
+    )
+    access = mmap.ACCESS_WRITE if in_place else mmap.ACCESS_READ
+    with ExitStack() as files:
+        file = files.enter_context(open(path, 'r+b' if in_place else 'rb'))
+        if out_path is None:
+            out_file = file
+        else:
+            out_file = files.enter_context(open(out_path, 'w+b'))
+        out_file.truncate(count * out_itemsize)
+        for first in range(0, count, values_per_window):
+            length = min(values_per_window, count - first)
+            with ExitStack() as windows:
+                window = windows.enter_context(
+                    mmap.mmap(
+                        file.fileno(),
+                        length * itemsize,
+                        access=access,
+                        offset=first * itemsize,
+                    )
+                )
+                if in_place:
+                    out_window = window
+                else:
+                    out_window = windows.enter_context(
+                        mmap.mmap(
+                            out_file.fileno(),
+                            length * out_itemsize,
+                            access=mmap.ACCESS_WRITE,
+                            offset=first * out_itemsize,
+                        )
+                    )
+                convert_buffer(
+                    window,
+                    *pair,
+                    out=out_window,
+                    typecode=typecode,
+                    out_typecode=out_typecode,
+                    float_ret=float_ret,
+                    exact=exact,
+                )
+                out_window.flush()
+    return count
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from functools import lru_cache
+from math import gcd
+from typing import Any
+
+from .buffers import CHUNK_SIZE
+from .scales import affine, resolve_scale
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only needed for arrays
+    np = None  # type: ignore[assignment]
+
+ROUNDING_MODES = ('floor', 'ceil', 'trunc', 'half_up', 'half_even')
+
+
+@lru_cache(maxsize=256)
+def fixed_coefficients(
+    source: str, target: str, unit: int, out_unit: int
+) -> tuple[int, int, int]:
+    """
+    Gets the ints of the conversion of fixed-point values: a value of the
+    source scale stored as value * unit is converted into the target scale,
+    stored as result * out_unit, as (stored * first + second) / third.
+
+    :param source: Canonical name of the scale to convert from
+    :param target: Canonical name of the scale to convert to
+    :param unit: Units per degree of the values, e.g. 1000 for milli-degrees
+    :param out_unit: Units per degree of the results
+    :return: tuple of (first, second, third) ints, third being positive
+    """
+    if unit < 1 or out_unit < 1:
+        raise ValueError('Units per degree must be positive ints')
+    scale, offset = affine(source, target)
+    first = out_unit * scale.numerator * offset.denominator
+    second = out_unit * unit * offset.numerator * scale.denominator
+    third = unit * scale.denominator * offset.denominator
+    divisor = gcd(first, second, third)
+    return first // divisor, second // divisor, third // divisor
+
+
+def _round(numerator: Any, denominator: int, rounding: str) -> Any:
+    """
+    Divides ints (or NumPy arrays of ints) rounding the quotients as asked,
+    with only integer operations.
+    """
+    # Not divmod, which NumPy does much slower than a floor division alone
+    quotient = numerator // denominator
+    if rounding == 'floor':
+        return quotient
+    remainder = numerator - quotient * denominator
+    if rounding == 'ceil':
+        return quotient + (remainder != 0)
+    if rounding == 'trunc':
+        return quotient + ((remainder != 0) & (quotient < 0))
+    twice = remainder * 2
+    if rounding == 'half_up':  # Half away from zero
+        return quotient + (
+            (twice > denominator) | ((twice == denominator) & (quotient >= 0))
+        )
+    if rounding == 'half_even':
+        return quotient + (
+            (twice > denominator)
+            | ((twice == denominator) & (quotient % 2 == 1))
+        )
+    raise ValueError(
+        f'Unknown rounding mode {rounding!r}, '
+        f'expected one of {", ".join(ROUNDING_MODES)}'
+    )
+
+
+def convert_fixed(
+    value: int,
+    source: str,
+    target: str,
+    /,
+    *,
+    unit=1000,
+    out_unit: int | None = None,
+    rounding='half_even',
+) -> int:
+    """
+    Converts a fixed-point temperature, an int counting units of 1 / unit
+    degree (e.g. milli-degrees), from the source scale to the target scale,
+    computing with ints only.
+
+    The result is the exact conversion rounded once, as rounding says, into
+    an int counting units of 1 / out_unit degree (unit by default), so it's
+    the same on every platform.
+
+    :param value: Int of the temperature, in units of the source scale
+    :param source: Name or abbreviation of the scale of the value
+    :param target: Name or abbreviation of the scale to convert to
+    :param unit: Optional, units per degree of the value, 1000 by default
+    :param out_unit: Optional, units per degree of the result
+    :param rounding: Optional, one of 'floor', 'ceil', 'trunc', 'half_up'
+        (half away from zero) and 'half_even', the default
+    :return: int
+    """
+    if not isinstance(value, int):
+        raise TypeError(f'Fixed-point values are ints, not {type(value)}')
+    first, second, third = fixed_coefficients(
+        resolve_scale(source),
+        resolve_scale(target),
+        unit,
+        unit if out_unit is None else out_unit,
+    )
+    return int(_round(value * first + second, third, rounding))
+
+
+def convert_fixed_array(
+    values: Any,
+    source: str,
+    target: str,
+    /,
+    *,
+    unit=1000,
+    out_unit: int | None = None,
+    rounding='half_even',
+    out: Any = None,
+    chunk_size=CHUNK_SIZE,
+) -> Any:
+    """
+    Converts an array of fixed-point temperatures (e.g. int32 or int64
+    milli-degrees) at once, with the same results as convert_fixed, computing
+    with int64 operations only, into an int64 array by default.
+
+    :param values: NumPy array (or array-like) of ints
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param unit: Optional, units per degree of the values, 1000 by default
+    :param out_unit: Optional, units per degree of the results
+    :param rounding: Optional, rounding mode, as in convert_fixed
+    :param out: Optional, preallocated int array to write the results into
+    :param chunk_size: Optional, how many values are converted at once
+    :return: numpy.ndarray (out itself if it was given)
+    """
+    if np is None:
+        raise ImportError('NumPy is needed to convert arrays')
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iu':
+        raise TypeError(f'Fixed-point values are ints, not {values.dtype}')
+    first, second, third = fixed_coefficients(
+        resolve_scale(source),
+        resolve_scale(target),
+        unit,
+        unit if out_unit is None else out_unit,
+    )
+
+    limit = np.iinfo(np.int64).max
+    if values.size:
+        largest = max(abs(int(values.min())), abs(int(values.max())))
+        if largest * abs(first) + abs(second) + 2 * third > limit:
+            raise OverflowError(
+                'The values are too large to be converted with int64'
+            )
+    if out is None:
+        out = np.empty(values.shape, dtype=np.int64)
+    elif out.shape != values.shape:
+        raise ValueError(
+            f'out has shape {out.shape}, but values have shape {values.shape}'
+        )
+    bounds = np.iinfo(out.dtype)
+
+    # In chunks, so the intermediate arrays are small and stay in the cache
+    flat_values = values.reshape(-1)
+    # Written through a flat view, which is only a view if it's contiguous
+    results = out if out.flags.c_contiguous else np.empty_like(out)
+    flat_out = results.reshape(-1)
+    numerator = np.empty(min(chunk_size, values.size), dtype=np.int64)
+    for start in range(0, values.size, chunk_size):
+        chunk = flat_values[start : start + chunk_size]
+        part = numerator[: len(chunk)]
+        np.multiply(chunk, first, out=part, dtype=np.int64)
+        part += second
+        result = _round(part, third, rounding)
+        if result.min() < bounds.min or result.max() > bounds.max:
+            raise OverflowError(f'The results do not fit into {out.dtype}')
+        flat_out[start : start + chunk_size] = result
+    if results is not out:
+        np.copyto(out, results)
+    return out
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable
+
+from .conversion import CLASSES, CONVERTERS, FAST_CONVERTERS
+from .scales import resolve_scale
+
+Key = tuple[str, str, bool]
+
+
+class Stats:
+    """Calls, values converted and latencies of one conversion pair"""
+
+    __slots__ = ('calls', 'elements', 'nanoseconds', 'histogram')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.elements = 0
+        self.nanoseconds = 0
+        # Bucket n counts the calls that took less than 2 ** n nanoseconds
+        self.histogram = [0] * 64
+
+    def record(self, elements: int, nanoseconds: int) -> None:
+        """Counts a call, converting elements values in nanoseconds"""
+        self.calls += 1
+        self.elements += elements
+        self.nanoseconds += nanoseconds
+        self.histogram[min(nanoseconds.bit_length(), 63)] += 1
+
+    def export(self) -> dict[str, Any]:
+        """Gets the stats as a dict, the histogram without empty buckets"""
+        return {
+            'calls': self.calls,
+            'elements': self.elements,
+            'seconds': self.nanoseconds / 1e9,
+            'histogram': {
+                2**bucket: count
+                for bucket, count in enumerate(self.histogram)
+                if count
+            },
+        }
+
+
+_STATS: dict[Key, Stats] = {}
+
+# How to put back every function swapped by enable, in the same order
+_RESTORE: list[Callable[[], None]] = []
+
+
+def _stats(key: Key) -> Stats:
+    """Gets the stats of a key, created on its first call"""
+    try:
+        return _STATS[key]
+    except KeyError:
+        return _STATS.setdefault(key, Stats())
+
+
+def _instrument_scalar(
+    pair: tuple[str, str], method: Callable[..., float | int]
+) -> Callable[..., float | int]:
+    """Wraps a method converting one value, timing every call"""
+    source, target = pair
+
+    @wraps(method)
+    def instrumented(value: float | int, /, *, float_ret=True) -> float | int:
+        start = perf_counter_ns()
+        result = method(value, float_ret=float_ret)
+        elapsed = perf_counter_ns() - start
+        _stats((source, target, float_ret)).record(1, elapsed)
+        return result
+
+    return instrumented
+
+
+def _instrument_batch(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wraps convert_array, timing every call and counting its values"""
+
+    @wraps(function)
+    def instrumented(
+        values: Any, source: str, target: str, /, **options: Any
+    ) -> Any:
+        start = perf_counter_ns()
+        result = function(values, source, target, **options)
+        elapsed = perf_counter_ns() - start
+        key = (
+            resolve_scale(source),
+            resolve_scale(target),
+            options.get('float_ret', True),
+        )
+        _stats(key).record(getattr(result, 'size', 1), elapsed)
+        return result
+
+    return instrumented
+
+
+def _swap(container: Any, name: Any, replacement: Any) -> None:
+    """Sets an attribute or item, keeping how to put the original back"""
+    if isinstance(container, dict):
+        original = container[name]
+        container[name] = replacement
+        _RESTORE.append(lambda: container.__setitem__(name, original))
+    else:
+        original = container.__dict__[name]
+        setattr(container, name, replacement)
+        _RESTORE.append(lambda: setattr(container, name, original))
+
+
+def enable() -> None:
+    """
+    Swaps the methods of the classes, the converters looked up by convert,
+    Temperature and convert_buffer, and convert_array, for instrumented
+    ones, recording the calls of every (source, target, float_ret) key
+    until disable is called. Exact and fast conversions share their keys.
+
+    Nothing is checked when it's disabled, as the original functions are
+    then called directly. Functions returned by converter, and modules of
+    totemp imported after enabling it, are not instrumented.
+
+    :return: None
+    """
+    if _RESTORE:
+        return
+    for converters in (CONVERTERS, FAST_CONVERTERS):
+        for pair, method in list(converters.items()):
+            _swap(converters, pair, _instrument_scalar(pair, method))
+    for (source, target), method in CONVERTERS.items():
+        if source != target:
+            _swap(CLASSES[source], f'to_{target}', staticmethod(method))
+
+    arrays = sys.modules.get(f'{__package__}.arrays')
+    if arrays is not None:
+        original = arrays.convert_array
+        instrumented = _instrument_batch(original)
+        for name, module in list(sys.modules.items()):
+            if (
+                name.startswith(f'{__package__}.')
+                and getattr(module, 'convert_array', None) is original
+            ):
+                _swap(module, 'convert_array', instrumented)
+
+
+def disable() -> None:
+    """
+    Puts back the original functions, keeping what was recorded.
+
+    :return: None
+    """
+    while _RESTORE:
+        _RESTORE.pop()()
+
+
+def is_enabled() -> bool:
+    """
+    Tells whether the instrumented functions are in use.
+
+    :return: bool
+    """
+    return bool(_RESTORE)
+
+
+def reset() -> None:
+    """
+    Forgets everything recorded so far.
+
+    :return: None
+    """
+    _STATS.clear()
+
+
+def snapshot() -> dict[Key, dict[str, Any]]:
+    """
+    Gets what was recorded for every (source, target, float_ret) key: the
+    number of calls, of values converted (one per call of the methods, the
+    size of the arrays for convert_array), their total time in seconds and
+    their latency histogram, mapping upper bounds in nanoseconds to the
+    number of calls that took less than them.
+
+    :return: dict
+    """
+    return {key: stats.export() for key, stats in _STATS.items()}
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """Enables the instrumentation in a with block, then disables it"""
+    enable()
+    try:
+        yield
+    finally:
+        disable()
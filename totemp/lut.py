@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .scales import resolve_scale
+
+try:
+    import numpy as np
+
+    from .arrays import convert_array
+except ImportError:  # NumPy is optional, only batch() needs it
+    np = None  # type: ignore[assignment]
+
+MAX_SIZE = 1 << 20
+
+FLOAT16 = 'float16'
+
+_MAGIC = b'TOTEMP-LUT\n'
+
+# Bits of the exponent of a float16, all set for infinities and NaNs
+_FLOAT16_EXPONENT = 0x7C00
+
+
+class LookupTable:
+    """
+    Results of a conversion precomputed over a bounded domain: every int of
+    start..stop, or every one of the 65,536 float16 values.
+
+    Converting is then a lookup, for a value (calling the table) or for a
+    whole array (batch), and the results are the same as the ones of the
+    matching method, which is still used for values outside the domain.
+    """
+
+    __slots__ = (
+        'source',
+        'target',
+        'start',
+        'stop',
+        'float_ret',
+        'exact',
+        '_table',
+        '_method',
+        '_array',
+    )
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        start: int | str,
+        stop: int | None = None,
+        /,
+        *,
+        float_ret=True,
+        exact=True,
+        max_size=MAX_SIZE,
+        table: array | None = None,
+    ) -> None:
+        """
+        Builds the table of a conversion over the ints start..stop (both
+        included), or over every float16 value if start is 'float16'.
+
+        :param source: Name or abbreviation of the scale of the values
+        :param target: Name or abbreviation of the scale to convert to
+        :param start: Smallest int of the domain, or 'float16'
+        :param stop: Greatest int of the domain, None for float16
+        :param float_ret: Optional, True by default to return floats
+        :param exact: Optional, True by default to match the methods
+        :param max_size: Optional, most entries the table may have
+        :param table: Optional, already computed results (see load)
+        """
+        self.source = resolve_scale(source)
+        self.target = resolve_scale(target)
+        self.float_ret = float_ret
+        self.exact = exact
+        self._method = (CONVERTERS if exact else FAST_CONVERTERS)[
+            self.source, self.target
+        ]
+        self.start: int | str
+        self.stop: int | None
+        if start == FLOAT16:
+            if stop is not None:
+                raise ValueError('float16 tables cover every float16 value')
+            self.start, self.stop = FLOAT16, None
+            domain: Any = struct.unpack(
+                '<65536e', bytes(array('H', range(65536)))
+            )
+        else:
+            if not isinstance(start, int) or not isinstance(stop, int):
+                raise TypeError(
+                    'The domain of a table must be ints or float16'
+                )
+            if stop < start:
+                raise ValueError(f'The domain {start}..{stop} is empty')
+            self.start, self.stop = start, stop
+            domain = range(start, stop + 1)
+        if len(domain) > max_size:
+            raise ValueError(
+                f'The table would have {len(domain)} entries, '
+                f'more than max_size ({max_size})'
+            )
+
+        if table is None:
+            table = array('d' if float_ret else 'q', map(self._entry, domain))
+        elif len(table) != len(domain):
+            raise ValueError("The table doesn't match its domain")
+        self._table = table
+        self._array: Any = None  # NumPy view of the table, once needed
+
+    def _entry(self, value: float | int) -> float | int:
+        """Computes one entry, using 0 where trunc can't (NaN or infinity)"""
+        try:
+            return self._method(value, float_ret=self.float_ret)
+        except (ValueError, OverflowError):
+            return 0
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        domain = (
+            FLOAT16 if self.start == FLOAT16 else f'{self.start}..{self.stop}'
+        )
+        return (
+            f'{type(self).__name__}({self.source!r}, {self.target!r}, '
+            f'{domain}, float_ret={self.float_ret}, exact={self.exact})'
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the results, in bytes"""
+        return len(self._table) * self._table.itemsize
+
+    def __call__(self, value: float | int, /) -> float | int:
+        """
+        Converts one value, looking it up if it's in the domain.
+
+        :param value: Value to be converted
+        :return: float or int, as the method of the conversion returns
+        """
+        if self.start == FLOAT16:
+            try:
+                (bits,) = struct.unpack('<H', struct.pack('<e', value))
+            except (OverflowError, struct.error):
+                return self._method(value, float_ret=self.float_ret)
+            # Only values that are float16 themselves are in the table
+            if struct.unpack('<e', struct.pack('<H', bits))[0] == value and (
+                self.float_ret or bits & _FLOAT16_EXPONENT != _FLOAT16_EXPONENT
+            ):
+                return self._table[bits]
+            return self._method(value, float_ret=self.float_ret)
+        index = value - self.start  # type: ignore[operator]
+        if 0 <= index < len(self._table):
+            try:
+                return self._table[index]  # type: ignore[index]
+            except TypeError:  # not an int
+                pass
+        return self._method(value, float_ret=self.float_ret)
+
+    def batch(self, values: Any, /, *, out: Any = None) -> Any:
+        """
+        Converts a whole NumPy array (of ints, or of float16 values for
+        float16 tables) with one gather.
+
+        :param values: Array of values to be converted
+        :param out: Optional, preallocated array to write the results into
+        :return: numpy.ndarray (out itself if it was given)
+        """
+        if np is None:
+            raise ImportError('LookupTable.batch needs NumPy')
+        values = np.asarray(values)
+        if self._array is None:
+            self._array = np.frombuffer(
+                self._table, dtype=self._table.typecode
+            )
+
+        if self.start == FLOAT16:
+            if values.dtype != np.float16:
+                raise TypeError('float16 tables need float16 values')
+            indexes = values.view(np.uint16)
+            if (
+                not self.float_ret
+                and (indexes & _FLOAT16_EXPONENT == _FLOAT16_EXPONENT).any()
+            ):
+                raise ValueError(
+                    'Cannot truncate NaN or infinite values to int'
+                )
+            return np.take(self._array, indexes, out=out)
+
+        if values.dtype.kind not in 'iu':
+            raise TypeError(f'int tables need int values, not {values.dtype}')
+        indexes = np.subtract(values, self.start, dtype=np.intp)
+        if not indexes.size or (
+            indexes.min() >= 0 and indexes.max() < len(self._table)
+        ):
+            return np.take(self._array, indexes, out=out)
+        # Values outside the domain are converted by the formula instead
+        outside = (indexes < 0) | (indexes >= len(self._table))
+        result = np.take(self._array, indexes, mode='clip', out=out)
+        result[outside] = convert_array(
+            values[outside],
+            self.source,
+            self.target,
+            float_ret=self.float_ret,
+            exact=self.exact,
+        )
+        return result
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Writes the table into a file, to be read back by load.
+
+        :param path: Path of the file
+        """
+        header = {
+            'source': self.source,
+            'target': self.target,
+            'start': self.start,
+            'stop': self.stop,
+            'float_ret': self.float_ret,
+            'exact': self.exact,
+            'typecode': self._table.typecode,
+            'byteorder': sys.byteorder,
+        }
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(json.dumps(header).encode() + b'\n')
+            self._table.tofile(file)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike, /, *, max_size=MAX_SIZE
+    ) -> 'LookupTable':
+        """
+        Reads a table written by save.
+
+        :param path: Path of the file
+        :param max_size: Optional, most entries the table may have
+        :return: LookupTable
+        """
+        with open(path, 'rb') as file:
+            if file.readline() != _MAGIC:
+                raise ValueError(f'{os.fspath(path)!r} is not a lookup table')
+            header = json.loads(file.readline())
+            table = array(header['typecode'])
+            table.frombytes(file.read())
+        if header['byteorder'] != sys.byteorder:
+            table.byteswap()
+        return cls(
+            header['source'],
+            header['target'],
+            header['start'],
+            header['stop'],
+            float_ret=header['float_ret'],
+            exact=header['exact'],
+            max_size=max_size,
+            table=table,
+        )
+
+
+@lru_cache(maxsize=32)
+def lookup_table(
+    source: str,
+    target: str,
+    start: int | str,
+    stop: int | None = None,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    cache_dir: str | os.PathLike | None = None,
+) -> LookupTable:
+    """
+    Gets the table of a conversion, keeping the 32 last ones in memory and,
+    if a cache_dir is given, reading it from there instead of building it
+    (or writing it there once built).
+
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param start: Smallest int of the domain, or 'float16'
+    :param stop: Greatest int of the domain, None for float16
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods
+    :param cache_dir: Optional, directory where the tables are kept
+    :return: LookupTable
+    """
+    if cache_dir is None:
+        return LookupTable(
+            source, target, start, stop, float_ret=float_ret, exact=exact
+        )
+    source, target = resolve_scale(source), resolve_scale(target)
+    domain = FLOAT16 if start == FLOAT16 else f'{start}_{stop}'
+    path = Path(cache_dir).expanduser() / (
+        f'{source}-{target}-{domain}'
+        f'-{"float" if float_ret else "trunc"}'
+        f'-{"exact" if exact else "fast"}.lut'
+    )
+    if path.exists():
+        return LookupTable.load(path)
+    table = LookupTable(
+        source, target, start, stop, float_ret=float_ret, exact=exact
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Written aside first, so other processes never read half a table
+    partial = path.with_name(f'{path.name}.{os.getpid()}.partial')
+    table.save(partial)
+    os.replace(partial, path)
+    return table
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+
+from .conversion import converter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, arrays are then deduped as lists
+    np = None  # type: ignore[assignment]
+
+MAX_SIZE = 4096
+
+
+class MemoizedConverter:
+    """
+    Converter of one source/target pair and return type that remembers its
+    last max_size results, for readings taking only a few distinct values,
+    e.g. the ones of sensors with a resolution of 0.1 °C.
+
+    Values are keyed with their type, so 1 and 1.0 are converted apart, and
+    zeros (keeping the sign of -0.0) and NaNs are always converted, so the
+    results are the same as the ones of converter(source, target, ...).
+
+    A lookup costs about as much as the few float operations of a
+    conversion, so the cache mostly saves allocating new floats: repeated
+    values share one result object instead of a copy each.
+    """
+
+    __slots__ = (
+        'function',
+        'max_size',
+        'hits',
+        'misses',
+        'evictions',
+        '_cache',
+        '_lock',
+    )
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        /,
+        *,
+        float_ret=True,
+        exact=True,
+        max_size=MAX_SIZE,
+        thread_safe=False,
+    ) -> None:
+        """
+        :param source: Name or abbreviation of the scale of the values
+        :param target: Name or abbreviation of the scale to convert to
+        :param float_ret: Optional, True by default to return floats
+        :param exact: Optional, True by default to match the methods
+        :param max_size: Optional, most results kept, the least recently
+            used ones being evicted first
+        :param thread_safe: Optional, False by default, True to lock the
+            cache so that threads can share the converter
+        """
+        if max_size < 1:
+            raise ValueError(f'max_size must be at least 1, not {max_size}')
+        self.function = converter(
+            source, target, float_ret=float_ret, exact=exact
+        )
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: OrderedDict[tuple[Any, type], float | int]
+        self._cache = OrderedDict()
+        self._lock = Lock() if thread_safe else None
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}({self.function.source!r}, '
+            f'{self.function.target!r}, float_ret={self.function.float_ret}, '
+            f'exact={self.function.exact}, max_size={self.max_size})'
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __call__(self, value: float | int, /) -> float | int:
+        """
+        Converts one value, or gets its result if it was converted lately.
+
+        :param value: Value to be converted
+        :return: float or int, as the converter of the pair returns
+        """
+        if not value or value != value:  # Zeros and NaNs
+            return self.function(value)
+        if self._lock is not None:
+            with self._lock:
+                return self._lookup(value)
+        return self._lookup(value)
+
+    def _lookup(self, value: float | int) -> float | int:
+        """Gets the result of a value from the cache, or converts it"""
+        key = value, type(value)
+        cache = self._cache
+        try:
+            result = cache[key]
+        except KeyError:
+            self.misses += 1
+            cache[key] = result = self.function(value)
+            if len(cache) > self.max_size:
+                cache.popitem(last=False)
+                self.evictions += 1
+            return result
+        cache.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def batch(self, values: Any, /) -> Any:
+        """
+        Converts many values, each distinct one only once: the values are
+        deduped first, the unique ones converted and the results spread back
+        by an inverse index.
+
+        NumPy arrays are deduped by the bits of their values, so -0.0 and
+        0.0 stay apart, and their unique values converted at once without
+        the cache, returning an array. Anything else goes through the cache,
+        returning a list.
+
+        :param values: Iterable or NumPy array of values to be converted
+        :return: numpy.ndarray or list
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            keys = values
+            if values.dtype.kind == 'f':
+                keys = values.view(f'i{values.dtype.itemsize}')
+            unique, inverse = np.unique(keys, return_inverse=True)
+            results = self.function.batch(unique.view(values.dtype))
+            return results[inverse.reshape(values.shape)]
+        seen: dict[tuple[Any, type], float | int] = {}
+        results = []
+        for value in values:
+            if not value:  # -0.0 would be the same key as 0.0
+                results.append(self.function(value))
+                continue
+            key = value, type(value)
+            try:
+                results.append(seen[key])
+            except KeyError:
+                seen[key] = result = self(value)
+                results.append(result)
+        return results
+
+    def stats(self) -> dict[str, int]:
+        """
+        Gets the hits, misses and evictions counted since the converter was
+        built or cleared, with the current and greatest number of results.
+
+        :return: dict
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._cache),
+            'max_size': self.max_size,
+        }
+
+    def clear(self) -> None:
+        """
+        Forgets every result and resets the stats.
+
+        :return: None
+        """
+        if self._lock is not None:
+            with self._lock:
+                self._cache.clear()
+        else:
+            self._cache.clear()
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from contextlib import contextmanager
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator
+
+from .buffers import _flat_view, convert_buffer
+from .scales import check_validation, resolve_scale
+
+try:
+    import numpy as np
+
+    from .arrays import _check_valid, convert_array
+except ImportError:  # NumPy is optional, only convert_threaded needs it
+    np = None  # type: ignore[assignment]
+
+CHUNK_SIZE = 1 << 20
+
+THRESHOLD = 1 << 22
+
+# 512 KiB of float64 per chunk, so that every pass of a formula over a
+# chunk reads it from the cache of the core converting it
+THREAD_CHUNK_SIZE = 1 << 16
+
+THREAD_THRESHOLD = 1 << 20
+
+
+@contextmanager
+def _items(
+    shared: SharedMemory, typecode: str, start: int, stop: int
+) -> Iterator[memoryview]:
+    """Views the items start:stop of a shared memory block, then releases"""
+    with shared.buf.cast(typecode) as items, items[start:stop] as view:
+        yield view
+
+
+def _convert_slice(
+    name: str,
+    out_name: str,
+    typecode: str,
+    out_typecode: str,
+    start: int,
+    stop: int,
+    pair: tuple[str, str],
+    float_ret: bool,
+    exact: bool,
+) -> None:
+    """Converts the items start:stop of a shared memory block, in a worker"""
+    shared = SharedMemory(name)
+    out_shared = shared if out_name == name else SharedMemory(out_name)
+    try:
+        with _items(shared, typecode, start, stop) as values, _items(
+            out_shared, out_typecode, start, stop
+        ) as results:
+            convert_buffer(
+                values, *pair, out=results, float_ret=float_ret, exact=exact
+            )
+    finally:
+        shared.close()
+        if out_shared is not shared:
+            out_shared.close()
+
+
+def _create(nbytes: int) -> SharedMemory:
+    """Creates a shared memory block, which can't be empty"""
+    return SharedMemory(create=True, size=max(nbytes, 1))
+
+
+def convert_parallel(
+    buffer: Any,
+    source: str,
+    target: str,
+    /,
+    *,
+    out: Any = None,
+    typecode: str | None = None,
+    out_typecode: str | None = None,
+    float_ret=True,
+    exact=True,
+    workers: int | None = None,
+    chunk_size=CHUNK_SIZE,
+    threshold=THRESHOLD,
+    executor: Executor | None = None,
+) -> memoryview:
+    """
+    Converts the items of a buffer (a NumPy array, array.array...) using a
+    pool of processes, in place by default, as convert_buffer does.
+
+    The values are put in a multiprocessing.shared_memory block (or used
+    where they are, if buffer is a SharedMemory itself), every worker
+    converts chunks of chunk_size items of it in place, and only the names
+    of the blocks and the bounds of the chunks are sent to the workers, so
+    the data is never pickled.
+
+    Buffers with fewer than threshold items are converted in this process,
+    as starting the workers would take longer than the conversion.
+
+    :param buffer: Object supporting the buffer protocol, or a SharedMemory
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param out: Optional, writable buffer (or SharedMemory) for the results
+    :param typecode: Optional, struct format of the items of buffer
+    :param out_typecode: Optional, struct format of the items of out
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param workers: Optional, number of processes, os.cpu_count() if None
+    :param chunk_size: Optional, how many items a worker converts at once
+    :param threshold: Optional, fewest items to use the processes for
+    :param executor: Optional, pool of processes to use instead of a new one
+    :return: memoryview of the results
+    """
+    pair = resolve_scale(source), resolve_scale(target)
+    shared = buffer if isinstance(buffer, SharedMemory) else None
+    out_shared = out if isinstance(out, SharedMemory) else None
+    if shared is not None:
+        values = _flat_view(shared.buf, typecode or 'd')
+    else:
+        values = _flat_view(buffer, typecode)
+    if out is None:
+        results = values
+    elif out_shared is not None:
+        results = _flat_view(out_shared.buf, out_typecode or values.format)
+    else:
+        results = _flat_view(out, out_typecode)
+    workers = workers or os.cpu_count() or 1
+
+    if len(values) < threshold or workers == 1:
+        return convert_buffer(
+            values, *pair, out=results, float_ret=float_ret, exact=exact
+        )
+    if len(results) != len(values):
+        raise ValueError(
+            f'out has {len(results)} items, but buffer has {len(values)}'
+        )
+    if results.readonly:
+        raise ValueError('The buffer for the results is read-only')
+
+    created = []
+    if shared is None:
+        shared = _create(values.nbytes)
+        created.append(shared)
+        shared.buf[: values.nbytes] = values.cast('B')
+    if out is None:
+        out_shared = shared
+    elif out_shared is None:
+        out_shared = _create(results.nbytes)
+        created.append(out_shared)
+
+    try:
+        pool = executor or ProcessPoolExecutor(workers)
+        try:
+            futures = [
+                pool.submit(
+                    _convert_slice,
+                    shared.name,
+                    out_shared.name,
+                    values.format,
+                    results.format,
+                    start,
+                    min(start + chunk_size, len(values)),
+                    pair,
+                    float_ret,
+                    exact,
+                )
+                for start in range(0, len(values), chunk_size)
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+        if out_shared in created:
+            results.cast('B')[:] = out_shared.buf[: results.nbytes]
+    finally:
+        for block in created:
+            block.close()
+            block.unlink()
+    return results
+
+
+def _check_span(
+    values: Any, start: int, stop: int, shape: tuple[int, ...], scale: str
+) -> None:
+    """Checks the values start:stop of a flat array, in a thread"""
+    _check_valid(values[start:stop], scale, start, shape)
+
+
+def _convert_span(
+    values: Any,
+    results: Any,
+    start: int,
+    stop: int,
+    pair: tuple[str, str],
+    float_ret: bool,
+    exact: bool,
+    chunk_size: int,
+    validate: str | None,
+) -> None:
+    """Converts the values start:stop of flat arrays, in a thread"""
+    for begin in range(start, stop, chunk_size):
+        chunk = values[begin : min(begin + chunk_size, stop)]
+        convert_array(
+            chunk,
+            *pair,
+            float_ret=float_ret,
+            exact=exact,
+            out=results[begin : begin + len(chunk)],
+            validate=validate,
+        )
+
+
+def _run_spans(
+    pool: Executor, function: Any, size: int, span: int, *args: Any
+) -> None:
+    """
+    Runs a function over every span of size values in the pool, raising
+    the error of the first span failing, if any.
+    """
+    futures = [
+        pool.submit(function, start, min(start + span, size), *args)
+        for start in range(0, size, span)
+    ]
+    try:
+        for future in futures:
+            future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def convert_threaded(
+    values: Any,
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    out: Any = None,
+    validate: str | None = None,
+    threads: int | None = None,
+    chunk_size=THREAD_CHUNK_SIZE,
+    threshold=THREAD_THRESHOLD,
+    executor: Executor | None = None,
+) -> Any:
+    """
+    Converts a NumPy array with a pool of threads, returning the same
+    results as convert_array does.
+
+    NumPy releases the GIL while running its ufuncs, so the threads convert
+    at once, each one a contiguous span of the array, chunk_size values at a
+    time, writing into slices of the results. Nothing is copied nor pickled,
+    unlike with convert_parallel, which suits threaded servers and arrays of
+    a few millions of values. With validate='raise', the threads check all
+    the values before converting any, as convert_array does.
+
+    Arrays with fewer than threshold values are converted in this thread, as
+    handing them to the pool would take longer than the conversion.
+
+    :param values: Array (or array-like) of values to be converted
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param out: Optional, preallocated array to write the results into
+    :param validate: Optional, None (the default), 'raise', 'clip' or 'nan'
+    :param threads: Optional, number of threads, os.cpu_count() if None
+    :param chunk_size: Optional, how many values are converted at once
+    :param threshold: Optional, fewest values to use the threads for
+    :param executor: Optional, pool of threads to use instead of a new one
+    :return: numpy.ndarray (out itself if it was given)
+    """
+    if np is None:
+        raise ImportError('convert_threaded needs NumPy')
+    pair = resolve_scale(source), resolve_scale(target)
+    check_validation(validate, float_ret)
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be at least 1, not {chunk_size}')
+    values = np.asarray(values)
+    threads = threads or os.cpu_count() or 1
+    if values.size < max(threshold, 1) or threads == 1:
+        return convert_array(
+            values,
+            *pair,
+            float_ret=float_ret,
+            exact=exact,
+            out=out,
+            validate=validate,
+        )
+    if out is not None and out.shape != values.shape:
+        raise ValueError(
+            f'out has shape {out.shape}, but values have shape {values.shape}'
+        )
+
+    dtype = np.float64 if float_ret else np.int64
+    if out is None:
+        results = np.empty(values.shape, dtype=dtype)
+    elif out.flags.c_contiguous:
+        results = out
+    else:  # Written into slices of a flat view, so it must be contiguous
+        results = np.empty(values.shape, dtype=out.dtype)
+    flat_values = np.ascontiguousarray(values).reshape(-1)
+    flat_results = results.reshape(-1)
+
+    # Spans of whole chunks, one per thread
+    chunks = -(-flat_values.size // chunk_size)
+    span = -(-chunks // threads) * chunk_size
+    pool = executor or ThreadPoolExecutor(threads)
+    try:
+        if validate == 'raise':
+            # Every value is checked first, so nothing is written if one is
+            # invalid, and the error has its index in the whole array
+            _run_spans(
+                pool,
+                partial(_check_span, flat_values),
+                flat_values.size,
+                span,
+                values.shape,
+                pair[0],
+            )
+            validate = None
+        _run_spans(
+            pool,
+            partial(_convert_span, flat_values, flat_results),
+            flat_values.size,
+            span,
+            pair,
+            float_ret,
+            exact,
+            chunk_size,
+            validate,
+        )
+    finally:
+        if executor is None:
+            pool.shutdown()
+    if out is None:
+        return results
+    if results is not out:
+        np.copyto(out, results)
+    return out
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Differential harness between the exact and the fast conversions.
+
+Run it with ``python -m totemp.precision`` to print, for every pair of
+scales, the maximum difference in ULPs (units in the last place) between
+convert(..., exact=True) and convert(..., exact=False).
+"""
+
+import random
+import struct
+from typing import Iterable, NamedTuple
+
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .scales import SCALES
+
+
+class UlpReport(NamedTuple):
+    """Largest difference found for one pair of scales"""
+
+    source: str
+    target: str
+    max_ulps: int
+    value: float
+    exact: float
+    fast: float
+
+
+def _ordered_bits(number: float) -> int:
+    """Maps a float to an int that keeps the order of the floats"""
+    (bits,) = struct.unpack('<Q', struct.pack('<d', number))
+    if bits >> 63:
+        return -(bits & 0x7FFFFFFFFFFFFFFF)
+    return bits
+
+
+def ulp_distance(first: float, second: float) -> int:
+    """
+    Counts how many representable floats there are between two floats.
+
+    :param first: A finite float
+    :param second: Another finite float
+    :return: int, 0 if they are equal
+    """
+    return abs(_ordered_bits(first) - _ordered_bits(second))
+
+
+def default_samples(count=10_000, seed=0) -> list[float]:
+    """
+    Returns reproducible sample values: every whole and tenth degree in
+    -500..500 plus random values spread over many magnitudes.
+
+    :param count: Optional, how many random values to add
+    :param seed: Optional, seed of the random values
+    :return: list of floats
+    """
+    generator = random.Random(seed)
+    samples = [tenth / 10 for tenth in range(-5000, 5001)]
+    samples += [
+        generator.uniform(-1, 1) * 10 ** generator.uniform(-3, 6)
+        for _ in range(count)
+    ]
+    return samples
+
+
+def ulp_report(samples: Iterable[float] | None = None) -> list[UlpReport]:
+    """
+    Compares the exact and the fast conversions of every pair of scales over
+    the samples, keeping the value with the largest difference per pair.
+
+    :param samples: Optional, values to convert, default_samples() if None
+    :return: list of UlpReport, one per pair of scales
+    """
+    values = default_samples() if samples is None else list(samples)
+    reports = []
+    for source in SCALES:
+        for target in SCALES:
+            exact_method = CONVERTERS[source, target]
+            fast_method = FAST_CONVERTERS[source, target]
+            worst = UlpReport(source, target, 0, 0.0, 0.0, 0.0)
+            for value in values:
+                exact = exact_method(value)
+                fast = fast_method(value)
+                distance = ulp_distance(exact, fast)
+                if distance > worst.max_ulps:
+                    worst = UlpReport(
+                        source, target, distance, value, exact, fast
+                    )
+            reports.append(worst)
+    return reports
+
+
+def main() -> None:
+    """Prints the ulp_report of the default samples as a table"""
+    print(
+        f'{"source":<12}{"target":<12}{"max ULPs":>14}  '
+        f'{"at value":>24}  {"exact":>24}  {"fast":>24}'
+    )
+    for report in ulp_report():
+        print(
+            f'{report.source:<12}{report.target:<12}{report.max_ulps:>14}  '
+            f'{report.value!r:>24}  {report.exact!r:>24}  {report.fast!r:>24}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import dataclasses
+from collections.abc import (
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+)
+from operator import attrgetter, itemgetter
+from typing import Any, Callable
+
+from .conversion import converter
+
+Spec = Mapping[Any, tuple[str, str] | tuple[str, str, bool]]
+
+Fields = list[tuple[Any, Callable[[Any], Any]]]
+
+Setter = Callable[[Any, Any], None]
+
+Accessors = list[tuple[Callable[[Any], Any], Setter, Callable[[Any], Any]]]
+
+
+def _fields(spec: Spec, float_ret: bool, exact: bool) -> Fields:
+    """
+    Resolves the converter of every column once, for all the records.
+
+    :param spec: (source, target) or (source, target, float_ret) by column
+    :param float_ret: Return type of the columns not giving their own
+    :param exact: Whether to match the methods bit-for-bit
+    :return: list of (column, converter)
+    """
+    fields: Fields = []
+    for column, conversion in spec.items():
+        if len(conversion) == 2:
+            source, target = conversion  # type: ignore
+            column_float_ret = float_ret
+        elif len(conversion) == 3:
+            source, target, column_float_ret = conversion  # type: ignore
+        else:
+            raise ValueError(
+                f'The conversion of {column!r} must be (source, target) or '
+                f'(source, target, float_ret), not {conversion!r}'
+            )
+        fields.append(
+            (
+                column,
+                converter(
+                    source, target, float_ret=column_float_ret, exact=exact
+                ),
+            )
+        )
+    return fields
+
+
+def _item(column: Any) -> Setter:
+    """Builds the setter of an item of a record, by key or index"""
+
+    def set_item(target: Any, value: Any) -> None:
+        target[column] = value
+
+    return set_item
+
+
+def _attribute(column: str) -> Setter:
+    """Builds the setter of an attribute of a record"""
+
+    def set_attribute(target: Any, value: Any) -> None:
+        setattr(target, column, value)
+
+    return set_attribute
+
+
+def _accessors(kind: type, fields: Fields, inplace: bool) -> Accessors:
+    """
+    Builds the (getter, setter, convert) of every column of a record type:
+    the getter reads the record, and the setter writes the converted value
+    into the target of the record, which is the record itself, its copy,
+    the items of a tuple or the changes of a dataclass.
+    """
+    by_item = issubclass(kind, (tuple, MutableMapping, MutableSequence))
+    names = getattr(kind, '_fields', ())  # Of named tuples
+    changes = not inplace and dataclasses.is_dataclass(kind)
+    accessors: Accessors = []
+    for column, convert in fields:
+        if by_item:
+            if isinstance(column, str) and names:
+                column = names.index(column)
+            getter: Callable[[Any], Any] = itemgetter(column)
+            setter = _item(column)
+        else:
+            getter = attrgetter(column)
+            setter = _item(column) if changes else _attribute(column)
+        accessors.append((getter, setter, convert))
+    return accessors
+
+
+def _convert_columns(record: Any, target: Any, accessors: Accessors) -> None:
+    """Converts every column of a record into its target, but None values"""
+    for getter, setter, convert in accessors:
+        value = getter(record)
+        if value is not None:
+            setter(target, convert(value))
+
+
+def _identity(record: Any) -> Any:
+    """Leaves a record converted in place as it is"""
+    return record
+
+
+def _converter(
+    kind: type, fields: Fields, inplace: bool
+) -> Callable[[Any], Any]:
+    """
+    Builds the function converting one record of a type, into a new record
+    or in place, with the accessors of its columns built once.
+    """
+    if issubclass(kind, Mapping) and not issubclass(kind, MutableMapping):
+        raise TypeError(f'{kind.__name__} records are read-only')
+    if issubclass(kind, tuple) and inplace:
+        raise TypeError('Tuples cannot be converted in place')
+    accessors = _accessors(kind, fields, inplace)
+
+    if issubclass(kind, tuple):
+        make = getattr(kind, '_make', kind)
+
+        def convert_tuple(record: Any) -> Any:
+            items = list(record)
+            _convert_columns(record, items, accessors)
+            return make(items)
+
+        return convert_tuple
+
+    if not inplace and dataclasses.is_dataclass(kind):
+
+        def convert_dataclass(record: Any) -> Any:
+            changes: dict[str, Any] = {}
+            _convert_columns(record, changes, accessors)
+            return dataclasses.replace(record, **changes)
+
+        return convert_dataclass
+
+    if inplace:
+        prepare: Callable[[Any], Any] = _identity
+    elif issubclass(kind, (MutableMapping, MutableSequence)) and hasattr(
+        kind, 'copy'
+    ):
+        prepare = kind.copy  # type: ignore[attr-defined]
+    else:
+        prepare = copy.copy
+
+    def convert_record(record: Any) -> Any:
+        target = prepare(record)
+        _convert_columns(record, target, accessors)
+        return target
+
+    return convert_record
+
+
+def convert_records(
+    records: Iterable[Any],
+    spec: Spec,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    inplace=False,
+) -> list[Any]:
+    """
+    Converts columns of many records at once, e.g. the dicts decoded from
+    JSON, each column from its own source scale to its own target scale:
+
+    convert_records(rows, {'inlet_f': ('F', 'C'), 'outlet_k': ('K', 'C')})
+
+    The records may be dicts (by key), lists and tuples (by index), named
+    tuples (by name or index), and dataclasses or other objects (by
+    attribute name). Missing values (None) are left as they are.
+
+    The converter of every column is looked up once, before going through
+    the records, and so are the getter and setter of every column for each
+    type of records, so converting a record is only a loop over its columns.
+
+    :param records: Iterable of records
+    :param spec: (source, target), or (source, target, float_ret) to return
+        ints (False) or floats (True) for that column only, by column
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param inplace: Optional, False by default to return new records, True
+        to change the records themselves (not possible for tuples)
+    :return: list of the converted records
+    """
+    fields = _fields(spec, float_ret, exact)
+    converters: dict[type, Callable[[Any], Any]] = {}
+    results = []
+    for record in records:
+        kind = type(record)
+        try:
+            function = converters[kind]
+        except KeyError:
+            function = converters[kind] = _converter(kind, fields, inplace)
+        results.append(function(record))
+    return results
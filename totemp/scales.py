@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+SCALES = (
+    'celsius',
+    'delisle',
+    'fahrenheit',
+    'kelvin',
+    'newton',
+    'rankine',
+    'reaumur',
+    'romer',
+)
+
+# Every formula is the sequence of operations done by the matching method
+# in temperature_types.py, in the very same order, so batch implementations
+# can reproduce the scalar results bit-for-bit. The operations are:
+# 'add' (x + c), 'sub' (x - c), 'rsub' (c - x), 'mul' (x * c), 'div' (x / c)
+FORMULAS: dict[tuple[str, str], tuple[tuple[str, float | int], ...]] = {
+    # Celsius
+    ('celsius', 'delisle'): (('rsub', 100), ('mul', 3), ('div', 2)),
+    ('celsius', 'fahrenheit'): (('mul', 9), ('div', 5), ('add', 32)),
+    ('celsius', 'kelvin'): (('add', 273.15),),
+    ('celsius', 'newton'): (('mul', 33), ('div', 100)),
+    ('celsius', 'rankine'): (('mul', 9), ('div', 5), ('add', 491.67)),
+    ('celsius', 'reaumur'): (('mul', 4), ('div', 5)),
+    ('celsius', 'romer'): (('mul', 21), ('div', 40), ('add', 7.5)),
+    # Fahrenheit
+    ('fahrenheit', 'celsius'): (('sub', 32), ('mul', 5), ('div', 9)),
+    ('fahrenheit', 'delisle'): (('rsub', 212), ('mul', 5), ('div', 6)),
+    ('fahrenheit', 'kelvin'): (('add', 459.67), ('mul', 5), ('div', 9)),
+    ('fahrenheit', 'newton'): (('sub', 32), ('mul', 11), ('div', 60)),
+    ('fahrenheit', 'rankine'): (('add', 459.67),),
+    ('fahrenheit', 'reaumur'): (('sub', 32), ('mul', 4), ('div', 9)),
+    ('fahrenheit', 'romer'): (('sub', 32), ('mul', 7 / 24), ('add', 7.5)),
+    # Delisle
+    ('delisle', 'celsius'): (('mul', 2), ('div', 3), ('rsub', 100)),
+    ('delisle', 'fahrenheit'): (('mul', 6), ('div', 5), ('rsub', 212)),
+    ('delisle', 'kelvin'): (('mul', 2), ('div', 3), ('rsub', 373.15)),
+    ('delisle', 'newton'): (('mul', 11), ('div', 50), ('rsub', 33)),
+    ('delisle', 'rankine'): (('mul', 6), ('div', 5), ('rsub', 671.67)),
+    ('delisle', 'reaumur'): (('mul', 8), ('div', 15), ('rsub', 80)),
+    ('delisle', 'romer'): (('mul', 7), ('div', 20), ('rsub', 60)),
+    # Kelvin
+    ('kelvin', 'celsius'): (('sub', 273.15),),
+    ('kelvin', 'delisle'): (('rsub', 373.15), ('mul', 3), ('div', 2)),
+    ('kelvin', 'fahrenheit'): (('mul', 9), ('div', 5), ('sub', 459.67)),
+    ('kelvin', 'newton'): (('sub', 273.15), ('mul', 33), ('div', 100)),
+    ('kelvin', 'rankine'): (('mul', 1.8),),
+    ('kelvin', 'reaumur'): (('sub', 273.15), ('mul', 4), ('div', 5)),
+    ('kelvin', 'romer'): (('sub', 273.15), ('mul', 21 / 40), ('add', 7.5)),
+    # Newton
+    ('newton', 'celsius'): (('mul', 100), ('div', 33)),
+    ('newton', 'delisle'): (('rsub', 33), ('mul', 50), ('div', 11)),
+    ('newton', 'fahrenheit'): (('mul', 60), ('div', 11), ('add', 32)),
+    ('newton', 'kelvin'): (('mul', 100), ('div', 33), ('add', 273.15)),
+    ('newton', 'rankine'): (('mul', 60), ('div', 11), ('add', 491.67)),
+    ('newton', 'reaumur'): (('mul', 80), ('div', 33)),
+    ('newton', 'romer'): (('mul', 35), ('div', 22), ('add', 7.5)),
+    # Rankine
+    ('rankine', 'celsius'): (('sub', 491.67), ('mul', 5), ('div', 9)),
+    ('rankine', 'delisle'): (('rsub', 671.67), ('mul', 5), ('div', 6)),
+    ('rankine', 'fahrenheit'): (('sub', 459.67),),
+    ('rankine', 'kelvin'): (('mul', 5), ('div', 9)),
+    ('rankine', 'newton'): (('sub', 491.67), ('mul', 11), ('div', 60)),
+    ('rankine', 'reaumur'): (('sub', 491.67), ('mul', 4), ('div', 9)),
+    ('rankine', 'romer'): (
+        ('sub', 491.67),
+        ('mul', 7),
+        ('div', 24),
+        ('add', 7.5),
+    ),
+    # Réaumur
+    ('reaumur', 'celsius'): (('mul', 5), ('div', 4)),
+    ('reaumur', 'delisle'): (('rsub', 80), ('mul', 15), ('div', 8)),
+    ('reaumur', 'fahrenheit'): (('mul', 9), ('div', 4), ('add', 32)),
+    ('reaumur', 'kelvin'): (('mul', 5), ('div', 4), ('add', 273.15)),
+    ('reaumur', 'newton'): (('mul', 33), ('div', 80)),
+    ('reaumur', 'rankine'): (('mul', 9), ('div', 4), ('add', 491.67)),
+    ('reaumur', 'romer'): (('mul', 21), ('div', 32), ('add', 7.5)),
+    # Rømer
+    ('romer', 'celsius'): (('sub', 7.5), ('mul', 40), ('div', 21)),
+    ('romer', 'delisle'): (('rsub', 60), ('mul', 20), ('div', 7)),
+    ('romer', 'fahrenheit'): (
+        ('sub', 7.5),
+        ('mul', 24),
+        ('div', 7),
+        ('add', 32),
+    ),
+    ('romer', 'kelvin'): (
+        ('sub', 7.5),
+        ('mul', 40),
+        ('div', 21),
+        ('add', 273.15),
+    ),
+    ('romer', 'newton'): (('sub', 7.5), ('mul', 22), ('div', 35)),
+    ('romer', 'rankine'): (
+        ('sub', 7.5),
+        ('mul', 24),
+        ('div', 7),
+        ('add', 491.67),
+    ),
+    ('romer', 'reaumur'): (('sub', 7.5), ('mul', 32), ('div', 21)),
+}
+
+# Every scale is an affine map of Kelvin: kelvin = value * scale + offset.
+# The pairs are kept as exact (numerator, denominator) ratios of ints so they
+# can be composed without accumulating rounding errors.
+KELVIN_AFFINE: dict[str, tuple[tuple[int, int], tuple[int, int]]] = {
+    'celsius': ((1, 1), (5463, 20)),
+    'delisle': ((-2, 3), (7463, 20)),
+    'fahrenheit': ((5, 9), (45967, 180)),
+    'kelvin': ((1, 1), (0, 1)),
+    'newton': ((100, 33), (5463, 20)),
+    'rankine': ((5, 9), (0, 1)),
+    'reaumur': ((5, 4), (5463, 20)),
+    'romer': ((40, 21), (36241, 140)),
+}
+
+# Absolute zero in every scale, the lowest valid value (or, in Delisle, whose
+# values rise as temperatures fall, the highest one), i.e. -offset / scale
+ABSOLUTE_ZERO: dict[str, float] = {
+    'celsius': -273.15,
+    'delisle': 559.725,
+    'fahrenheit': -459.67,
+    'kelvin': 0.0,
+    'newton': -90.1395,
+    'rankine': 0.0,
+    'reaumur': -218.52,
+    'romer': -135.90375,
+}
+
+# How the batch conversions handle values below absolute zero, NaN and
+# infinities when asked to validate them
+VALIDATION_MODES = ('raise', 'clip', 'nan')
+
+ABBREVIATIONS = {
+    'celsius': ('C',),
+    'delisle': ('De', 'D'),
+    'fahrenheit': ('F',),
+    'kelvin': ('K',),
+    'newton': ('N',),
+    'rankine': ('Ra', 'R'),
+    'reaumur': ('Re', 'Ré', 'Réaumur'),
+    'romer': ('Ro', 'Rø', 'Rømer'),
+}
+
+# Every accepted spelling of a scale name, mapped to its canonical name
+ALIASES: dict[str, str] = {
+    spelling: scale
+    for scale, abbreviations in ABBREVIATIONS.items()
+    for alias in (scale, *abbreviations)
+    for spelling in (alias, alias.lower(), alias.capitalize(), alias.upper())
+}
+
+
+def resolve_scale(name: str) -> str:
+    """
+    Returns the canonical name of a scale, e.g. 'fahrenheit' for 'F'.
+
+    :param name: Name or abbreviation of the scale
+    :return: str
+    """
+    try:
+        return ALIASES[name]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f'Unknown temperature scale {name!r}, '
+            f'expected one of {", ".join(SCALES)}'
+        ) from None
+
+
+def affine(source: str, target: str) -> tuple[Fraction, Fraction]:
+    """
+    Composes the Kelvin maps of two scales into the exact coefficients of
+    target = source * scale + offset.
+
+    :param source: Canonical name of the scale to convert from
+    :param target: Canonical name of the scale to convert to
+    :return: tuple of (scale, offset) fractions
+    """
+    from fractions import Fraction
+
+    source_scale, source_offset = (
+        Fraction(*ratio) for ratio in KELVIN_AFFINE[source]
+    )
+    target_scale, target_offset = (
+        Fraction(*ratio) for ratio in KELVIN_AFFINE[target]
+    )
+    return (
+        source_scale / target_scale,
+        (source_offset - target_offset) / target_scale,
+    )
+
+
+# (scale, offset) floats of all 64 source/target pairs, the ones of affine
+# rounded only once, written out so importing totemp computes nothing
+COEFFICIENTS: dict[tuple[str, str], tuple[float, float]] = {
+    ('celsius', 'celsius'): (1.0, 0.0),
+    ('celsius', 'delisle'): (-1.5, 150.0),
+    ('celsius', 'fahrenheit'): (1.8, 32.0),
+    ('celsius', 'kelvin'): (1.0, 273.15),
+    ('celsius', 'newton'): (0.33, 0.0),
+    ('celsius', 'rankine'): (1.8, 491.67),
+    ('celsius', 'reaumur'): (0.8, 0.0),
+    ('celsius', 'romer'): (0.525, 7.5),
+    ('delisle', 'celsius'): (-0.6666666666666666, 100.0),
+    ('delisle', 'delisle'): (1.0, 0.0),
+    ('delisle', 'fahrenheit'): (-1.2, 212.0),
+    ('delisle', 'kelvin'): (-0.6666666666666666, 373.15),
+    ('delisle', 'newton'): (-0.22, 33.0),
+    ('delisle', 'rankine'): (-1.2, 671.67),
+    ('delisle', 'reaumur'): (-0.5333333333333333, 80.0),
+    ('delisle', 'romer'): (-0.35, 60.0),
+    ('fahrenheit', 'celsius'): (0.5555555555555556, -17.77777777777778),
+    ('fahrenheit', 'delisle'): (-0.8333333333333334, 176.66666666666666),
+    ('fahrenheit', 'fahrenheit'): (1.0, 0.0),
+    ('fahrenheit', 'kelvin'): (0.5555555555555556, 255.37222222222223),
+    ('fahrenheit', 'newton'): (0.18333333333333332, -5.866666666666666),
+    ('fahrenheit', 'rankine'): (1.0, 459.67),
+    ('fahrenheit', 'reaumur'): (0.4444444444444444, -14.222222222222221),
+    ('fahrenheit', 'romer'): (0.2916666666666667, -1.8333333333333333),
+    ('kelvin', 'celsius'): (1.0, -273.15),
+    ('kelvin', 'delisle'): (-1.5, 559.725),
+    ('kelvin', 'fahrenheit'): (1.8, -459.67),
+    ('kelvin', 'kelvin'): (1.0, 0.0),
+    ('kelvin', 'newton'): (0.33, -90.1395),
+    ('kelvin', 'rankine'): (1.8, 0.0),
+    ('kelvin', 'reaumur'): (0.8, -218.52),
+    ('kelvin', 'romer'): (0.525, -135.90375),
+    ('newton', 'celsius'): (3.0303030303030303, 0.0),
+    ('newton', 'delisle'): (-4.545454545454546, 150.0),
+    ('newton', 'fahrenheit'): (5.454545454545454, 32.0),
+    ('newton', 'kelvin'): (3.0303030303030303, 273.15),
+    ('newton', 'newton'): (1.0, 0.0),
+    ('newton', 'rankine'): (5.454545454545454, 491.67),
+    ('newton', 'reaumur'): (2.4242424242424243, 0.0),
+    ('newton', 'romer'): (1.5909090909090908, 7.5),
+    ('rankine', 'celsius'): (0.5555555555555556, -273.15),
+    ('rankine', 'delisle'): (-0.8333333333333334, 559.725),
+    ('rankine', 'fahrenheit'): (1.0, -459.67),
+    ('rankine', 'kelvin'): (0.5555555555555556, 0.0),
+    ('rankine', 'newton'): (0.18333333333333332, -90.1395),
+    ('rankine', 'rankine'): (1.0, 0.0),
+    ('rankine', 'reaumur'): (0.4444444444444444, -218.52),
+    ('rankine', 'romer'): (0.2916666666666667, -135.90375),
+    ('reaumur', 'celsius'): (1.25, 0.0),
+    ('reaumur', 'delisle'): (-1.875, 150.0),
+    ('reaumur', 'fahrenheit'): (2.25, 32.0),
+    ('reaumur', 'kelvin'): (1.25, 273.15),
+    ('reaumur', 'newton'): (0.4125, 0.0),
+    ('reaumur', 'rankine'): (2.25, 491.67),
+    ('reaumur', 'reaumur'): (1.0, 0.0),
+    ('reaumur', 'romer'): (0.65625, 7.5),
+    ('romer', 'celsius'): (1.9047619047619047, -14.285714285714286),
+    ('romer', 'delisle'): (-2.857142857142857, 171.42857142857142),
+    ('romer', 'fahrenheit'): (3.4285714285714284, 6.285714285714286),
+    ('romer', 'kelvin'): (1.9047619047619047, 258.8642857142857),
+    ('romer', 'newton'): (0.6285714285714286, -4.714285714285714),
+    ('romer', 'rankine'): (3.4285714285714284, 465.9557142857143),
+    ('romer', 'reaumur'): (1.5238095238095237, -11.428571428571429),
+    ('romer', 'romer'): (1.0, 0.0),
+}
+
+# Identities do nothing
+FORMULAS.update({(scale, scale): () for scale in SCALES})
+
+
+def check_validation(validate: str | None, float_ret: bool) -> None:
+    """
+    Checks that a validation mode can be used, raising ValueError if not.
+
+    :param validate: None or one of VALIDATION_MODES
+    :param float_ret: True if the results are floats
+    :return: None
+    """
+    if validate is not None and validate not in VALIDATION_MODES:
+        raise ValueError(
+            f'Unknown validation mode {validate!r}, '
+            f'expected one of {", ".join(VALIDATION_MODES)}'
+        )
+    if validate == 'nan' and not float_ret:
+        raise ValueError("Invalid values can't be NaN with float_ret=False")
+
+
+def invalid_temperature(
+    value: float | int, index: object, scale: str
+) -> ValueError:
+    """
+    Builds the error raised for a value that's NaN, infinite or beyond
+    absolute zero when validating with validate='raise'.
+
+    :param value: The invalid value
+    :param index: Its index among the values converted
+    :param scale: Canonical name of its scale
+    :return: ValueError
+    """
+    return ValueError(
+        f'Invalid temperature {value!r} at index {index}, temperatures must '
+        f'be finite and not beyond absolute zero ({ABSOLUTE_ZERO[scale]} in '
+        f'{scale.capitalize()})'
+    )
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+from .buffers import CHUNK_SIZE, _flat_view, convert_buffer
+from .conversion import CONVERTERS, FAST_CONVERTERS
+from .scales import resolve_scale
+
+
+def _view(target: str) -> property:
+    """Builds the property returning the series in the target scale"""
+    return property(
+        lambda self: self.to(target),
+        doc=f'View of the series in {target.capitalize()}',
+    )
+
+
+class TemperatureSeries:
+    """
+    A column of temperature readings, stored once in the scale they were
+    given in, that can be read in any other scale.
+
+    Converting a series (e.g. with .to('F') or .fahrenheit) returns a view
+    sharing the same readings, and no value is converted until the view is
+    iterated, indexed or exported (with to_array, tolist or numpy.asarray).
+    Views of views convert straight from the stored scale, so a chain such as
+    Delisle -> Celsius -> Rankine is one pass over the readings, with the
+    same results as Delisle.to_rankine.
+    """
+
+    __slots__ = ('_values', '_source', '_scale', '_exact')
+
+    def __init__(
+        self,
+        values: Any,
+        scale: str = 'celsius',
+        /,
+        *,
+        exact=True,
+    ) -> None:
+        """
+        :param values: Readings, as a buffer (e.g. array('d') or a NumPy
+            array, which are shared, not copied, unless they aren't
+            contiguous like a[::2]) or any iterable of numbers
+        :param scale: Optional, name or abbreviation of the scale of the
+            readings, Celsius by default
+        :param exact: Optional, True by default to match the methods
+            bit-for-bit, False for a single multiply-add per value
+        """
+        try:
+            view = memoryview(values)
+        except TypeError:  # Not a buffer
+            view = memoryview(array('d', values))
+        if not view.c_contiguous:  # e.g. a[::2] or a.T, copied in order
+            view = memoryview(view.tobytes()).cast(view.format)
+        self._values = _flat_view(view, None)
+        self._source = self._scale = resolve_scale(scale)
+        self._exact = exact
+
+    @classmethod
+    def _of(
+        cls, values: memoryview, source: str, scale: str, exact: bool
+    ) -> 'TemperatureSeries':
+        series = cls.__new__(cls)
+        series._values = values
+        series._source = source
+        series._scale = scale
+        series._exact = exact
+        return series
+
+    @property
+    def scale(self) -> str:
+        """The name of the scale the series is read in, e.g. 'celsius'"""
+        return self._scale
+
+    @property
+    def source(self) -> str:
+        """The name of the scale the readings are stored in"""
+        return self._source
+
+    def to(self, scale: str) -> 'TemperatureSeries':
+        """
+        Gets a view of the series in another scale, without converting or
+        copying the readings.
+
+        :param scale: Name or abbreviation of the scale to read the series in
+        :return: TemperatureSeries
+        """
+        return self._of(
+            self._values, self._source, resolve_scale(scale), self._exact
+        )
+
+    celsius = _view('celsius')
+    delisle = _view('delisle')
+    fahrenheit = _view('fahrenheit')
+    kelvin = _view('kelvin')
+    newton = _view('newton')
+    rankine = _view('rankine')
+    reaumur = _view('reaumur')
+    romer = _view('romer')
+
+    def _convert_into(self, values: memoryview, out: Any) -> None:
+        convert_buffer(
+            values,
+            self._source,
+            self._scale,
+            out=out,
+            out_typecode='d',
+            exact=self._exact,
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        values = self._values
+        chunk = array('d', [0.0]) * min(CHUNK_SIZE, len(values))
+        for start in range(0, len(values), CHUNK_SIZE):
+            part = values[start : start + CHUNK_SIZE]
+            if len(part) < len(chunk):
+                chunk = chunk[: len(part)]
+            self._convert_into(part, chunk)
+            yield from chunk
+
+    def __getitem__(self, key: int | slice) -> 'float | TemperatureSeries':
+        """
+        Converts a single reading, or gets a view of a slice of the series,
+        which shares the readings unless the slice has a step.
+        """
+        if isinstance(key, slice):
+            values = self._values[key]
+            if not values.c_contiguous:
+                values = memoryview(array('d', values))
+            return self._of(values, self._source, self._scale, self._exact)
+        converters = CONVERTERS if self._exact else FAST_CONVERTERS
+        return converters[self._source, self._scale](self._values[key])
+
+    def to_array(self) -> array:
+        """
+        Converts every reading into a new array.
+
+        :return: array('d')
+        """
+        result = array('d', [0.0]) * len(self._values)
+        self._convert_into(self._values, result)
+        return result
+
+    def tolist(self) -> list[float]:
+        """
+        Converts every reading into a list.
+
+        :return: list of floats
+        """
+        return self.to_array().tolist()
+
+    def materialize(self) -> 'TemperatureSeries':
+        """
+        Converts every reading into a new series stored in its scale, e.g. to
+        stop sharing the readings or to read it many times.
+
+        :return: TemperatureSeries
+        """
+        return type(self)(self.to_array(), self._scale, exact=self._exact)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> Any:
+        import numpy as np
+
+        result = np.empty(len(self._values))
+        self._convert_into(self._values, result)
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        stored = f', stored in {self._source}' * (self._source != self._scale)
+        return (
+            f'<{type(self).__name__} of {len(self)} readings '
+            f'in {self._scale}{stored}>'
+        )
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP server converting temperatures for programs in any language, run with
+``python -m totemp.server``, so they all get the very results of totemp.
+
+- ``GET /convert?value=100&source=C&target=F`` converts one value, answering
+  ``{"result": 212.0}``.
+- ``POST /convert/batch?source=C&target=F`` converts a batch: a JSON array
+  (``Content-Type: application/json``), answering ``{"results": [...]}``, or
+  packed little-endian float64 values (``application/octet-stream``),
+  answering packed float64 values (int64 ones with ``float_ret=false``).
+
+Both take the optional ``float_ret`` and ``exact`` parameters (``true`` or
+``false``). Connections are kept open between requests (HTTP/1.1), and
+batches are converted by convert_batch, so large ones use NumPy if it's
+installed. Errors are answered as ``{"error": "..."}``.
+
+JSON has no NaN nor infinities: the bare ``NaN`` and ``Infinity`` of
+JavaScript are rejected, and so are values whose results overflow, as
+errors. They can be converted as packed float64 values.
+"""
+
+import argparse
+import json
+import sys
+from array import array
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Sequence
+from urllib.parse import parse_qs, urlsplit
+
+from . import __version__
+from .backends import convert_batch
+from .conversion import convert
+
+JSON = 'application/json'
+
+BINARY = 'application/octet-stream'
+
+MAX_BODY_SIZE = 64 << 20
+
+_BOOLEANS = {'true': True, '1': True, 'false': False, '0': False}
+
+
+def _reject_constant(constant: str) -> float:
+    """Rejects the NaN and Infinity that json reads, though not JSON"""
+    raise ValueError(f'{constant} is not valid JSON')
+
+
+def _loads(data: str | bytes) -> Any:
+    """Reads strict JSON, which has no NaN nor infinities"""
+    return json.loads(data, parse_constant=_reject_constant)
+
+
+def _is_number(value: Any) -> bool:
+    """Whether a JSON value is a number, which bools are not"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class RequestError(Exception):
+    """Error of a request, answered with its status and message"""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """Handles the requests of the conversion server"""
+
+    protocol_version = 'HTTP/1.1'  # Keeps the connections open
+    # Headers and bodies are written apart, which would otherwise wait for
+    # the delayed ACK of the client on every response (about 40ms)
+    disable_nagle_algorithm = True
+    server_version = f'totemp/{__version__}'
+    max_body_size = MAX_BODY_SIZE
+    quiet = False
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def _send(
+        self, status: HTTPStatus, body: bytes, content_type: str
+    ) -> None:
+        """Sends a complete response, whose length is always given"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, data: Any) -> None:
+        try:
+            body = json.dumps(data, allow_nan=False)
+        except ValueError:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST,
+                'Results that are NaN or infinite are not valid JSON',
+            ) from None
+        self._send(status, body.encode(), JSON)
+
+    def _parameters(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        """Gets the parameters of a conversion from the query string"""
+        parameters: dict[str, Any] = {}
+        for name in ('source', 'target'):
+            if name not in query:
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST, f'Missing parameter {name!r}'
+                )
+            parameters[name] = query[name][-1]
+        for name in ('float_ret', 'exact'):
+            value = query.get(name, ['true'])[-1].lower()
+            if value not in _BOOLEANS:
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST,
+                    f'{name} must be true or false, not {value!r}',
+                )
+            parameters[name] = _BOOLEANS[value]
+        return parameters
+
+    def _body(self) -> bytes:
+        """Reads the whole body of the request"""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, 'Invalid Content-Length'
+            )
+        if length > self.max_body_size:
+            # Left unread, so the connection can't be used anymore
+            self.close_connection = True
+            raise RequestError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f'Bodies are limited to {self.max_body_size} bytes',
+            )
+        return self.rfile.read(length)
+
+    def _handle(self, method: str) -> None:
+        """Routes a request, answering the errors it raises"""
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        try:
+            # Read first, so the next request of the connection comes next
+            body = self._body() if method == 'POST' else b''
+            if url.path == '/convert' and method == 'GET':
+                self._convert(query)
+            elif url.path == '/convert/batch' and method == 'POST':
+                self._convert_batch(query, body)
+            elif url.path in ('/convert', '/convert/batch'):
+                raise RequestError(
+                    HTTPStatus.METHOD_NOT_ALLOWED,
+                    f'{method} is not allowed on {url.path}',
+                )
+            else:
+                raise RequestError(
+                    HTTPStatus.NOT_FOUND, f'Unknown path {url.path!r}'
+                )
+        except RequestError as error:
+            self._send_json(error.status, {'error': str(error)})
+        except (ValueError, TypeError, OverflowError) as error:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': str(error)})
+
+    def _convert(self, query: dict[str, list[str]]) -> None:
+        """Converts the value of the query string"""
+        parameters = self._parameters(query)
+        if 'value' not in query:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, "Missing parameter 'value'"
+            )
+        value = _loads(query['value'][-1])
+        if not _is_number(value):
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, f'{value!r} is not a number'
+            )
+        result = convert(
+            value,
+            parameters['source'],
+            parameters['target'],
+            float_ret=parameters['float_ret'],
+            exact=parameters['exact'],
+        )
+        self._send_json(HTTPStatus.OK, {'result': result})
+
+    def _convert_batch(self, query: dict[str, list[str]], body: bytes) -> None:
+        """Converts the values of the body, as JSON or packed float64"""
+        parameters = self._parameters(query)
+        source = parameters.pop('source')
+        target = parameters.pop('target')
+        content_type = self.headers.get('Content-Type', JSON)
+        content_type = content_type.split(';')[0].strip().lower()
+
+        if content_type == JSON:
+            values = _loads(body)
+            if not isinstance(values, list):
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST, 'The body must be a JSON array'
+                )
+            for index, value in enumerate(values):
+                if not _is_number(value):
+                    raise RequestError(
+                        HTTPStatus.BAD_REQUEST,
+                        f'{value!r} at index {index} is not a number',
+                    )
+            results = convert_batch(values, source, target, **parameters)
+            self._send_json(HTTPStatus.OK, {'results': list(results)})
+        elif content_type == BINARY:
+            if len(body) % 8:
+                raise RequestError(
+                    HTTPStatus.BAD_REQUEST,
+                    'The body must be packed float64 values',
+                )
+            values = array('d')
+            values.frombytes(body)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            results = convert_batch(values, source, target, **parameters)
+            if sys.byteorder == 'big':
+                results.byteswap()
+            self._send(HTTPStatus.OK, results.tobytes(), BINARY)
+        else:
+            raise RequestError(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                f'Bodies must be {JSON} or {BINARY}, not {content_type}',
+            )
+
+    def do_GET(self) -> None:
+        self._handle('GET')
+
+    def do_POST(self) -> None:
+        self._handle('POST')
+
+
+def make_server(
+    host='127.0.0.1', port=8000, /, *, quiet=False
+) -> ThreadingHTTPServer:
+    """
+    Builds the conversion server, handling every connection in a thread;
+    call its serve_forever method to run it.
+
+    :param host: Optional, address to listen on, only localhost by default
+    :param port: Optional, port to listen on, any free one if 0
+    :param quiet: Optional, False by default, True to log no request
+    :return: http.server.ThreadingHTTPServer
+    """
+    handler = type('ConversionHandler', (ConversionHandler,), {'quiet': quiet})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the command-line arguments"""
+    parser = argparse.ArgumentParser(
+        prog='python -m totemp.server',
+        description='HTTP server converting temperatures.',
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='address to listen on (default: 127.0.0.1)',
+    )
+    parser.add_argument(
+        '-p',
+        '--port',
+        type=int,
+        default=8000,
+        help='port to listen on, any free one if 0 (default: 8000)',
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true', help="don't log the requests"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Runs the conversion server until it's interrupted.
+
+    :param argv: Optional, arguments to parse, sys.argv[1:] if None
+    :return: int, the exit status
+    """
+    args = build_parser().parse_args(argv)
+    with make_server(args.host, args.port, quiet=args.quiet) as server:
+        print(
+            f'Serving on http://{args.host}:{server.server_port}', flush=True
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
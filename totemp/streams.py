@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Callable
+
+from .conversion import converter
+
+try:
+    import numpy as np
+
+    from .arrays import convert_array
+except ImportError:  # NumPy is optional, the batches are then looped over
+    np = None  # type: ignore[assignment]
+
+# Batches of at least this many readings are converted in an executor, so
+# the event loop keeps running while they are
+OFFLOAD_SIZE = 65_536
+
+_END = object()
+
+
+def _batch_converter(
+    source: str, target: str, float_ret: bool, exact: bool
+) -> Callable[[list], list]:
+    """
+    Builds the function converting a list of values at once, with the same
+    results as the methods, into a list.
+
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: True to return floats, False to truncate to ints
+    :param exact: True to match the methods bit-for-bit
+    :return: function
+    """
+    function = converter(source, target, float_ret=float_ret, exact=exact)
+
+    def convert(values: list) -> list:
+        if np is not None:
+            array = np.asarray(values)
+            if array.dtype.kind in 'fiu':  # Not Decimals, bools or objects
+                return convert_array(
+                    array,
+                    function.source,
+                    function.target,
+                    float_ret=float_ret,
+                    exact=exact,
+                ).tolist()
+        return list(map(function, values))
+
+    return convert
+
+
+def convert_iter(
+    values: Iterable[float | int],
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    chunk_size=1024,
+) -> Iterator[float | int]:
+    """
+    Converts any iterable of values (a generator, a file reader, a database
+    cursor...) from the source scale to the target scale lazily, with the
+    same results as the methods.
+
+    The values are read chunk_size at a time and every chunk is converted at
+    once (with NumPy, if it's installed), so only one chunk is ever kept in
+    memory, even for endless iterables.
+
+    :param values: Iterable of the values to be converted
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param chunk_size: Optional, how many values are converted at once
+    :return: iterator of floats (or ints)
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    convert = _batch_converter(source, target, float_ret, exact)
+    iterator = iter(values)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield from convert(chunk)
+
+
+async def _batch(
+    readings: AsyncIterable[float | int],
+    queue: asyncio.Queue,
+    batch_size: int,
+    max_delay: float,
+) -> None:
+    """
+    Groups the readings into batches, put into the queue when batch_size
+    readings are gathered or max_delay seconds after the first one arrived,
+    whichever comes first.
+
+    The readings are awaited directly, with a timer flushing a batch waiting
+    for more readings, so no task is made per reading. Once the queue is
+    full, nothing is read until the batches are taken out of it.
+    """
+    loop = asyncio.get_running_loop()
+    batch: list = []
+    timer: asyncio.TimerHandle | None = None
+
+    def flush() -> None:
+        nonlocal batch, timer
+        if queue.full():  # Keep gathering, it's put when full or later
+            timer = loop.call_later(max_delay, flush)
+        else:
+            queue.put_nowait(batch)
+            batch = []
+            timer = None
+
+    try:
+        async for reading in readings:
+            batch.append(reading)
+            if len(batch) >= batch_size:
+                if timer is not None:
+                    timer.cancel()
+                    timer = None
+                full, batch = batch, []
+                await queue.put(full)
+            elif timer is None:
+                timer = loop.call_later(max_delay, flush)
+        if timer is not None:
+            timer.cancel()
+        if batch:
+            await queue.put(batch)
+        await queue.put(_END)
+    except Exception as error:
+        if timer is not None:
+            timer.cancel()
+        await queue.put(error)
+
+
+async def convert_batches(
+    readings: AsyncIterable[float | int],
+    source: str,
+    target: str,
+    /,
+    *,
+    float_ret=True,
+    exact=True,
+    batch_size=1024,
+    max_delay=0.01,
+    max_pending=4,
+    offload_size=OFFLOAD_SIZE,
+    executor: Executor | None = None,
+) -> AsyncGenerator[list, None]:
+    """
+    Converts an async stream of readings from the source scale to the target
+    scale in micro-batches, yielding the list of the results of each one.
+
+    The readings are gathered into batches of up to batch_size readings,
+    or fewer when the next one takes longer than max_delay seconds, and
+    each batch is converted at once (with NumPy, if it's installed), with
+    the same results as the methods. At most max_pending batches wait to be
+    converted, and then the readings aren't awaited until they are, so a
+    slow consumer slows the stream down instead of filling the memory.
+
+    Batches of offload_size readings or more are converted in the executor
+    (the loop's default one if None), keeping the event loop free meanwhile.
+
+    :param readings: Async iterable of the values to be converted
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :param float_ret: Optional, True by default to return floats
+    :param exact: Optional, True by default to match the methods bit-for-bit
+    :param batch_size: Optional, most readings converted at once
+    :param max_delay: Optional, most seconds a reading waits for its batch
+    :param max_pending: Optional, most batches waiting to be converted
+    :param offload_size: Optional, fewest readings converted in the executor
+    :param executor: Optional, executor for the largest batches
+    :return: async iterator of lists of floats (or ints)
+    """
+    convert = _batch_converter(source, target, float_ret, exact)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(max_pending)
+    batcher = asyncio.ensure_future(
+        _batch(readings, queue, batch_size, max_delay)
+    )
+    try:
+        while (batch := await queue.get()) is not _END:
+            if isinstance(batch, Exception):
+                raise batch
+            if len(batch) >= offload_size:
+                yield await loop.run_in_executor(executor, convert, batch)
+            else:
+                yield convert(batch)
+    finally:
+        batcher.cancel()
+
+
+async def convert_async(
+    readings: AsyncIterable[float | int],
+    source: str,
+    target: str,
+    /,
+    **options,
+) -> AsyncGenerator[float | int, None]:
+    """
+    Converts an async stream of readings from the source scale to the target
+    scale, yielding the results one by one, in micro-batches as done by
+    convert_batches, which takes the same options.
+
+    :param readings: Async iterable of the values to be converted
+    :param source: Name or abbreviation of the scale of the values
+    :param target: Name or abbreviation of the scale to convert to
+    :return: async iterator of floats (or ints)
+    """
+    async for batch in convert_batches(readings, source, target, **options):
+        for result in batch:
+            yield result
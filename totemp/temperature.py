@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from .conversion import CONVERTERS
+from .scales import ALIASES, KELVIN_AFFINE, SCALES, resolve_scale
+
+# kelvin = (numerator * first + denominator * second) / (denominator * third)
+# for a value of numerator / denominator, i.e. the exact affine map of every
+# scale as ints, so the Kelvin values are rounded only once
+_TO_KELVIN = {
+    scale: (
+        factor_numerator * offset_denominator,
+        offset_numerator * factor_denominator,
+        factor_denominator * offset_denominator,
+    )
+    for scale, (
+        (factor_numerator, factor_denominator),
+        (offset_numerator, offset_denominator),
+    ) in KELVIN_AFFINE.items()
+}
+
+
+def _exact_kelvin(value: float | int, scale: str) -> float:
+    """
+    Converts a value to Kelvin exactly, rounding only the result, so equal
+    temperatures in different scales get the very same float.
+
+    :param value: Value to be converted
+    :param scale: Canonical name of the scale of the value
+    :return: float
+    """
+    first, second, third = _TO_KELVIN[scale]
+    try:
+        numerator, denominator = value.as_integer_ratio()
+    except (OverflowError, ValueError):  # infinities and NaN
+        return float(value * first / third + second / third)
+    except AttributeError:  # NumPy ints, which are integral all the same
+        from operator import index
+
+        numerator, denominator = index(value), 1  # type: ignore[arg-type]
+    return (numerator * first + denominator * second) / (denominator * third)
+
+
+def _view(target: str) -> property:
+    """Builds the property converting a temperature to the target scale"""
+    slot = f'_{target}_view'
+
+    def getter(self: 'Temperature') -> float:
+        result = getattr(self, slot, None)
+        if result is None:  # Not read yet
+            result = CONVERTERS[self._scale, target](self._value)
+            setattr(self, slot, result)
+        return result
+
+    return property(
+        getter, doc=f'The temperature in {target.capitalize()}, as a float'
+    )
+
+
+class Temperature:
+    """
+    A temperature value, kept in the scale it was given in.
+
+    Its views in the other scales (e.g. .fahrenheit) are computed by the
+    methods of the classes only when first read, then kept in a slot of
+    their own, so they take no room until then.
+
+    Temperatures are compared and hashed by their exact Kelvin value,
+    rounded once when they are created, so Temperature(100, 'C') and
+    Temperature(212, 'F') are equal and the same key in dicts and sets.
+    """
+
+    __slots__ = ('_value', '_scale', '_kelvin') + tuple(
+        f'_{scale}_view' for scale in SCALES
+    )
+
+    def __init__(self, value: float | int, scale: str = 'celsius') -> None:
+        """
+        :param value: Value of the temperature
+        :param scale: Optional, name or abbreviation of its scale, Celsius
+            by default
+        """
+        try:
+            scale = ALIASES[scale]
+        except KeyError:
+            scale = resolve_scale(scale)
+        self._value = value
+        self._scale = scale
+        self._kelvin = _exact_kelvin(value, scale)
+
+    @property
+    def value(self) -> float | int:
+        """The value of the temperature, in its own scale"""
+        return self._value
+
+    @property
+    def scale(self) -> str:
+        """The name of the scale of the temperature, e.g. 'celsius'"""
+        return self._scale
+
+    celsius = _view('celsius')
+    delisle = _view('delisle')
+    fahrenheit = _view('fahrenheit')
+    kelvin = _view('kelvin')
+    newton = _view('newton')
+    rankine = _view('rankine')
+    reaumur = _view('reaumur')
+    romer = _view('romer')
+
+    def to(self, scale: str) -> 'Temperature':
+        """
+        Converts the temperature into another scale, keeping its exact
+        Kelvin value, so the result is always equal to the temperature.
+
+        :param scale: Name or abbreviation of the scale to convert to
+        :return: Temperature
+        """
+        scale = resolve_scale(scale)
+        # Not through __init__, which would round the view back to Kelvin
+        temperature = Temperature.__new__(Temperature)
+        temperature._value = getattr(self, scale)
+        temperature._scale = scale
+        temperature._kelvin = self._kelvin
+        return temperature
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._value!r}, {self._scale!r})'
+
+    def __hash__(self) -> int:
+        return hash(self._kelvin)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Temperature):
+            return self._kelvin == other._kelvin
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, Temperature):
+            return self._kelvin < other._kelvin
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, Temperature):
+            return self._kelvin <= other._kelvin
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, Temperature):
+            return self._kelvin > other._kelvin
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, Temperature):
+            return self._kelvin >= other._kelvin
+        return NotImplemented
+
+    def __getstate__(self) -> tuple[float | int, str, float]:
+        # The Kelvin value is kept as it is, not computed again from the
+        # value, which may have been rounded into its scale by .to()
+        return self._value, self._scale, self._kelvin
+
+    def __setstate__(self, state: tuple[float | int, str, float]) -> None:
+        self._value, self._scale, self._kelvin = state
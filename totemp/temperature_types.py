@@ -470,3 +470,473 @@ class Kelvin:
         if float_ret:
             return float((kelvin - 273.15) * (21 / 40) + 7.5)
         return trunc((kelvin - 273.15) * (21 / 40) + 7.5)
+
+
+class Newton:
+    """Provides conversion of Newton to other temperature scales"""
+
+    @staticmethod
+    def to_celsius(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Celsius, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 100 / 33)
+        return trunc(newton * 100 / 33)
+
+    @staticmethod
+    def to_delisle(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Delisle, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((33 - newton) * 50 / 11)
+        return trunc((33 - newton) * 50 / 11)
+
+    @staticmethod
+    def to_fahrenheit(
+        newton: float | int, /, *, float_ret=True
+    ) -> float | int:
+        """
+        Converts Newton to Fahrenheit, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 60 / 11 + 32)
+        return trunc(newton * 60 / 11 + 32)
+
+    @staticmethod
+    def to_kelvin(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Kelvin, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 100 / 33 + 273.15)
+        return trunc(newton * 100 / 33 + 273.15)
+
+    @staticmethod
+    def to_rankine(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Rankine, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 60 / 11 + 491.67)
+        return trunc(newton * 60 / 11 + 491.67)
+
+    @staticmethod
+    def to_reaumur(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Réaumur, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 80 / 33)
+        return trunc(newton * 80 / 33)
+
+    @staticmethod
+    def to_romer(newton: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Newton to Rømer, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param newton: Newton value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(newton * 35 / 22 + 7.5)
+        return trunc(newton * 35 / 22 + 7.5)
+
+
+class Rankine:
+    """Provides conversion of Rankine to other temperature scales"""
+
+    @staticmethod
+    def to_celsius(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Celsius, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((rankine - 491.67) * 5 / 9)
+        return trunc((rankine - 491.67) * 5 / 9)
+
+    @staticmethod
+    def to_delisle(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Delisle, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((671.67 - rankine) * 5 / 6)
+        return trunc((671.67 - rankine) * 5 / 6)
+
+    @staticmethod
+    def to_fahrenheit(
+        rankine: float | int, /, *, float_ret=True
+    ) -> float | int:
+        """
+        Converts Rankine to Fahrenheit, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(rankine - 459.67)
+        return trunc(rankine - 459.67)
+
+    @staticmethod
+    def to_kelvin(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Kelvin, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(rankine * 5 / 9)
+        return trunc(rankine * 5 / 9)
+
+    @staticmethod
+    def to_newton(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Newton, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((rankine - 491.67) * 11 / 60)
+        return trunc((rankine - 491.67) * 11 / 60)
+
+    @staticmethod
+    def to_reaumur(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Réaumur, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((rankine - 491.67) * 4 / 9)
+        return trunc((rankine - 491.67) * 4 / 9)
+
+    @staticmethod
+    def to_romer(rankine: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rankine to Rømer, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param rankine: Rankine value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((rankine - 491.67) * 7 / 24 + 7.5)
+        return trunc((rankine - 491.67) * 7 / 24 + 7.5)
+
+
+class Reaumur:
+    """Provides conversion of Réaumur to other temperature scales"""
+
+    @staticmethod
+    def to_celsius(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Celsius, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 5 / 4)
+        return trunc(reaumur * 5 / 4)
+
+    @staticmethod
+    def to_delisle(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Delisle, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((80 - reaumur) * 15 / 8)
+        return trunc((80 - reaumur) * 15 / 8)
+
+    @staticmethod
+    def to_fahrenheit(
+        reaumur: float | int, /, *, float_ret=True
+    ) -> float | int:
+        """
+        Converts Réaumur to Fahrenheit, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 9 / 4 + 32)
+        return trunc(reaumur * 9 / 4 + 32)
+
+    @staticmethod
+    def to_kelvin(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Kelvin, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 5 / 4 + 273.15)
+        return trunc(reaumur * 5 / 4 + 273.15)
+
+    @staticmethod
+    def to_newton(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Newton, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 33 / 80)
+        return trunc(reaumur * 33 / 80)
+
+    @staticmethod
+    def to_rankine(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Rankine, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 9 / 4 + 491.67)
+        return trunc(reaumur * 9 / 4 + 491.67)
+
+    @staticmethod
+    def to_romer(reaumur: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Réaumur to Rømer, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param reaumur: Réaumur value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float(reaumur * 21 / 32 + 7.5)
+        return trunc(reaumur * 21 / 32 + 7.5)
+
+
+class Romer:
+    """Provides conversion of Rømer to other temperature scales"""
+
+    @staticmethod
+    def to_celsius(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Celsius, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 40 / 21)
+        return trunc((romer - 7.5) * 40 / 21)
+
+    @staticmethod
+    def to_delisle(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Delisle, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((60 - romer) * 20 / 7)
+        return trunc((60 - romer) * 20 / 7)
+
+    @staticmethod
+    def to_fahrenheit(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Fahrenheit, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 24 / 7 + 32)
+        return trunc((romer - 7.5) * 24 / 7 + 32)
+
+    @staticmethod
+    def to_kelvin(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Kelvin, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 40 / 21 + 273.15)
+        return trunc((romer - 7.5) * 40 / 21 + 273.15)
+
+    @staticmethod
+    def to_newton(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Newton, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 22 / 35)
+        return trunc((romer - 7.5) * 22 / 35)
+
+    @staticmethod
+    def to_rankine(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Rankine, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 24 / 7 + 491.67)
+        return trunc((romer - 7.5) * 24 / 7 + 491.67)
+
+    @staticmethod
+    def to_reaumur(romer: float | int, /, *, float_ret=True) -> float | int:
+        """
+        Converts Rømer to Réaumur, returning a float by default.
+
+        If the float_ret parameter is False, it returns an approximate int value
+        (using the math's module trunc function).
+
+        :param romer: Rømer value to be converted
+        :param float_ret: Optional, True by default to return floats
+        :return: float or int
+        """
+        if float_ret:
+            return float((romer - 7.5) * 32 / 21)
+        return trunc((romer - 7.5) * 32 / 21)